@@ -0,0 +1,252 @@
+"""
+Tic-Tac-Toe AI Opponent
+Negamax search with alpha-beta pruning and a symmetry-reduced transposition table
+"""
+
+import threading
+import time
+from functools import lru_cache
+
+from game_logic import _cell_line_masks
+from pattern_index import PatternIndex
+from symmetry import CELL_CODES, canonical_bytes
+
+WIN_SCORE = 1_000_000
+INFINITY = WIN_SCORE * 2
+
+# Transposition table bound flags
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+@lru_cache(maxsize=None)
+def _neighbour_masks(size):
+    """For each cell, the bitmask of the cells around it"""
+    masks = []
+    for pos in range(size * size):
+        row, col = divmod(pos, size)
+        masks.append(sum(
+            1 << (r * size + c)
+            for r in range(max(0, row - 1), min(size, row + 2))
+            for c in range(max(0, col - 1), min(size, col + 2))
+        ))
+    return tuple(masks)
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out or it is stopped"""
+
+
+class NegamaxAI:
+    """Computer opponent that searches the game tree with negamax
+
+    Positions are stored in a transposition table keyed on the board reduced
+    by the eight symmetries of the square, so a 3x3 game collapses to a few
+    hundred canonical positions. The table is kept between moves and games
+    of the same board size and win length, and cleared when either changes.
+    On larger boards, ``max_depth`` and ``time_limit`` (seconds) bound the
+    search; iterative deepening returns the best move of the deepest
+    completed iteration. An optional OpeningBook answers 3x3 positions
+    without searching at all. A search ends early once its ``cancel``
+    event is set, by the caller or through ``stop``.
+    """
+
+    def __init__(self, max_depth=None, time_limit=None, book=None):
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.book = book
+        self.table = {}
+        # (size, win_length) of the game the table's scores belong to
+        self.table_dims = None
+        self.nodes = 0
+        self._deadline = None
+        # Cancel event of the latest search, set by stop
+        self._cancel = None
+
+    def choose_move(self, game_logic, cancel=None):
+        """Choose a move for the current player of the given game
+
+        cancel is an event the caller can set to end the search early, even
+        before it has started; by default each search gets a fresh one.
+        """
+        self._cancel = cancel if cancel is not None else threading.Event()
+        if self.book is not None and game_logic.size == game_logic.win_length == 3:
+            entry = self.book.lookup(game_logic.get_board())
+            if entry is not None and entry[0] is not None:
+                return entry[0]
+
+        self._setup(game_logic)
+        empties = self._empty_count
+        if empties == 0:
+            raise ValueError("No moves left on the board")
+
+        max_depth = empties if self.max_depth is None else min(self.max_depth, empties)
+        self._deadline = (
+            time.perf_counter() + self.time_limit if self.time_limit else None
+        )
+        self.nodes = 0
+
+        best_move = self._candidate_moves(self._mover)[0]
+        for depth in range(1, max_depth + 1):
+            try:
+                best_move = self._search_root(depth)
+            except SearchTimeout:
+                break
+        return best_move
+
+    def stop(self):
+        """Make a running search return the best move found so far"""
+        if self._cancel is not None:
+            self._cancel.set()
+
+    def _setup(self, game_logic):
+        """Load the search state from a game"""
+        self.size = game_logic.size
+        self.win_length = game_logic.win_length
+        # Keys are boards only, so scores from another win length would be wrong here
+        if self.table_dims != (self.size, self.win_length):
+            self.table.clear()
+            self.table_dims = (self.size, self.win_length)
+        self.cell_masks = _cell_line_masks(self.size, self.win_length)
+
+        board = game_logic.get_board()
+        self.cells = bytearray(CELL_CODES[value] for value in board)
+        mover = CELL_CODES[game_logic.get_current_player()]
+        self.masks = [0, 0, 0]
+        for pos, value in enumerate(self.cells):
+            if value:
+                self.masks[value] |= 1 << pos
+        self._mover = mover
+        self._empty_count = self.cells.count(0)
+        self.index = PatternIndex(self.size, self.win_length)
+        self.index.load(self.cells)
+
+        # Prefer central cells first, which prunes far more on every board size
+        center = (self.size - 1) / 2
+        self._move_order = sorted(
+            range(self.size * self.size),
+            key=lambda pos: abs(pos // self.size - center) + abs(pos % self.size - center),
+        )
+
+    def _candidate_moves(self, player):
+        """Empty cells worth searching for player, most promising first
+
+        An immediate win is the only move worth searching. Otherwise, if
+        the opponent threatens to win, only the cells that block it are.
+        """
+        wins = self.index.winning_moves(player)
+        if wins:
+            return [min(wins)]
+        blocks = self.index.blocking_moves(player)
+        if blocks:
+            return sorted(blocks)
+
+        cells = self.cells
+        if self.size <= 4 or self._empty_count == len(cells):
+            return [pos for pos in self._move_order if not cells[pos]]
+
+        # On large boards only consider cells next to an existing stone
+        occupied = self.masks[1] | self.masks[2]
+        neighbours = _neighbour_masks(self.size)
+        moves = [
+            pos for pos in self._move_order if not cells[pos] and occupied & neighbours[pos]
+        ]
+        return moves or [pos for pos in self._move_order if not cells[pos]]
+
+    def _is_win(self, player, position):
+        """Check whether player's stone at position completes a line"""
+        mask = self.masks[player]
+        for _, line_mask in self.cell_masks[position]:
+            if mask & line_mask == line_mask:
+                return True
+        return False
+
+    def _place(self, player, position):
+        self.cells[position] = player
+        self.masks[player] |= 1 << position
+        self._empty_count -= 1
+        self.index.play(position, player)
+
+    def _remove(self, player, position):
+        self.cells[position] = 0
+        self.masks[player] &= ~(1 << position)
+        self._empty_count += 1
+        self.index.undo()
+
+    def _evaluate(self, player):
+        """Static score of the position for player, kept up to date by the pattern index"""
+        # Keep heuristic scores below any proven win
+        return max(-WIN_SCORE // 2, min(WIN_SCORE // 2, self.index.evaluate(player)))
+
+    def _search_root(self, depth):
+        """Search every root move to the given depth and return the best"""
+        player = self._mover
+        best_move = None
+        best_score = -INFINITY
+        alpha = -INFINITY
+        for pos in self._candidate_moves(player):
+            score = self._score_move(player, pos, depth, alpha, INFINITY)
+            if score > best_score:
+                best_score = score
+                best_move = pos
+            alpha = max(alpha, score)
+        return best_move
+
+    def _score_move(self, player, position, depth, alpha, beta):
+        """Score of playing position for player, searched depth plies deep"""
+        self._place(player, position)
+        try:
+            if self._is_win(player, position):
+                # Faster wins score higher; the stone count is part of the key
+                return WIN_SCORE - (len(self.cells) - self._empty_count)
+            if self._empty_count == 0:
+                return 0
+            return -self._negamax(3 - player, depth - 1, -beta, -alpha)
+        finally:
+            self._remove(player, position)
+
+    def _negamax(self, player, depth, alpha, beta):
+        """Value of the position for player to move"""
+        self.nodes += 1
+        if not self.nodes & 63:
+            if self._cancel.is_set() or (
+                self._deadline is not None and time.perf_counter() > self._deadline
+            ):
+                raise SearchTimeout()
+
+        # Searching past the last empty cell is exact, so cap the stored depth
+        depth = min(depth, self._empty_count)
+        key = canonical_bytes(self.cells, self.size)
+        entry = self.table.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, flag, value = entry
+            if flag == EXACT:
+                return value
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        if depth == 0:
+            return self._evaluate(player)
+
+        original_alpha = alpha
+        best = -INFINITY
+        for pos in self._candidate_moves(player):
+            score = self._score_move(player, pos, depth, alpha, beta)
+            if score > best:
+                best = score
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+
+        if best <= original_alpha:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (depth, flag, best)
+        return best
@@ -0,0 +1,114 @@
+"""
+Tic-Tac-Toe Archive Analytics
+Streams a game log and aggregates results without loading it into memory
+"""
+
+import argparse
+import mmap
+from collections import Counter
+
+from game_log import iter_records, read_header
+from game_logic import BACKENDS, create_game_logic
+
+
+def iter_results(path, backend="bitboard"):
+    """Yield (opening move, length, winner, winning combo) for each game
+
+    The log is memory-mapped and records are replayed one at a time through
+    a single reused game, so memory use does not grow with the archive.
+    """
+    with open(path, "rb") as log_file:
+        mapped = mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+    records = None
+    record = None
+    try:
+        size, win_length = read_header(mapped)
+        game_logic = create_game_logic(backend, size, win_length)
+        records = iter_records(mapped)
+        for record in records:
+            game_logic.replay(record)
+            history = game_logic.history
+            yield (
+                history[0] if history else None,
+                len(history),
+                game_logic.get_winner(),
+                game_logic.get_winning_combo(),
+            )
+    finally:
+        # Drop every view of the map before closing it
+        record = None
+        if records is not None:
+            records.close()
+        mapped.close()
+
+
+class ArchiveStats:
+    """Streaming aggregates over finished games"""
+
+    def __init__(self):
+        self.games = 0
+        self.total_moves = 0
+        self.results = Counter()
+        self.by_opening = {}
+        self.winning_lines = Counter()
+
+    def add(self, opening, length, winner, combo):
+        """Add one game to the aggregates"""
+        self.games += 1
+        self.total_moves += length
+        self.results[winner] += 1
+        opening_results = self.by_opening.get(opening)
+        if opening_results is None:
+            opening_results = self.by_opening[opening] = Counter()
+        opening_results[winner] += 1
+        if combo:
+            self.winning_lines[tuple(combo)] += 1
+
+    @property
+    def average_length(self):
+        """Average number of moves per game"""
+        return self.total_moves / self.games if self.games else 0.0
+
+    def opening_win_rates(self):
+        """Map each opening move to its (X win, O win, draw) rates"""
+        rates = {}
+        for opening, results in sorted(self.by_opening.items(), key=lambda item: str(item[0])):
+            games = sum(results.values())
+            rates[opening] = (
+                results["X"] / games,
+                results["O"] / games,
+                results[None] / games,
+            )
+        return rates
+
+
+def analyze(path, backend="bitboard"):
+    """Stream an archive and return its ArchiveStats"""
+    stats = ArchiveStats()
+    for result in iter_results(path, backend):
+        stats.add(*result)
+    return stats
+
+
+def main(argv=None):
+    """Print archive statistics from the command line"""
+    parser = argparse.ArgumentParser(description="Analyse a game log archive")
+    parser.add_argument("path")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="bitboard")
+    parser.add_argument("--top", type=int, default=5, help="winning lines to list")
+    args = parser.parse_args(argv)
+
+    stats = analyze(args.path, args.backend)
+    print(f"Games: {stats.games}")
+    print(f"Average length: {stats.average_length:.2f} moves")
+    print(f"X wins: {stats.results['X']}  O wins: {stats.results['O']}  Draws: {stats.results[None]}")
+    print("Win rates by opening move (X / O / draw):")
+    for opening, (x_rate, o_rate, draw_rate) in stats.opening_win_rates().items():
+        print(f"  {opening!s:>4}: {x_rate:6.1%} {o_rate:6.1%} {draw_rate:6.1%}")
+    print("Most common winning lines:")
+    for combo, count in stats.winning_lines.most_common(args.top):
+        print(f"  {list(combo)}: {count}")
+
+
+if __name__ == "__main__":
+    main()
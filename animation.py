@@ -0,0 +1,136 @@
+"""
+Tic-Tac-Toe Animation
+One frame tick drives every running animation in the window
+"""
+
+import math
+import time
+
+
+def ease_in_out(t):
+    """Smoothstep: slow start and end"""
+    return t * t * (3 - 2 * t)
+
+
+def pulse(t):
+    """Rise from 0 to 1 and back to 0 over one cycle"""
+    return 0.5 - 0.5 * math.cos(2 * math.pi * t)
+
+
+def color_ramp(start, end, steps):
+    """Precompute the "#rrggbb" colors from start to end in steps"""
+    a = [int(start[i:i + 2], 16) for i in (1, 3, 5)]
+    b = [int(end[i:i + 2], 16) for i in (1, 3, 5)]
+    ramp = []
+    for step in range(steps):
+        t = step / (steps - 1)
+        ramp.append("#%02x%02x%02x" % tuple(round(x + (y - x) * t) for x, y in zip(a, b)))
+    return tuple(ramp)
+
+
+class Animation:
+    """An eased transition reported as a step index in [0, steps)
+
+    ``on_step(step)`` is called only when the step changes, so a short
+    precomputed table (such as a color_ramp) can be indexed without any
+    work on frames where nothing visible changes.
+    """
+    __slots__ = ("duration", "steps", "on_step", "easing", "cycles", "on_done", "started", "step")
+
+    def __init__(self, duration, steps, on_step, easing=ease_in_out, cycles=1, on_done=None):
+        self.duration = duration
+        self.steps = steps
+        self.on_step = on_step
+        self.easing = easing
+        self.cycles = cycles
+        self.on_done = on_done
+        self.started = None
+        self.step = None
+
+    def advance(self, now):
+        """Move to the frame at time now; return False once finished"""
+        elapsed = now - self.started
+        finished = elapsed >= self.duration * self.cycles
+        phase = 1.0 if finished else elapsed / self.duration % 1.0
+        step = int(self.easing(phase) * (self.steps - 1) + 0.5)
+        if step != self.step:
+            self.step = step
+            self.on_step(step)
+        if finished and self.on_done is not None:
+            self.on_done()
+        return not finished
+
+
+class AnimationScheduler:
+    """Runs animations from a single window.after tick, capped at fps
+
+    The tick is only scheduled while an animation is running. Frame stats
+    record the interval between ticks, which exceeds the frame budget when
+    the main loop was busy.
+    """
+
+    def __init__(self, window, fps=60):
+        self.window = window
+        self.frame_ms = max(1, round(1000 / fps))
+        self.animations = []
+        self.after_id = None
+        self.last_tick = None
+        self.frames = 0
+        self.late_frames = 0
+        self.max_interval_ms = 0.0
+        self.total_interval_ms = 0.0
+
+    def start(self, animation):
+        """Begin an animation on the next frame"""
+        animation.started = time.perf_counter()
+        animation.step = None
+        self.animations.append(animation)
+        if self.after_id is None:
+            self.last_tick = animation.started
+            self.after_id = self.window.after(self.frame_ms, self.tick)
+
+    def cancel(self, animation):
+        """Stop an animation where it is"""
+        if animation in self.animations:
+            self.animations.remove(animation)
+
+    def cancel_all(self):
+        """Stop every animation and the frame tick"""
+        self.animations.clear()
+        if self.after_id is not None:
+            self.window.after_cancel(self.after_id)
+            self.after_id = None
+
+    def tick(self):
+        """Advance every animation by one frame"""
+        now = time.perf_counter()
+        interval_ms = (now - self.last_tick) * 1000
+        self.last_tick = now
+        self.frames += 1
+        self.total_interval_ms += interval_ms
+        if interval_ms > self.max_interval_ms:
+            self.max_interval_ms = interval_ms
+        if interval_ms > 1.5 * self.frame_ms:
+            self.late_frames += 1
+
+        animations = self.animations
+        index = 0
+        while index < len(animations):
+            if animations[index].advance(now):
+                index += 1
+            else:
+                del animations[index]
+        if animations:
+            self.after_id = self.window.after(self.frame_ms, self.tick)
+        else:
+            self.after_id = None
+
+    def report(self):
+        """Summarise animation frame intervals"""
+        if not self.frames:
+            return "animation frames: none"
+        return (
+            f"animation frames: {self.frames}  target {self.frame_ms} ms  "
+            f"mean {self.total_interval_ms / self.frames:.1f} ms  "
+            f"max {self.max_interval_ms:.1f} ms  late: {self.late_frames}"
+        )
@@ -0,0 +1,156 @@
+"""
+Tic-Tac-Toe Batch Engine
+Advances thousands of games at once with NumPy
+
+Requires NumPy, which the rest of the game does not need.
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from game_logic import SYMBOLS, _line_windows, _validate_dimensions
+from symmetry import CELL_CODES
+
+X_CODE = CELL_CODES["X"]
+
+
+class BatchGameLogic:
+    """B games of the same size held in lockstep as a (B, N*N) int8 array
+
+    Cells hold CELL_CODES values. ``make_moves`` applies one move per game and
+    checks every game for a win with a single product against the
+    (cells, lines) matrix of winning-line masks. Winners and winning combos
+    match GameLogic.check_winner for the same move sequence.
+    """
+
+    def __init__(self, batch_size, size=3, win_length=None):
+        self.win_length = _validate_dimensions(size, win_length)
+        self.size = size
+        self.batch_size = batch_size
+        self.cell_count = size * size
+
+        windows = _line_windows(size, self.win_length)
+        self.line_directions = np.array([direction for direction, _ in windows], dtype=np.int8)
+        self.line_matrix = np.zeros((self.cell_count, len(windows)), dtype=np.int16)
+        for line, (_, combo) in enumerate(windows):
+            self.line_matrix[combo, line] = 1
+
+        self.board = np.zeros((batch_size, self.cell_count), dtype=np.int8)
+        self.current_player = np.empty(batch_size, dtype=np.int8)
+        self.game_over = np.empty(batch_size, dtype=bool)
+        self.winner = np.empty(batch_size, dtype=np.int8)
+        self.last_move = np.empty(batch_size, dtype=np.int32)
+        self.move_count = np.empty(batch_size, dtype=np.int32)
+        self.reset_game()
+
+    def reset_game(self, games=None):
+        """Reset all games, or only those selected by an index or mask"""
+        selection = slice(None) if games is None else games
+        self.board[selection] = 0
+        self.current_player[selection] = X_CODE
+        self.game_over[selection] = False
+        self.winner[selection] = 0
+        self.last_move[selection] = -1
+        self.move_count[selection] = 0
+
+    def legal_moves(self):
+        """Boolean (B, cells) array of free cells in unfinished games"""
+        return (self.board == 0) & ~self.game_over[:, None]
+
+    def random_moves(self, rng):
+        """Pick a random legal move per game, or -1 for finished games
+
+        ``rng`` is a numpy Generator.
+        """
+        scores = rng.random(self.board.shape)
+        scores[~self.legal_moves()] = -1.0
+        moves = scores.argmax(axis=1)
+        moves[self.game_over] = -1
+        return moves
+
+    def make_moves(self, positions):
+        """Apply one move per game; -1 skips a game
+
+        Returns a boolean array of the moves that were accepted. Moves into
+        occupied cells or finished games are rejected, as in GameLogic.
+        """
+        positions = np.asarray(positions)
+        rows = np.flatnonzero(positions >= 0)
+        cols = positions[rows]
+        valid = ~self.game_over[rows] & (self.board[rows, cols] == 0)
+        rows = rows[valid]
+        cols = cols[valid]
+
+        accepted = np.zeros(self.batch_size, dtype=bool)
+        accepted[rows] = True
+        if not rows.size:
+            return accepted
+
+        players = self.current_player[rows]
+        self.board[rows, cols] = players
+        self.last_move[rows] = cols
+        self.move_count[rows] += 1
+
+        # Count each mover's stones on every line in one product
+        owned = (self.board[rows] == players[:, None]).astype(np.int16)
+        won = ((owned @ self.line_matrix) == self.win_length).any(axis=1)
+        tied = ~won & (self.move_count[rows] == self.cell_count)
+
+        self.winner[rows[won]] = players[won]
+        self.game_over[rows[won | tied]] = True
+        continuing = rows[~(won | tied)]
+        self.current_player[continuing] = 3 - self.current_player[continuing]
+        return accepted
+
+    def get_board(self, game):
+        """Board of one game as a list of strings, matching GameLogic"""
+        return [SYMBOLS[value] for value in self.board[game]]
+
+    def get_winner(self, game):
+        """Winner of one game ("X", "O" or None)"""
+        return SYMBOLS[self.winner[game]] or None
+
+    def get_winning_combo(self, game):
+        """Winning combination of one game, matching GameLogic.check_winner
+
+        That is the run through the last move in the first winning direction,
+        at most win_length - 1 cells each way.
+        """
+        if not self.winner[game]:
+            return None
+        last_move = self.last_move[game]
+        owned = (self.board[game] == self.winner[game]).astype(np.int16)
+        complete = (owned @ self.line_matrix) == self.win_length
+        through_move = complete & (self.line_matrix[last_move] == 1)
+        direction = self.line_directions[through_move].min()
+        lines = through_move & (self.line_directions == direction)
+        return np.flatnonzero(self.line_matrix[:, lines].any(axis=1)).tolist()
+
+    def winners(self):
+        """Array of winner codes for all games (0 for none)"""
+        return self.winner.copy()
+
+
+def main(argv=None):
+    """Report batch throughput on random games"""
+    parser = argparse.ArgumentParser(description="NumPy batch game engine")
+    parser.add_argument("--batch", type=int, default=10000)
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=random.randrange(1 << 30))
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    batch = BatchGameLogic(args.batch, args.size, args.win_length)
+    start = time.perf_counter()
+    while not batch.game_over.all():
+        batch.make_moves(batch.random_moves(rng))
+    elapsed = time.perf_counter() - start
+    print(f"{args.batch / elapsed:,.0f} random games/second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Memory benchmark for live games
+Reports bytes per live game and per get_board() call, before and after the
+compact __slots__ state
+
+"Before" is the baseline GameLogic, copied unchanged: a __dict__ instance
+with a list board and no move history. It only plays 3x3, so it is left
+out for other sizes. "After" are the current backends.
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic import BitboardGameLogic, GameLogic  # noqa: E402
+
+OPENING = (4, 0, 8, 2)
+
+
+class BaselineGameLogic:
+    """The GameLogic of the baseline commit (a7431e2), copied unchanged
+
+    It only plays 3x3 games.
+    """
+
+    def __init__(self):
+        self.reset_game()
+
+    def reset_game(self):
+        """Reset the game to initial state"""
+        self.board = [""] * 9
+        self.current_player = "X"
+        self.game_over = False
+        self.winner = None
+        self.winning_combo = None
+
+    def make_move(self, position):
+        """Make a move at the given position"""
+        if self.game_over or self.board[position] != "":
+            return False
+
+        # Make the move
+        self.board[position] = self.current_player
+
+        # Check for win
+        if self.check_winner():
+            self.game_over = True
+            self.winner = self.current_player
+            return True
+
+        # Check for tie
+        if self.check_tie():
+            self.game_over = True
+            return True
+
+        # Switch players
+        self.current_player = "O" if self.current_player == "X" else "X"
+        return True
+
+    def check_winner(self):
+        """Check if current player has won"""
+        winning_combinations = [
+            [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
+            [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
+            [0, 4, 8], [2, 4, 6]              # Diagonals
+        ]
+
+        for combo in winning_combinations:
+            if (self.board[combo[0]] == self.board[combo[1]] ==
+                    self.board[combo[2]] == self.current_player):
+                self.winning_combo = combo
+                return True
+        return False
+
+    def check_tie(self):
+        """Check if the game is a tie"""
+        return all(cell != "" for cell in self.board)
+
+    def get_board(self):
+        """Get current board state"""
+        return self.board.copy()
+
+
+def bytes_per_game(factory, count):
+    """Average traced bytes held by one live game after a short opening"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    games = []
+    for _ in range(count):
+        game = factory()
+        for position in OPENING:
+            game.make_move(position)
+        games.append(game)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Leave out the list holding the games
+    return (total - sys.getsizeof(games)) / count
+
+
+def bytes_per_get_board(factory, calls):
+    """Traced bytes allocated by keeping the results of get_board() calls"""
+    game = factory()
+    for position in OPENING:
+        game.make_move(position)
+    results = [None] * calls
+    tracemalloc.start()
+    for index in range(calls):
+        results[index] = game.get_board()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / calls
+
+
+def main(argv=None):
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Memory per live game")
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    layouts = [
+        ("after (slots, bytearray)", lambda: GameLogic(args.size)),
+        ("after (slots, bitboard)", lambda: BitboardGameLogic(args.size)),
+    ]
+    if args.size == 3:
+        layouts.insert(0, ("before (baseline)", BaselineGameLogic))
+    print(f"{'layout':<28}{'bytes/game':>12}{'bytes/get_board':>18}")
+    for name, factory in layouts:
+        per_game = bytes_per_game(factory, args.games)
+        per_call = bytes_per_get_board(factory, 10000)
+        print(f"{name:<28}{per_game:>12.0f}{per_call:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
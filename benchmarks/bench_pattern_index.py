@@ -0,0 +1,119 @@
+"""
+Pattern index benchmark
+Searches the same positions with NegamaxAI evaluating from the incremental
+pattern index and from a full rescan of every window per node, and reports
+nodes per second for each
+
+Both searches visit the same tree, so they must agree on nodes and moves.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai import NegamaxAI  # noqa: E402
+from game_logic import GameLogic  # noqa: E402
+from pattern_index import PatternIndex  # noqa: E402
+
+
+class RescanIndex(PatternIndex):
+    """Answers the index's queries by recounting every window on each call"""
+
+    def play(self, position, player):
+        self.cells[position] = player
+        self.history.append(position)
+
+    def undo(self):
+        position = self.history.pop()
+        self.cells[position] = 0
+        return position
+
+    def evaluate(self, player):
+        score = self.full_scan(self.cells)
+        return score if player == 1 else -score
+
+    def winning_moves(self, player):
+        cells = self.cells
+        moves = set()
+        for combo in self.windows:
+            own = empty = 0
+            for pos in combo:
+                if cells[pos] == player:
+                    own += 1
+                elif not cells[pos]:
+                    empty = pos
+            if own == self.win_length - 1 and not any(cells[pos] == 3 - player for pos in combo):
+                moves.add(empty)
+        return moves
+
+
+class RescanNegamaxAI(NegamaxAI):
+    """NegamaxAI on the rescanning index"""
+
+    def _setup(self, game_logic):
+        super()._setup(game_logic)
+        self.index = RescanIndex(self.size, self.win_length)
+        self.index.load(self.cells)
+
+
+def positions(size, win_length, count, stones, seed=0):
+    """Random positions with stones placed near the centre and no winner yet"""
+    rng = random.Random(seed)
+    center = size // 2
+    games = []
+    while len(games) < count:
+        game = GameLogic(size, win_length)
+        game.make_move(center * size + center)
+        while game.move_count < stones and not game.is_game_over():
+            row = center + rng.randint(-2, 2)
+            col = center + rng.randint(-2, 2)
+            game.make_move(row * size + col)
+        if not game.is_game_over():
+            games.append(game)
+    return games
+
+
+def search_rate(ai_class, games, depth):
+    """Total nodes, nodes per second and chosen moves over the positions"""
+    nodes = 0
+    seconds = 0.0
+    moves = []
+    for game in games:
+        player = ai_class(max_depth=depth)
+        start = time.perf_counter()
+        moves.append(player.choose_move(game))
+        seconds += time.perf_counter() - start
+        nodes += player.nodes
+    return nodes, nodes / seconds, moves
+
+
+def main(argv=None):
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark the pattern index")
+    parser.add_argument("--size", type=int, default=15)
+    parser.add_argument("--win-length", type=int, default=5)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--positions", type=int, default=5)
+    parser.add_argument("--stones", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    games = positions(args.size, args.win_length, args.positions, args.stones, args.seed)
+    print(f"{'evaluation':<12}{'nodes':>10}{'nodes/s':>12}")
+    results = {}
+    for name, ai_class in (("rescan", RescanNegamaxAI), ("index", NegamaxAI)):
+        results[name] = search_rate(ai_class, games, args.depth)
+        nodes, rate, _ = results[name]
+        print(f"{name:<12}{nodes:>10}{rate:>12,.0f}")
+    if results["rescan"][2] != results["index"][2] or results["rescan"][0] != results["index"][0]:
+        print("searches differ: the index and the rescan disagree")
+        sys.exit(1)
+    print(f"speedup: {results['index'][1] / results['rescan'][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
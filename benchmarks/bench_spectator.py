@@ -0,0 +1,163 @@
+"""
+Spectator feed benchmark
+Publishes random games to thousands of subscribers of one SpectatorFeed,
+some polling after every move and some falling behind, and reports the
+cost per move and the bytes sent against polling the full board
+
+With --sockets the same games are also streamed through server.py to
+that many WATCH connections on localhost, reporting fan-out latency: the
+time from sending a move until every spectator, read in this same
+process, has applied it.
+Every subscriber's final game is checked against the played one.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic import GameLogic  # noqa: E402
+from server import GameServer, raise_file_limit  # noqa: E402
+from spectator import SpectatorFeed, apply_message  # noqa: E402
+
+
+def random_moves(game, rng):
+    """Play a random game to the end, yielding after each move"""
+    while not game.is_game_over():
+        game.make_move(rng.choice([pos for pos, value in enumerate(game.get_board()) if not value]))
+        yield
+
+
+def bench_feed(size, win_length, subscribers, games, slow_every, seed=0):
+    """Fan games out in process; return timings, byte counts and the coalesced total"""
+    rng = random.Random(seed)
+    game = GameLogic(size, win_length)
+    feed = SpectatorFeed(game)
+    # Every tenth subscriber only polls every slow_every moves
+    subscriptions = [(feed.subscribe(), slow_every if index % 10 == 0 else 1)
+                     for index in range(subscribers)]
+    viewers = [GameLogic(size, win_length) for _ in subscriptions]
+
+    moves = 0
+    publish_seconds = poll_seconds = 0.0
+    sent = polled = 0
+    for _ in range(games):
+        for _ in random_moves(game, rng):
+            moves += 1
+            start = time.perf_counter()
+            feed.update()
+            publish_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            batches = [subscription.poll() if moves % every == 0 else []
+                       for subscription, every in subscriptions]
+            poll_seconds += time.perf_counter() - start
+            for viewer, lines in zip(viewers, batches):
+                for line in lines:
+                    sent += len(line)
+                    apply_message(viewer, line.decode().split())
+            # Polling the full board instead costs one board per subscriber per move
+            polled += subscribers * len(feed.snapshot())
+        game.reset_game()
+        feed.update()
+
+    for (subscription, _), viewer in zip(subscriptions, viewers):
+        for line in subscription.poll():
+            apply_message(viewer, line.decode().split())
+        if viewer.history != game.history:
+            raise AssertionError("a subscriber's game differs from the published one")
+    coalesced = sum(subscription.coalesced for subscription, _ in subscriptions)
+    return moves, publish_seconds, poll_seconds, sent, polled, coalesced
+
+
+async def bench_sockets(size, win_length, spectators, games, seed=0):
+    """Stream games through a local server; return the fan-out latency of each move"""
+    game_server = GameServer(size, win_length)
+    server = await game_server.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    watchers = []
+    for _ in range(spectators):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"WATCH bench\n")
+        watchers.append((reader, writer))
+    for reader, _ in watchers:
+        await reader.readline()
+
+    players = {}
+    for _ in range(2):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"JOIN bench\n")
+        players[(await reader.readline()).split()[-1].decode()] = (reader, writer)
+
+    async def receive(reader, viewer):
+        # Read until this spectator's game has caught up with the move
+        while viewer.history != game.history:
+            apply_message(viewer, (await reader.readline()).decode().split())
+
+    rng = random.Random(seed)
+    game = GameLogic(size, win_length)
+    viewers = [GameLogic(size, win_length) for _ in watchers]
+    latencies = []
+    for _ in range(games):
+        mover = "X"
+        for _ in random_moves(game, rng):
+            start = time.perf_counter()
+            players[mover][1].write(f"MOVE {game.history[-1]}\n".encode())
+            await asyncio.gather(*(receive(reader, viewer)
+                                   for (reader, _), viewer in zip(watchers, viewers)))
+            latencies.append(time.perf_counter() - start)
+            mover = "O" if mover == "X" else "X"
+        game.reset_game()
+        players["X"][1].write(b"NEW\n")
+        await asyncio.gather(*(receive(reader, viewer)
+                               for (reader, _), viewer in zip(watchers, viewers)))
+
+    for _, writer in (*watchers, *players.values()):
+        writer.close()
+    while game_server.connections:
+        await asyncio.sleep(0.01)
+    server.close()
+    await server.wait_closed()
+    return latencies
+
+
+def main(argv=None):
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark the spectator feed")
+    parser.add_argument("--size", type=int, default=15)
+    parser.add_argument("--win-length", type=int, default=5)
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--slow-every", type=int, default=100,
+                        help="moves between polls of the slow subscribers")
+    parser.add_argument("--sockets", type=int, default=0,
+                        help="also stream to this many WATCH connections through server.py")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    moves, publish, poll, sent, polled, coalesced = bench_feed(
+        args.size, args.win_length, args.subscribers, args.games, args.slow_every, args.seed
+    )
+    print(f"{args.subscribers} subscribers, {moves} moves on {args.size}x{args.size}")
+    print(f"publish per move:        {publish / moves * 1e6:10.1f} us")
+    print(f"poll per subscriber:     {poll / moves / args.subscribers * 1e6:10.2f} us")
+    print(f"bytes sent:              {sent:10,} ({polled / max(sent, 1):.0f}x less than full boards)")
+    print(f"coalesced snapshots:     {coalesced:10,}")
+
+    if args.sockets:
+        raise_file_limit()
+        latencies = sorted(asyncio.run(
+            bench_sockets(args.size, args.win_length, args.sockets, args.games, args.seed)
+        ))
+        print(f"{args.sockets} socket spectators, {len(latencies)} moves")
+        print(f"fan-out p50:             {latencies[len(latencies) // 2] * 1000:10.2f} ms")
+        print(f"fan-out p95:             {latencies[int(len(latencies) * 0.95)] * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Startup benchmark
+Reports cold import times of the entry-point modules and the time from
+process start to the board's first paint and to the complete window
+
+Each measurement runs in a fresh interpreter. The window timings need a
+display; on a headless machine run them under Xvfb:
+
+    xvfb-run python benchmarks/bench_startup.py
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry points that must not pull in tkinter, and the window's own module
+MODULES = ("game_logic", "ai", "mcts", "simulate", "server", "main")
+
+IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, "tkinter" in sys.modules)
+"""
+
+WINDOW_PROBE = """
+import json, time
+start = time.perf_counter()
+import tkinter
+import main
+try:
+    game = main.TicTacToeGame()
+except tkinter.TclError:
+    print("null")
+    raise SystemExit
+times = {}
+game.ui.canvas.bind("<Expose>", lambda event: times.setdefault("first_frame", time.perf_counter() - start), "+")
+while "full_window" not in times:
+    game.window.update()
+    if game.ui.score_label is not None:
+        game.window.update_idletasks()
+        times["full_window"] = time.perf_counter() - start
+game.window.destroy()
+print(json.dumps(times))
+"""
+
+
+def probe(code):
+    """Run code in a fresh interpreter from the repository root"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout.split("\n")[0]
+
+
+def import_time(module, repeats=5):
+    """Fastest cold import of module in seconds, and whether it loaded tkinter"""
+    best = None
+    for _ in range(repeats):
+        seconds, uses_tk = probe(IMPORT_PROBE.format(module=module)).split()
+        best = float(seconds) if best is None else min(best, float(seconds))
+    return best, uses_tk == "True"
+
+
+def window_times(repeats=5):
+    """Fastest first-frame and full-window times in seconds, or None without a display"""
+    best = None
+    for _ in range(repeats):
+        times = json.loads(probe(WINDOW_PROBE))
+        if times is None:
+            return None
+        if best is None:
+            best = times
+        else:
+            best = {name: min(best[name], value) for name, value in times.items()}
+    return best
+
+
+def main(argv=None):
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Import and first-frame times")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'module':<14}{'import ms':>10}  tkinter")
+    for module in MODULES:
+        seconds, uses_tk = import_time(module, args.repeats)
+        print(f"{module:<14}{seconds * 1000:>10.1f}  {'yes' if uses_tk else 'no'}")
+
+    times = window_times(args.repeats)
+    if times is None:
+        print("window: skipped (no display; try xvfb-run)")
+    else:
+        print(f"first frame:  {times['first_frame'] * 1000:.1f} ms")
+        print(f"full window:  {times['full_window'] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Statistics store benchmark
+Records many games and reports the caller's cost per game, the background
+write throughput and the time to reopen the store as the history grows
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stats_store import StatsStore  # noqa: E402
+
+MOVES = bytes([4, 0, 8, 2, 1, 7, 6])
+
+
+def main(argv=None):
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark the statistics store")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--rounds", type=int, default=4,
+                        help="reopen the store this many times while it grows")
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    per_round = args.games // args.rounds
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "stats.db")
+        print(f"{'games':>10}{'open ms':>10}{'record us':>11}{'writes/s':>12}")
+        for round_index in range(args.rounds):
+            start = time.perf_counter()
+            store = StatsStore(path, batch_size=args.batch_size)
+            opened = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(per_round):
+                winner = rng.choice(("X", "O", None))
+                store.record_game(winner, (0, 4, 8) if winner else None, MOVES)
+            recorded = time.perf_counter() - start
+            store.close()
+            written = time.perf_counter() - start
+
+            print(f"{(round_index + 1) * per_round:>10}{opened * 1000:>10.2f}"
+                  f"{recorded / per_round * 1e6:>11.2f}{per_round / written:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Style cache benchmark
+Compares configuring widgets with font tuples against the cache's named
+fonts, and a theme switch that touches only changed widgets against
+reapplying every option
+
+Needs a display; on a headless machine run it under Xvfb:
+
+    xvfb-run python benchmarks/bench_styles.py
+"""
+
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_update_display import CountingTkApp  # noqa: E402
+from game_logic import GameLogic  # noqa: E402
+from game_ui import GameUI  # noqa: E402
+from styles import GameStyles, LightStyles, StyleCache  # noqa: E402
+
+
+def per_call_us(action, repeats):
+    """Mean microseconds per call of action"""
+    start = time.perf_counter()
+    for index in range(repeats):
+        action(index)
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def font_costs(window, repeats):
+    """Configure a label and a canvas text with font tuples and with named fonts"""
+    cache = StyleCache(window)
+    tuples = (GameStyles.FONTS["status"], GameStyles.FONTS["cell_win"])
+    named = (cache.fonts["status"], cache.fonts["cell_win"])
+    label = tk.Label(window, text="Player X's Turn")
+    canvas = tk.Canvas(window)
+    item = canvas.create_text(10, 10, text="X")
+
+    results = {}
+    for kind, fonts in (("tuple", tuples), ("named", named)):
+        # Alternate fonts so every call really changes the option
+        results[f"label {kind}"] = per_call_us(
+            lambda index: label.configure(font=fonts[index & 1]), repeats
+        )
+        results[f"canvas {kind}"] = per_call_us(
+            lambda index: canvas.itemconfigure(item, font=fonts[index & 1]), repeats
+        )
+    label.destroy()
+    canvas.destroy()
+    return results
+
+
+def reapply_all(ui):
+    """Reconfigure every themed widget and canvas item, changed or not"""
+    style = ui.style
+    for widget, role in ui.themed_widgets:
+        widget.configure(style.widgets[role])
+    ui.status_label.config(fg=style.status_colors[ui.rendered_status[1]])
+    ui.canvas.itemconfigure(ui.winning_line, style.line)
+    for pos, value in enumerate(ui.rendered_cells):
+        ui.canvas.itemconfigure(ui.cell_rects[pos], style.cell_rect[value])
+        ui.canvas.itemconfigure(ui.cell_texts[pos], style.cell_text[value])
+
+
+def theme_switch_costs(window, counter, size, repeats):
+    """Tk calls and milliseconds per dark/light switch"""
+    game_logic = GameLogic(size)
+    ui = GameUI(window, game_logic, game_logic.make_move)
+    window.update()
+    ui.create_secondary_ui()
+    window.update()
+
+    results = {}
+    for name, switch in (("changed only", ui.set_theme), ("reapply all", None)):
+        counter.calls = 0
+        start = time.perf_counter()
+        for index in range(repeats):
+            theme = LightStyles if index % 2 == 0 else GameStyles
+            if switch is not None:
+                switch(theme)
+            else:
+                ui.style.load(theme)
+                reapply_all(ui)
+            window.update_idletasks()
+        results[name] = (counter.calls / repeats, (time.perf_counter() - start) / repeats * 1000)
+    return results
+
+
+def main(argv=None):
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark the style cache")
+    parser.add_argument("--repeats", type=int, default=2000)
+    parser.add_argument("--switches", type=int, default=200)
+    parser.add_argument("--size", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    try:
+        window = tk.Tk()
+    except tk.TclError as error:
+        print(f"no display: {error}")
+        return
+    counter = CountingTkApp(window.tk)
+    window.tk = counter
+
+    print(f"{'configure':<16}{'us/call':>10}")
+    for name, cost in font_costs(window, args.repeats).items():
+        print(f"{name:<16}{cost:>10.2f}")
+
+    print(f"\n{'theme switch':<16}{'Tk calls':>10}{'ms':>10}")
+    for name, (calls, ms) in theme_switch_costs(window, counter, args.size, args.switches).items():
+        print(f"{name:<16}{calls:>10.1f}{ms:>10.3f}")
+    window.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark for GameUI.update_display
+Plays random games through the real UI and reports Tk calls and wall time per move
+
+Needs a display; on a headless machine run it under Xvfb:
+
+    xvfb-run python benchmarks/bench_update_display.py
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic import GameLogic  # noqa: E402
+from game_ui import GameUI  # noqa: E402
+
+
+class CountingTkApp:
+    """Wraps the Tcl interpreter and counts every call made through it"""
+
+    def __init__(self, app):
+        self._app = app
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._app.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._app, name)
+
+
+def run(games=50, size=3, seed=0):
+    """Play games through GameUI and return per-move measurements"""
+    window = tk.Tk()
+    counter = CountingTkApp(window.tk)
+    window.tk = counter
+    game_logic = GameLogic(size)
+    ui = GameUI(window, game_logic, game_logic.make_move)
+    window.update()
+
+    rng = random.Random(seed)
+    calls = []
+    times = []
+    for _ in range(games):
+        while not game_logic.is_game_over():
+            free = [pos for pos, value in enumerate(game_logic.get_board()) if not value]
+            row, col = divmod(rng.choice(free), size)
+            counter.calls = 0
+            start = time.perf_counter()
+            ui.on_button_click(row, col)
+            window.update_idletasks()
+            times.append(time.perf_counter() - start)
+            calls.append(counter.calls)
+        ui.on_new_game()
+        window.update()
+    window.destroy()
+    return calls, times
+
+
+def main(argv=None):
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark GameUI.update_display")
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    calls, times = run(args.games, args.size, args.seed)
+    times_ms = sorted(t * 1000 for t in times)
+    print(f"moves:            {len(times)}")
+    print(f"Tk calls/move:    {statistics.mean(calls):.1f} (max {max(calls)})")
+    print(f"ms/move (mean):   {statistics.mean(times_ms):.3f}")
+    print(f"ms/move (p95):    {times_ms[int(len(times_ms) * 0.95)]:.3f}")
+
+
+if __name__ == "__main__":
+    main()
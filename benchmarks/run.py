@@ -0,0 +1,249 @@
+"""
+Benchmark suite for the game's hot paths
+Times game logic, whole games, AI moves, display updates and startup,
+writes the results as JSON and compares them against a saved baseline
+
+    python benchmarks/run.py --output baseline.json
+    python benchmarks/run.py --baseline baseline.json
+
+The display and window startup benchmarks need a display; on a headless machine run the suite
+under Xvfb (``xvfb-run python benchmarks/run.py``) or it is skipped.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai import NegamaxAI  # noqa: E402
+from game_logic import BACKENDS, create_game_logic  # noqa: E402
+from mcts import MCTSAI  # noqa: E402
+from simulate import play_game  # noqa: E402
+from strategies import RandomStrategy  # noqa: E402
+from bench_pattern_index import positions, search_rate  # noqa: E402
+from bench_startup import MODULES, import_time, window_times  # noqa: E402
+
+# (size, win length) of the boards the logic benchmarks play on
+BOARDS = ((3, 3), (15, 5))
+
+# (size, win length, depth, opening moves) for the AI benchmarks
+AI_POSITIONS = (
+    (3, 3, None, ()),
+    (7, 4, 2, (24, 25)),
+    (7, 4, 3, (24, 25)),
+    (9, 5, 2, (40, 41)),
+)
+
+
+def best_of(repeats, function):
+    """Run function several times and return the fastest wall time"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def random_games(size, win_length, count, seed):
+    """Record move sequences of random games to replay in the benchmarks"""
+    rng = random.Random(seed)
+    game = create_game_logic("list", size, win_length)
+    games = []
+    for _ in range(count):
+        game.reset_game()
+        while not game.is_game_over():
+            free = [pos for pos, value in enumerate(game.get_board()) if not value]
+            game.make_move(rng.choice(free))
+        games.append(list(game.history))
+    return games
+
+
+def bench_make_move(backend, size, win_length, quick):
+    """Moves per second replaying recorded random games"""
+    games = random_games(size, win_length, 200 if quick else 1000, 0)
+    moves = sum(len(moves) for moves in games)
+    game = create_game_logic(backend, size, win_length)
+
+    def replay():
+        for moves in games:
+            game.reset_game()
+            for position in moves:
+                game.make_move(position)
+
+    return moves / best_of(5, replay)
+
+
+def bench_check_winner(backend, size, win_length, quick):
+    """check_winner calls per second on mid-game positions"""
+    positions = []
+    for moves in random_games(size, win_length, 50, 1):
+        game = create_game_logic(backend, size, win_length)
+        for position in moves[:-1]:
+            game.make_move(position)
+        positions.append(game)
+    calls = 200 if quick else 1000
+
+    def check():
+        for game in positions:
+            for _ in range(calls):
+                game.check_winner()
+
+    return len(positions) * calls / best_of(5, check)
+
+
+def bench_random_games(backend, size, win_length, quick):
+    """Whole random games per second through the strategy interface"""
+    count = 200 if quick else 1000
+    game = create_game_logic(backend, size, win_length)
+    x_strategy = RandomStrategy(random.Random(1))
+    o_strategy = RandomStrategy(random.Random(2))
+
+    def play():
+        for _ in range(count):
+            play_game(game, x_strategy, o_strategy)
+
+    return count / best_of(5, play)
+
+
+def bench_ai_move(size, win_length, depth, opening):
+    """Milliseconds for a fresh NegamaxAI to choose a move"""
+    game = create_game_logic("list", size, win_length)
+    for position in opening:
+        game.make_move(position)
+
+    def search():
+        NegamaxAI(max_depth=depth).choose_move(game)
+
+    return best_of(5, search) * 1000
+
+
+def bench_ai_nodes(size, win_length, quick):
+    """NegamaxAI nodes per second on mid-game positions of a large board"""
+    games = positions(size, win_length, 2 if quick else 5, 6)
+    return search_rate(NegamaxAI, games, 3)[1]
+
+
+def bench_mcts_rollouts(size, win_length, quick):
+    """MCTS iterations per second from the empty board"""
+    game = create_game_logic("list", size, win_length)
+    budget_ms = 200 if quick else 1000
+    player = MCTSAI(budget_ms=budget_ms, rng=random.Random(0))
+    player.choose_move(game)
+    return player.last_iterations / (budget_ms / 1000)
+
+
+def bench_update_display(size, quick):
+    """Mean milliseconds per move through GameUI, or None without a display"""
+    import tkinter as tk
+    from bench_update_display import run
+
+    try:
+        _, times = run(games=10 if quick else 50, size=size)
+    except tk.TclError:
+        return None
+    return statistics.mean(times) * 1000
+
+
+def run_suite(quick=False):
+    """Run every benchmark and return {name: result}
+
+    Each result is a dict with ``value``, ``unit`` and ``higher_is_better``.
+    """
+    results = {}
+
+    def record(name, value, unit, higher_is_better):
+        results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+        shown = "skipped (no display; try xvfb-run)" if value is None else f"{value:,.2f} {unit}"
+        print(f"{name:<40}{shown}", file=sys.stderr)
+
+    for backend in sorted(BACKENDS):
+        for size, win_length in BOARDS:
+            board = f"{backend}/{size}x{size}k{win_length}"
+            record(f"make_move/{board}",
+                   bench_make_move(backend, size, win_length, quick), "moves/s", True)
+            record(f"check_winner/{board}",
+                   bench_check_winner(backend, size, win_length, quick), "calls/s", True)
+            record(f"random_games/{board}",
+                   bench_random_games(backend, size, win_length, quick), "games/s", True)
+
+    for size, win_length, depth, opening in AI_POSITIONS:
+        name = f"ai_move/{size}x{size}k{win_length}/depth-{depth or 'full'}"
+        record(name, bench_ai_move(size, win_length, depth, opening), "ms/move", False)
+    record("ai_nodes/15x15k5/depth-3", bench_ai_nodes(15, 5, quick), "nodes/s", True)
+    for size, win_length in ((3, 3), (9, 5)):
+        record(f"mcts/{size}x{size}k{win_length}",
+               bench_mcts_rollouts(size, win_length, quick), "iterations/s", True)
+
+    for size in (3, 7):
+        record(f"update_display/{size}x{size}", bench_update_display(size, quick), "ms/move", False)
+
+    for module in MODULES:
+        seconds, _ = import_time(module, 3 if quick else 5)
+        record(f"startup/import/{module}", seconds * 1000, "ms", False)
+    times = window_times(3 if quick else 5)
+    for name in ("first_frame", "full_window"):
+        record(f"startup/{name}", None if times is None else times[name] * 1000, "ms", False)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print the change against a baseline and return the regressed names"""
+    regressions = []
+    print(f"{'benchmark':<40}{'baseline':>14}{'current':>14}{'change':>10}")
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("value")
+        value = result["value"]
+        if before is None or value is None:
+            print(f"{name:<40}{'-':>14}{'-':>14}{'n/a':>10}")
+            continue
+        change = (value - before) / before
+        # Positive means better, whichever direction the unit improves in
+        gain = change if result["higher_is_better"] else -change
+        flag = ""
+        if gain < -threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<40}{before:>14,.2f}{value:>14,.2f}{change:>+10.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    """Run the benchmark suite from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results saved with --output")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown reported as a regression")
+    parser.add_argument("--quick", action="store_true", help="smaller workloads")
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": run_suite(args.quick),
+    }
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        if compare(report["results"], baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Tic-Tac-Toe Game Log
+Compact binary archive of finished games
+
+File layout: an 8-byte header (magic, version, board size, win length,
+padding) followed by one record per game. A record is the move count as an
+unsigned LEB128 varint, then the moves as written by
+GameLogic.to_record(): one byte per move on boards up to 16x16.
+"""
+
+import argparse
+import random
+import struct
+import time
+
+from game_logic import GameLogic, create_game_logic
+from strategies import STRATEGY_HELP, create_strategy, strategy_spec
+
+MAGIC = b"TTTL"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBx")
+
+
+def _encode_varint(value):
+    """Encode a non-negative integer as unsigned LEB128"""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+class GameLogWriter:
+    """Appends finished games to a log file"""
+
+    def __init__(self, path, size=3, win_length=None):
+        self.size = size
+        self.win_length = win_length or size
+        self.move_width = 1 if size * size <= 256 else 2
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, size, self.win_length))
+        self.count = 0
+
+    def write(self, game_logic):
+        """Append the moves of a game"""
+        if (game_logic.size, game_logic.win_length) != (self.size, self.win_length):
+            raise ValueError("Game dimensions do not match the log")
+        record = game_logic.to_record()
+        self.file.write(_encode_varint(len(record) // self.move_width))
+        self.file.write(record)
+        self.count += 1
+
+    def close(self):
+        """Flush and close the log file"""
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_header(buffer):
+    """Get (size, win_length) from the start of a log buffer"""
+    magic, version, size, win_length = HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} game log")
+    return size, win_length
+
+
+def iter_records(buffer):
+    """Yield the move record of each game in a log buffer
+
+    ``buffer`` is any bytes-like object, such as an mmap. Records are
+    memoryview slices of it, so nothing is copied.
+    """
+    size, _ = read_header(buffer)
+    move_width = 1 if size * size <= 256 else 2
+    view = memoryview(buffer)
+    offset = HEADER.size
+    end = len(view)
+    while offset < end:
+        count = 0
+        shift = 0
+        while True:
+            byte = view[offset]
+            offset += 1
+            count |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                break
+            shift += 7
+        length = count * move_width
+        if offset + length > end:
+            raise ValueError("Truncated game log")
+        yield view[offset:offset + length]
+        offset += length
+
+
+def replay_log(path, backend="list"):
+    """Replay every game in a log, yielding each finished GameLogic
+
+    One GameLogic instance is reused for every record.
+    """
+    with open(path, "rb") as log_file:
+        data = log_file.read()
+    size, win_length = read_header(data)
+    game_logic = create_game_logic(backend, size, win_length)
+    for record in iter_records(data):
+        game_logic.replay(record)
+        yield game_logic
+
+
+def main(argv=None):
+    """Record or replay game logs from the command line"""
+    parser = argparse.ArgumentParser(description="Record and replay game logs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="play games and log them")
+    record.add_argument("path")
+    record.add_argument("--games", type=int, default=10000)
+    record.add_argument("--x", dest="x_name", type=strategy_spec, default="random",
+                        help=STRATEGY_HELP)
+    record.add_argument("--o", dest="o_name", type=strategy_spec, default="random",
+                        help=STRATEGY_HELP)
+    record.add_argument("--size", type=int, default=3)
+    record.add_argument("--win-length", type=int, default=None)
+    record.add_argument("--seed", type=int, default=0)
+
+    replay = commands.add_parser("replay", help="replay a log and report results")
+    replay.add_argument("path")
+
+    args = parser.parse_args(argv)
+    if args.command == "record":
+        rng = random.Random(args.seed)
+        players = {
+            "X": create_strategy(args.x_name, rng),
+            "O": create_strategy(args.o_name, rng),
+        }
+        game_logic = GameLogic(args.size, args.win_length)
+        with GameLogWriter(args.path, args.size, args.win_length) as writer:
+            for _ in range(args.games):
+                game_logic.reset_game()
+                while not game_logic.is_game_over():
+                    strategy = players[game_logic.get_current_player()]
+                    game_logic.make_move(strategy.choose_move(game_logic))
+                writer.write(game_logic)
+        print(f"Wrote {writer.count} games to {args.path}")
+    else:
+        results = {"X": 0, "O": 0, None: 0}
+        start = time.perf_counter()
+        for game_logic in replay_log(args.path):
+            results[game_logic.get_winner()] += 1
+        elapsed = time.perf_counter() - start
+        games = sum(results.values())
+        print(f"X wins: {results['X']}  O wins: {results['O']}  Draws: {results[None]}")
+        print(f"{games / elapsed:,.0f} games/second replayed")
+
+
+if __name__ == "__main__":
+    main()
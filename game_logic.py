@@ -3,32 +3,446 @@ Tic-Tac-Toe Game Logic
 Handles board state, win detection, and game rules
 """
 
+from collections.abc import Sequence
+from functools import lru_cache
+
+# Line directions as (row step, column step): row, column, diagonal, anti-diagonal
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# Cell values as stored in the compact board, indexed by cell code
+SYMBOLS = ("", "X", "O")
+PLAYER_CODES = {"X": 1, "O": 2}
+
+
+@lru_cache(maxsize=None)
+def _line_windows(size, win_length):
+    """Every run of win_length cells on the board, grouped by direction"""
+    windows = []
+    for direction, (dr, dc) in enumerate(DIRECTIONS):
+        for row in range(size):
+            for col in range(size):
+                end_row = row + dr * (win_length - 1)
+                end_col = col + dc * (win_length - 1)
+                if 0 <= end_row < size and 0 <= end_col < size:
+                    combo = [(row + dr * k) * size + col + dc * k for k in range(win_length)]
+                    windows.append((direction, sorted(combo)))
+    return windows
+
+
+def winning_lines(size=3, win_length=None):
+    """Get every winning combination for a board of the given size"""
+    return [combo for _, combo in _line_windows(size, win_length or size)]
+
+
+WINNING_COMBINATIONS = winning_lines(3)
+
+
+@lru_cache(maxsize=None)
+def _cell_rays(size, win_length):
+    """For each cell and direction, the cells walked backward and forward
+    
+    Each ray stops at the board edge or after win_length - 1 cells.
+    """
+    reach = win_length - 1
+    rays = []
+    for position in range(size * size):
+        row, col = divmod(position, size)
+        cell_rays = []
+        for dr, dc in DIRECTIONS:
+            pair = []
+            for sign in (-1, 1):
+                ray = []
+                r, c = row + sign * dr, col + sign * dc
+                while len(ray) < reach and 0 <= r < size and 0 <= c < size:
+                    ray.append(r * size + c)
+                    r += sign * dr
+                    c += sign * dc
+                pair.append(tuple(ray))
+            cell_rays.append(tuple(pair))
+        rays.append(tuple(cell_rays))
+    return tuple(rays)
+
+
+def encode_moves(moves, size):
+    """Encode a move sequence as one byte per move (two above 256 cells)"""
+    if size * size <= 256:
+        return bytes(moves)
+    return b"".join(move.to_bytes(2, "big") for move in moves)
+
+
+def decode_moves(data, size):
+    """Decode a move sequence written by encode_moves"""
+    if size * size <= 256:
+        return list(data)
+    return [int.from_bytes(data[i:i + 2], "big") for i in range(0, len(data), 2)]
+
+
+def _validate_dimensions(size, win_length):
+    """Check board dimensions and return the effective win length"""
+    win_length = win_length or size
+    if size < 1:
+        raise ValueError(f"Board size must be at least 1, got {size}")
+    if not 1 <= win_length <= size:
+        raise ValueError(f"Win length must be between 1 and {size}, got {win_length}")
+    return win_length
+
+
+class BoardView(Sequence):
+    """Read-only board of "", "X" and "O" strings over a game's compact state
+    
+    The view is live: it always shows the current board without copying it.
+    Call list() on it for a snapshot. The compact state is decoded in one
+    pass on the first read; after that the game keeps the decoded symbols
+    up to date move by move, so reading the board costs no more than
+    iterating a list. Games that are never read never pay for the symbols.
+    """
+    __slots__ = ("_cells", "_length", "_symbols")
+    
+    def __init__(self, cells, length):
+        self._cells = cells
+        self._length = length
+        self._symbols = None
+    
+    def _decode(self):
+        """Decode the whole board into the symbol list the game then maintains"""
+        symbols = self._symbols = list(map(SYMBOLS.__getitem__, self._cells[:self._length]))
+        return symbols
+    
+    def _set(self, position, symbol):
+        """Record a changed cell in the decoded symbols, if any were decoded"""
+        symbols = self._symbols
+        if symbols is not None:
+            symbols[position] = symbol
+    
+    def __getitem__(self, index):
+        symbols = self._symbols
+        if symbols is None:
+            symbols = self._decode()
+        return symbols[index]
+    
+    def __len__(self):
+        return self._length
+    
+    def __iter__(self):
+        symbols = self._symbols
+        if symbols is None:
+            symbols = self._decode()
+        return iter(symbols)
+    
+    def __eq__(self, other):
+        if isinstance(other, BoardView):
+            return self.copy() == other.copy()
+        if isinstance(other, (list, tuple)):
+            return self.copy() == list(other)
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self.copy()!r})"
+    
+    def copy(self):
+        """Get a mutable snapshot of the board"""
+        symbols = self._symbols
+        if symbols is None:
+            symbols = self._decode()
+        return symbols.copy()
+
+
+def _last_move(moves, cell_count):
+    """Last position in a move sequence encoded by encode_moves (None if empty)"""
+    if not moves:
+        return None
+    if cell_count <= 256:
+        return moves[-1]
+    return int.from_bytes(moves[-2:], "big")
+
+
 class GameLogic:
-    """Handles the game logic and state management"""
+    """Handles the game logic and state management
+    
+    One bytearray holds the whole game: a cell code per square (0 empty,
+    1 X, 2 O) followed by the moves played so far, encoded as by
+    encode_moves. The rest of the state lives in __slots__, and the board
+    view and redo stack are only created once used, so a live 3x3 game
+    costs less than the original list-based one.
+    """
+    __slots__ = (
+        "size", "win_length", "rays", "cells", "current_player", "game_over",
+        "winner", "winning_combo", "_board", "_redo",
+    )
     
-    def __init__(self):
+    def __init__(self, size=3, win_length=None):
+        self.win_length = _validate_dimensions(size, win_length)
+        self.size = size
+        self.rays = _cell_rays(size, self.win_length)
+        self.cells = bytearray(size * size)
+        self._board = None
         self.reset_game()
     
     def reset_game(self):
-        """Reset the game to initial state"""
-        self.board = [""] * 9
+        """Reset the game to initial state, reusing the board storage"""
+        cells = self.cells
+        cell_count = self.size * self.size
+        del cells[cell_count:]
+        cells[:] = bytes(cell_count)
+        if self._board is not None:
+            self._board._symbols = None
         self.current_player = "X"
         self.game_over = False
         self.winner = None
         self.winning_combo = None
+        self._redo = None
+    
+    @property
+    def history(self):
+        """Positions played so far, in order"""
+        return decode_moves(self.cells[self.size * self.size:], self.size)
+    
+    @property
+    def move_count(self):
+        """Number of moves played so far"""
+        cell_count = self.size * self.size
+        played = len(self.cells) - cell_count
+        return played if cell_count <= 256 else played // 2
+    
+    @property
+    def last_move(self):
+        """Position of the last move (None before the first)"""
+        cell_count = self.size * self.size
+        return _last_move(self.cells[cell_count:], cell_count)
+    
+    @property
+    def board(self):
+        """The read-only board view, as returned by get_board()"""
+        return self.get_board()
     
     def make_move(self, position):
-        """Make a move at the given position"""
-        if self.game_over or self.board[position] != "":
+        """Make a move at the given position (False if off the board or taken)"""
+        if not 0 <= position < self.size * self.size or self.game_over or self.cells[position]:
             return False
+        self._redo = None
+        return self._play(position)
+    
+    def _play(self, position):
+        """Place the current player's mark on a free cell and update the state"""
+        # Make the move and append it to the history
+        cells = self.cells
+        player = self.current_player
+        cells[position] = PLAYER_CODES[player]
+        cell_count = self.size * self.size
+        if cell_count <= 256:
+            cells.append(position)
+        else:
+            cells += position.to_bytes(2, "big")
+        if self._board is not None:
+            self._board._set(position, player)
         
-        # Make the move
-        self.board[position] = self.current_player
+        # Check for win
+        if self.check_winner(position):
+            self.game_over = True
+            self.winner = player
+            return True
+        
+        # Check for tie
+        if self.check_tie():
+            self.game_over = True
+            return True
+        
+        # Switch players
+        self.current_player = "O" if player == "X" else "X"
+        return True
+    
+    def check_winner(self, position=None):
+        """Check if current player has won through the last-placed cell
+        
+        Only the four lines through ``position`` (the last move by default)
+        are walked, at most win_length - 1 cells each way, so the check
+        costs O(win_length) regardless of board size.
+        """
+        if position is None:
+            position = self.last_move
+        if position is None:
+            return False
+        
+        cells = self.cells
+        player = PLAYER_CODES[self.current_player]
+        win_length = self.win_length
+        
+        for backward, forward in self.rays[position]:
+            behind = 0
+            for pos in backward:
+                if cells[pos] != player:
+                    break
+                behind += 1
+            ahead = 0
+            for pos in forward:
+                if cells[pos] != player:
+                    break
+                ahead += 1
+            if behind + ahead + 1 >= win_length:
+                run = [position, *backward[:behind], *forward[:ahead]]
+                self.winning_combo = sorted(run)
+                return True
+        return False
+    
+    def check_tie(self):
+        """Check if the game is a tie"""
+        cell_count = self.size * self.size
+        return len(self.cells) == cell_count * (2 if cell_count <= 256 else 3)
+    
+    def undo(self):
+        """Take back the last move, returning its position (None if no moves)"""
+        cells = self.cells
+        cell_count = self.size * self.size
+        position = _last_move(cells[cell_count:], cell_count)
+        if position is None:
+            return None
+        del cells[-1 if cell_count <= 256 else -2:]
+        self.current_player = SYMBOLS[cells[position]]
+        cells[position] = 0
+        if self._board is not None:
+            self._board._set(position, "")
+        self.game_over = False
+        self.winner = None
+        self.winning_combo = None
+        if self._redo is None:
+            self._redo = []
+        self._redo.append(position)
+        return position
+    
+    def redo(self):
+        """Replay the last undone move, returning its position (None if none)"""
+        if not self._redo:
+            return None
+        position = self._redo.pop()
+        self._play(position)
+        return position
+    
+    def to_record(self):
+        """Encode the moves played so far as a compact byte string"""
+        return bytes(self.cells[self.size * self.size:])
+    
+    def replay(self, record):
+        """Reset the game and replay a record written by to_record"""
+        self.reset_game()
+        for position in decode_moves(record, self.size):
+            if not self.make_move(position):
+                raise ValueError(f"Illegal move {position} in game record")
+    
+    def get_board(self):
+        """Get a read-only view of the current board state"""
+        board = self._board
+        if board is None:
+            board = self._board = BoardView(self.cells, self.size * self.size)
+        return board
+    
+    def get_current_player(self):
+        """Get current player"""
+        return self.current_player
+    
+    def is_game_over(self):
+        """Check if game is over"""
+        return self.game_over
+    
+    def get_winner(self):
+        """Get winner (None if tie or no winner)"""
+        return self.winner
+    
+    def get_winning_combo(self):
+        """Get winning combination"""
+        return self.winning_combo
+
+
+@lru_cache(maxsize=None)
+def _cell_line_masks(size, win_length):
+    """For each cell, the (direction, mask) of every window through it"""
+    cell_masks = [[] for _ in range(size * size)]
+    for direction, combo in _line_windows(size, win_length):
+        mask = sum(1 << pos for pos in combo)
+        for pos in combo:
+            cell_masks[pos].append((direction, mask))
+    return cell_masks
+
+
+class BitboardGameLogic:
+    """Game logic backed by one integer bitmask per player
+    
+    Bit ``i`` of a player's mask is set when that player owns cell ``i``.
+    Wins are detected by testing the mover's mask against the precomputed
+    masks of the windows through the last move, so a move allocates nothing
+    until the game is won. Moves are kept in a bytearray encoded as by
+    encode_moves. The public API matches GameLogic.
+    """
+    __slots__ = (
+        "size", "win_length", "cell_masks", "x_mask", "o_mask", "moves",
+        "current_player", "game_over", "winner", "winning_combo", "_board", "_redo",
+    )
+    
+    def __init__(self, size=3, win_length=None):
+        self.win_length = _validate_dimensions(size, win_length)
+        self.size = size
+        self.cell_masks = _cell_line_masks(size, self.win_length)
+        self.moves = bytearray()
+        self._board = None
+        self.reset_game()
+    
+    def reset_game(self):
+        """Reset the game to initial state"""
+        self.x_mask = self.o_mask = 0
+        self.moves.clear()
+        if self._board is not None:
+            self._board._symbols = None
+        self.current_player = "X"
+        self.game_over = False
+        self.winner = None
+        self.winning_combo = None
+        self._redo = None
+    
+    @property
+    def history(self):
+        """Positions played so far, in order"""
+        return decode_moves(self.moves, self.size)
+    
+    @property
+    def move_count(self):
+        """Number of moves played so far"""
+        return len(self.moves) if self.size * self.size <= 256 else len(self.moves) // 2
+    
+    @property
+    def last_move(self):
+        """Position of the last move (None before the first)"""
+        return _last_move(self.moves, self.size * self.size)
+    
+    @property
+    def board(self):
+        """The read-only board view, as returned by get_board()"""
+        return self.get_board()
+    
+    def make_move(self, position):
+        """Make a move at the given position (False if off the board or taken)"""
+        if not 0 <= position < self.size * self.size or self.game_over or (self.x_mask | self.o_mask) >> position & 1:
+            return False
+        self._redo = None
+        return self._play(position)
+    
+    def _play(self, position):
+        """Place the current player's mark on a free cell and update the state"""
+        # Make the move and append it to the history
+        player = self.current_player
+        if player == "X":
+            self.x_mask |= 1 << position
+        else:
+            self.o_mask |= 1 << position
+        if self.size * self.size <= 256:
+            self.moves.append(position)
+        else:
+            self.moves += position.to_bytes(2, "big")
+        if self._board is not None:
+            self._board._set(position, player)
         
         # Check for win
-        if self.check_winner():
+        if self.check_winner(position):
             self.game_over = True
-            self.winner = self.current_player
+            self.winner = player
             return True
         
         # Check for tie
@@ -37,31 +451,96 @@ class GameLogic:
             return True
         
         # Switch players
-        self.current_player = "O" if self.current_player == "X" else "X"
+        self.current_player = "O" if player == "X" else "X"
         return True
     
-    def check_winner(self):
-        """Check if current player has won"""
-        winning_combinations = [
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
-            [0, 4, 8], [2, 4, 6]              # Diagonals
-        ]
+    def check_winner(self, position=None):
+        """Check if current player has won through the last-placed cell"""
+        if position is None:
+            position = self.last_move
+        if position is None:
+            return False
         
-        for combo in winning_combinations:
-            if (self.board[combo[0]] == self.board[combo[1]] == 
-                self.board[combo[2]] == self.current_player):
-                self.winning_combo = combo
+        mask = self.x_mask if self.current_player == "X" else self.o_mask
+        for direction, line_mask in self.cell_masks[position]:
+            if mask & line_mask == line_mask:
+                self.winning_combo = self._collect_run(mask, position, direction)
                 return True
         return False
     
+    def _collect_run(self, mask, position, direction):
+        """Collect the run through position, matching GameLogic.check_winner"""
+        dr, dc = DIRECTIONS[direction]
+        size = self.size
+        row, col = divmod(position, size)
+        run = [position]
+        for sign in (-1, 1):
+            r, c = row + sign * dr, col + sign * dc
+            for _ in range(self.win_length - 1):
+                if not (0 <= r < size and 0 <= c < size):
+                    break
+                pos = r * size + c
+                if not mask >> pos & 1:
+                    break
+                run.append(pos)
+                r += sign * dr
+                c += sign * dc
+        return sorted(run)
+    
     def check_tie(self):
         """Check if the game is a tie"""
-        return all(cell != "" for cell in self.board)
+        cell_count = self.size * self.size
+        return len(self.moves) == (cell_count if cell_count <= 256 else 2 * cell_count)
+    
+    def undo(self):
+        """Take back the last move, returning its position (None if no moves)"""
+        cell_count = self.size * self.size
+        position = _last_move(self.moves, cell_count)
+        if position is None:
+            return None
+        del self.moves[-1 if cell_count <= 256 else -2:]
+        bit = 1 << position
+        if self.x_mask & bit:
+            self.current_player = "X"
+            self.x_mask &= ~bit
+        else:
+            self.current_player = "O"
+            self.o_mask &= ~bit
+        if self._board is not None:
+            self._board._set(position, "")
+        self.game_over = False
+        self.winner = None
+        self.winning_combo = None
+        if self._redo is None:
+            self._redo = []
+        self._redo.append(position)
+        return position
+    
+    def redo(self):
+        """Replay the last undone move, returning its position (None if none)"""
+        if not self._redo:
+            return None
+        position = self._redo.pop()
+        self._play(position)
+        return position
+    
+    def to_record(self):
+        """Encode the moves played so far as a compact byte string"""
+        return bytes(self.moves)
+    
+    def replay(self, record):
+        """Reset the game and replay a record written by to_record"""
+        self.reset_game()
+        for position in decode_moves(record, self.size):
+            if not self.make_move(position):
+                raise ValueError(f"Illegal move {position} in game record")
     
     def get_board(self):
-        """Get current board state"""
-        return self.board.copy()
+        """Get a read-only view of the current board state"""
+        board = self._board
+        if board is None:
+            board = self._board = _BitboardView(self)
+        return board
     
     def get_current_player(self):
         """Get current player"""
@@ -77,4 +556,70 @@ class GameLogic:
     
     def get_winning_combo(self):
         """Get winning combination"""
-        return self.winning_combo 
\ No newline at end of file
+        return self.winning_combo
+
+
+class _BitboardView(BoardView):
+    """Read-only board view computed from a BitboardGameLogic's masks"""
+    __slots__ = ("_game",)
+    
+    def __init__(self, game):
+        self._game = game
+        self._length = game.size * game.size
+        self._symbols = None
+    
+    def _decode(self):
+        """Decode both masks in one pass over their binary digits"""
+        size = self._length
+        # Cell i is bit i, so reverse the digits to walk cells in order
+        x_bits = f"{self._game.x_mask:0{size}b}"[::-1]
+        o_bits = f"{self._game.o_mask:0{size}b}"[::-1]
+        symbols = self._symbols = [
+            "X" if x == "1" else "O" if o == "1" else "" for x, o in zip(x_bits, o_bits)
+        ]
+        return symbols
+
+
+class GamePool:
+    """Free list of finished games for servers that host many at once
+    
+    ``acquire`` hands out a reset game, reusing a released one when possible,
+    so high-churn hosts do not allocate a new board per game.
+    """
+    __slots__ = ("backend", "size", "win_length", "free")
+    
+    def __init__(self, backend="list", size=3, win_length=None):
+        self.backend = backend
+        self.size = size
+        self.win_length = win_length
+        self.free = []
+    
+    def acquire(self):
+        """Get a game ready to play"""
+        if self.free:
+            game = self.free.pop()
+            game.reset_game()
+            return game
+        return create_game_logic(self.backend, self.size, self.win_length)
+    
+    def release(self, game):
+        """Return a game to the pool once nobody references it"""
+        self.free.append(game)
+
+
+# Available board backends, selectable by name
+BACKENDS = {
+    "list": GameLogic,
+    "bitboard": BitboardGameLogic,
+}
+
+
+def create_game_logic(backend="list", size=3, win_length=None):
+    """Create a game logic instance for the named backend"""
+    try:
+        logic_class = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown backend {backend!r}; choose from {', '.join(BACKENDS)}"
+        ) from None
+    return logic_class(size, win_length)
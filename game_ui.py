@@ -5,140 +5,192 @@ Handles the visual interface and user interactions
 
 import tkinter as tk
 
+from animation import Animation, AnimationScheduler, pulse
+from spectator import apply_message
+from styles import THEMES, GameStyles, StyleCache
+
 class GameUI:
     """Handles the game user interface"""
     
-    def __init__(self, window, game_logic, on_move_callback):
+    def __init__(self, window, game_logic, on_move_callback, on_new_game_callback=None,
+                 network_client=None, stats_store=None, styles=GameStyles):
         self.window = window
         self.game_logic = game_logic
         self.on_move_callback = on_move_callback
+        self.on_new_game_callback = on_new_game_callback
+        
+        # In network mode moves go to the server and are applied when echoed back
+        self.network_client = network_client
+        self.network_poll_ms = 20
+        # Spectators only watch: clicks and New Game are ignored
+        self.spectating = network_client is not None and network_client.spectating
+        # Set while the watched room plays another board size; its updates are skipped
+        self.board_mismatch = False
+        
+        # Set while a computer opponent is searching for its move
+        self.thinking = False
+        
+        # Finished games are recorded here and the score carries over runs
+        self.stats_store = stats_store
+        
+        # Board dimensions come from the game logic
+        self.size = game_logic.size
+        self.board_pixels = 360
+        self.cell_pixels = self.board_pixels / self.size
+        self.cell_gap = 3
         
-        # Colors with better contrast
-        self.bg_color = "#0f0f23"
-        self.card_color = "#16213e"
-        self.text_color = "#ffffff"
-        self.x_color = "#ff4757"  # Bright red for X
-        self.o_color = "#2ed573"  # Bright green for O
-        self.win_color = "#ffa502"  # Bright orange for wins
-        self.button_bg = "#2d3748"
+        # Named fonts and option dicts for every widget, built once per theme
+        self.style = StyleCache(window, self.size, styles)
+        self.themed_widgets = []
+        
+        # Winning squares pulse through a precomputed color ramp
+        self.pulse_ramp = self.style.pulse["X"]
+        self.animations = AnimationScheduler(window)
         
         # Create UI elements
         self.create_ui()
+        if self.network_client is not None:
+            self.set_status("Connecting...", "info")
+            self.window.after(self.network_poll_ms, self.poll_network)
     
     def create_ui(self):
-        """Create the game UI"""
+        """Create the title, status and board; the rest follows after first paint"""
+        self.window.configure(self.style.widgets["frame"])
+        self.themed_widgets.append((self.window, "frame"))
+        
         # Main container
-        main_frame = tk.Frame(self.window, bg=self.bg_color)
+        main_frame = self.main_frame = self.themed(tk.Frame, self.window, "frame")
         main_frame.pack(expand=True, fill="both", padx=30, pady=30)
         
         # Title
-        title_label = tk.Label(
-            main_frame,
-            text="TIC-TAC-TOE",
-            font=("Helvetica", 32, "bold"),
-            fg=self.text_color,
-            bg=self.bg_color
-        )
+        title_label = self.themed(tk.Label, main_frame, "title", text="TIC-TAC-TOE")
         title_label.pack(pady=(0, 10))
         
         # Subtitle
-        subtitle_label = tk.Label(
-            main_frame,
-            text="Classic Game, Modern Design",
-            font=("Helvetica", 12),
-            fg="#a0a0a0",
-            bg=self.bg_color
+        subtitle_label = self.themed(
+            tk.Label, main_frame, "subtitle", text="Classic Game, Modern Design"
         )
         subtitle_label.pack(pady=(0, 20))
         
         # Status frame
-        self.status_frame = tk.Frame(main_frame, bg=self.card_color, relief="flat", bd=0)
+        self.status_frame = self.themed(tk.Frame, main_frame, "card", relief="flat", bd=0)
         self.status_frame.pack(fill="x", pady=20, ipady=15, ipadx=20)
         
-        self.status_label = tk.Label(
-            self.status_frame,
+        self.status_label = self.themed(
+            tk.Label, self.status_frame, "status",
             text="Player X's Turn",
-            font=("Helvetica", 18, "bold"),
-            fg=self.text_color,
-            bg=self.card_color
+            fg=self.style.status_colors["normal"]
         )
         self.status_label.pack()
         
         # Game board
-        board_container = tk.Frame(main_frame, bg=self.bg_color)
+        board_container = self.themed(tk.Frame, main_frame, "frame")
         board_container.pack(pady=30)
         
         # Board title
-        board_title = tk.Label(
-            board_container,
-            text="Game Board",
-            font=("Helvetica", 14, "bold"),
-            fg="#a0a0a0",
-            bg=self.bg_color
-        )
+        board_title = self.themed(tk.Label, board_container, "board_label", text="Game Board")
         board_title.pack(pady=(0, 15))
         
-        # Board frame with canvas overlay for winning lines
-        self.board_frame = tk.Frame(board_container, bg="#1a1a2e", relief="flat", bd=0)
+        # Board frame holding the canvas that draws the grid, marks and winning line
+        self.board_frame = self.themed(tk.Frame, board_container, "board", relief="flat", bd=0)
         self.board_frame.pack(padx=20, pady=10, ipadx=20, ipady=20)
         
-        # Create buttons
-        self.buttons = []
-        for i in range(3):
-            row = []
-            for j in range(3):
-                btn = tk.Button(
-                    self.board_frame,
-                    text="",
-                    font=("Helvetica", 24, "bold"),  # Fixed font size
-                    width=8,  # Fixed width
-                    height=4,  # Fixed height
-                    bg=self.button_bg,
-                    fg=self.text_color,
-                    relief="flat",
-                    bd=0,
-                    command=lambda r=i, c=j: self.on_button_click(r, c)
-                )
-                btn.grid(row=i, column=j, padx=3, pady=3, sticky="nsew")
-                row.append(btn)
-            self.buttons.append(row)
+        self.canvas = self.themed(
+            tk.Canvas, self.board_frame, "board",
+            width=self.board_pixels,
+            height=self.board_pixels,
+            highlightthickness=0,
+            bd=0
+        )
+        self.canvas.pack()
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+        
+        # One rectangle and one text item per cell, reused for every game
+        self.cell_rects = []
+        self.cell_texts = []
+        for pos in range(self.size * self.size):
+            x0, y0, x1, y1 = self.cell_bounds(pos)
+            self.cell_rects.append(self.canvas.create_rectangle(
+                x0, y0, x1, y1, outline="", **self.style.cell_rect[""]
+            ))
+            self.cell_texts.append(self.canvas.create_text(
+                (x0 + x1) / 2, (y0 + y1) / 2, text="", **self.style.cell_text[""]
+            ))
+        
+        # Winning line, hidden until a game is won
+        self.winning_line = self.canvas.create_line(
+            0, 0, 0, 0,
+            width=max(3, round(self.cell_pixels / 15)),
+            capstyle="round",
+            state="hidden",
+            **self.style.line
+        )
+        
+        # Built by create_secondary_ui once the board is on screen
+        self.play_again_btn = None
+        self.score_label = None
+        
+        # Initialize score
+        if self.stats_store is not None:
+            self.x_score = self.stats_store.wins("X")
+            self.o_score = self.stats_store.wins("O")
+        else:
+            self.x_score = 0
+            self.o_score = 0
+        # Set once the finished game is counted, cleared when a new one starts
+        self.game_recorded = False
+        
+        # Last rendered state, so updates only touch items that changed
+        self.rendered_cells = [""] * (self.size * self.size)
+        self.rendered_status = ("Player X's Turn", "normal")
+        self.rendered_play_again = "disabled"
+        self.winning_cells = []
         
-        # Configure grid weights
-        for i in range(3):
-            self.board_frame.grid_rowconfigure(i, weight=1)
-            self.board_frame.grid_columnconfigure(i, weight=1)
+        # F2 cycles through the themes
+        self.window.bind("<F2>", lambda event: self.next_theme())
+        
+        # Build the rest once the board has been drawn for the first time
+        self.expose_binding = self.canvas.bind("<Expose>", self.on_first_expose, "+")
+    
+    def themed(self, widget_class, parent, role, **options):
+        """Create a widget with its role's theme options and track it for theme switches"""
+        widget = widget_class(parent, **self.style.widgets[role], **options)
+        self.themed_widgets.append((widget, role))
+        return widget
+    
+    def on_first_expose(self, event):
+        """Schedule the secondary widgets behind the board's first paint"""
+        self.canvas.unbind("<Expose>", self.expose_binding)
+        self.window.after_idle(self.create_secondary_ui)
+    
+    def create_secondary_ui(self):
+        """Create the Play Again button, controls and score below the board"""
+        main_frame = self.main_frame
         
         # Play Again button - visible and prominent
-        play_again_frame = tk.Frame(main_frame, bg=self.bg_color)
+        play_again_frame = self.themed(tk.Frame, main_frame, "frame")
         play_again_frame.pack(pady=20)
         
-        self.play_again_btn = tk.Button(
-            play_again_frame,
+        self.play_again_btn = self.themed(
+            tk.Button, play_again_frame, "play_again",
             text="Play Again",
-            font=("Helvetica", 24, "bold"),
-            bg="#00ff00",  # Bright green to be very visible
-            fg="#000000",  # Black text for contrast
             padx=80,
             pady=30,
             relief="raised",
             bd=5,
-            command=self.on_new_game
+            state=self.rendered_play_again,
+            command=self.on_play_again
         )
         self.play_again_btn.pack()
-        # Start disabled
-        self.play_again_btn.configure(state="disabled")
         
         # Control buttons
-        control_frame = tk.Frame(main_frame, bg=self.bg_color)
+        control_frame = self.themed(tk.Frame, main_frame, "frame")
         control_frame.pack(pady=30)
         
         # New game button
-        new_game_btn = tk.Button(
-            control_frame,
+        new_game_btn = self.themed(
+            tk.Button, control_frame, "new_game",
             text="New Game",
-            font=("Helvetica", 14, "bold"),
-            bg="#3182ce",
-            fg=self.text_color,
             padx=30,
             pady=12,
             relief="flat",
@@ -148,12 +200,9 @@ class GameUI:
         new_game_btn.pack(side=tk.LEFT, padx=10)
         
         # Quit button
-        quit_btn = tk.Button(
-            control_frame,
+        quit_btn = self.themed(
+            tk.Button, control_frame, "quit",
             text="Quit",
-            font=("Helvetica", 14, "bold"),
-            bg="#e53e3e",
-            fg=self.text_color,
             padx=30,
             pady=12,
             relief="flat",
@@ -162,235 +211,290 @@ class GameUI:
         )
         quit_btn.pack(side=tk.LEFT, padx=10)
         
-        
         # Score display
-        score_frame = tk.Frame(main_frame, bg=self.card_color, relief="flat", bd=0)
+        score_frame = self.themed(tk.Frame, main_frame, "card", relief="flat", bd=0)
         score_frame.pack(fill="x", pady=20, ipady=10, ipadx=20)
         
-        self.score_label = tk.Label(
-            score_frame,
-            text="Score: X - 0 | O - 0",
-            font=("Helvetica", 12),
-            fg="#a0a0a0",
-            bg=self.card_color
-        )
+        self.score_label = self.themed(tk.Label, score_frame, "score", text=self.score_text())
         self.score_label.pack()
-        
-        # Initialize score
-        self.x_score = 0
-        self.o_score = 0
-        
+    
+    def cell_bounds(self, pos):
+        """Get the canvas rectangle of a cell"""
+        row, col = divmod(pos, self.size)
+        gap = self.cell_gap
+        return (
+            col * self.cell_pixels + gap,
+            row * self.cell_pixels + gap,
+            (col + 1) * self.cell_pixels - gap,
+            (row + 1) * self.cell_pixels - gap,
+        )
+    
+    def cell_center(self, pos):
+        """Get the canvas coordinates of a cell's center"""
+        row, col = divmod(pos, self.size)
+        return (col + 0.5) * self.cell_pixels, (row + 0.5) * self.cell_pixels
     
     def draw_winning_line(self, combo):
         """Draw a line through the winning combination"""
-        if not combo or len(combo) < 3:
+        if not combo or len(combo) < 2:
             return
-        # TODO: Draw a line through the winning combination
-        # Just rely on the button highlighting for now
-        # The orange background with larger font makes it clear enough
-        pass
+        start_x, start_y = self.cell_center(combo[0])
+        end_x, end_y = self.cell_center(combo[-1])
+        
+        # Extend the line a little past the outer cell centers
+        reach = self.cell_pixels * 0.3
+        length = ((end_x - start_x) ** 2 + (end_y - start_y) ** 2) ** 0.5
+        dx = (end_x - start_x) / length * reach
+        dy = (end_y - start_y) / length * reach
+        self.canvas.coords(self.winning_line, start_x - dx, start_y - dy, end_x + dx, end_y + dy)
+        self.canvas.itemconfigure(self.winning_line, state="normal")
+        self.canvas.tag_raise(self.winning_line)
     
-    def pulse_winning_squares(self, combo, count):
-        """Create a pulsing effect on winning squares"""
-        if count >= 6 or not self.game_logic.is_game_over():  # Stop after 3 pulses
-            return
-            
-        if hasattr(self, 'winning_labels'):
-            for i, label in enumerate(self.winning_labels):
-                if i < len(combo):
-                    pos = combo[i]
-                    value = self.game_logic.get_board()[pos]
-                    
-                    # Alternate between bright and slightly dimmer colors
-                    if count % 2 == 0:
-                        if value == "X":
-                            bg_color = "#ff6666"  # Lighter red
-                        else:
-                            bg_color = "#66ff66"  # Lighter green
-                    else:
-                        if value == "X":
-                            bg_color = "#ff0000"  # Bright red
-                        else:
-                            bg_color = "#00ff00"  # Bright green
-                            
-                    label.configure(background=bg_color)
-            
-        # Schedule next pulse
-        self.window.after(300, lambda: self.pulse_winning_squares(combo, count + 1))
+    def pulse_winning_squares(self, combo):
+        """Pulse the winning squares three times"""
+        self.pulse_ramp = self.style.pulse[self.game_logic.get_board()[combo[0]]]
+        self.animations.start(Animation(
+            0.6, len(self.pulse_ramp), self.paint_pulse, easing=pulse, cycles=3
+        ))
     
+    def paint_pulse(self, step):
+        """Color the winning squares for one step of the pulse"""
+        fill = self.pulse_ramp[step]
+        for pos in self.winning_cells:
+            self.canvas.itemconfigure(self.cell_rects[pos], fill=fill)
+    
+    def on_canvas_click(self, event):
+        """Map a click on the board canvas to a cell"""
+        row = int(event.y // self.cell_pixels)
+        col = int(event.x // self.cell_pixels)
+        if 0 <= row < self.size and 0 <= col < self.size:
+            self.on_button_click(row, col)
     
     def on_button_click(self, row, col):
-        """Handle button click"""
-        position = row * 3 + col
+        """Handle a click on a board cell"""
+        if self.spectating:
+            return
+        position = row * self.size + col
+        if self.network_client is not None:
+            self.network_client.send_move(position)
+            return
         if self.on_move_callback(position):
             # Update display immediately to show the move
             self.update_display()
     
     def on_new_game(self):
         """Handle new game button click"""
+        if self.spectating:
+            return
+        if self.network_client is not None:
+            # The board is reset when the server confirms with RESET
+            self.network_client.request_new_game()
+            return
+        self.reset_board()
+    
+    def on_play_again(self):
+        """Handle a Play Again click"""
+        self.on_new_game()
+    
+    def reset_board(self):
+        """Start a new game and clear the board"""
         self.game_logic.reset_game()
-        
-        # Clean up winning labels
-        if hasattr(self, 'winning_labels'):
-            for label in self.winning_labels:
-                label.destroy()
-            self.winning_labels = []
+        self.game_recorded = False
+        if self.on_new_game_callback:
+            self.on_new_game_callback()
+        self.clear_highlight()
         
         # Disable Play Again button for new game
-        self.play_again_btn.configure(state="disabled")
+        self.set_play_again_state("disabled")
             
         self.update_display()
     
+    def clear_highlight(self):
+        """Stop the pulse and clear the winning highlight and line"""
+        self.animations.cancel_all()
+        for pos in self.winning_cells:
+            self.canvas.itemconfigure(self.cell_texts[pos], self.style.cell_text[""])
+            self.rendered_cells[pos] = None
+        self.winning_cells = []
+        self.canvas.itemconfigure(self.winning_line, state="hidden")
+    
     def update_display(self):
-        """Update the game display"""
+        """Update the game display
+        
+        Only widgets whose rendered value changed since the last call are
+        reconfigured; Tk redraws them on its next idle pass.
+        """
         # Update status
         if self.game_logic.is_game_over():
+            # Count the game once, however often the finished board is redrawn
+            if not self.game_recorded:
+                self.record_result()
             if self.game_logic.get_winner():
-                self.status_label.config(
-                    text=f"Player {self.game_logic.get_winner()} Wins!",
-                    fg=self.win_color
-                )
-                # Update score
-                if self.game_logic.get_winner() == "X":
-                    self.x_score += 1
-                else:
-                    self.o_score += 1
-                self.score_label.config(text=f"Score: X - {self.x_score} | O - {self.o_score}")
+                self.set_status(f"Player {self.game_logic.get_winner()} Wins!", "win")
                 
                 # Draw winning line
                 winning_combo = self.game_logic.get_winning_combo()
                 if winning_combo:
                     self.draw_winning_line(winning_combo)
-                    
-                # Enable Play Again button
-                self.play_again_btn.configure(state="normal")
             else:
-                self.status_label.config(
-                    text="It's a Tie!",
-                    fg="#a0a0a0"
-                )
-                # Enable Play Again button for ties too
-                self.play_again_btn.configure(state="normal")
+                self.set_status("It's a Tie!", "tie")
+            # Enable Play Again button for wins and ties
+            self.set_play_again_state("normal")
+        elif self.thinking:
+            self.set_status(
+                f"Player {self.game_logic.get_current_player()} is thinking...", "info"
+            )
+            self.set_play_again_state("disabled")
         else:
-            self.status_label.config(
-                text=f"Player {self.game_logic.get_current_player()}'s Turn",
-                fg=self.text_color
+            self.set_status(
+                f"Player {self.game_logic.get_current_player()}'s Turn", "normal"
             )
             # Disable Play Again button during active game
-            self.play_again_btn.configure(state="disabled")
-        
-        # Get winning combo first to know which buttons to handle differently
-        winning_combo = self.game_logic.get_winning_combo()
-        winning_positions = set(winning_combo) if winning_combo else set()
+            self.set_play_again_state("disabled")
         
-        # Update buttons with guaranteed visibility and proper contrast
+        # Update only the cells whose value changed
         board = self.game_logic.get_board()
-        for i in range(3):
-            for j in range(3):
-                button = self.buttons[i][j]
-                pos = i * 3 + j
-                value = board[pos]
-                
-                # Skip winning buttons for now - they'll be handled separately
-                if pos in winning_positions:
-                    button.configure(text=value)
-                    continue
-                
-                # Completely reconfigure the button for guaranteed visibility
-                if value == "X":
-                    # Bright red background with white text for X
-                    button.configure(
-                        text="X",
-                        background="#ff4757",  # Bright red
-                        foreground="#ffffff",  # Pure white
-                        disabledforeground="#ffffff",  # White when disabled
-                        state="disabled",
-                        font=("Helvetica", 24, "bold"),  # Keep consistent font
-                        width=8,  # Maintain fixed width
-                        height=4,  # Maintain fixed height
-                        relief="flat",
-                        bd=0
-                    )
-                    # Force immediate update
-                    button.update_idletasks()
-                    button.update()
-                    
-                elif value == "O":
-                    # Bright green background with white text for O
-                    button.configure(
-                        text="O",
-                        background="#2ed573",  # Bright green
-                        foreground="#ffffff",  # Pure white
-                        disabledforeground="#ffffff",  # White when disabled
-                        state="disabled",
-                        font=("Helvetica", 24, "bold"),  # Keep consistent font
-                        width=8,  # Maintain fixed width
-                        height=4,  # Maintain fixed height
-                        relief="flat",
-                        bd=0
-                    )
-                    # Force immediate update
-                    button.update_idletasks()
-                    button.update()
-                    
-                else:
-                    # Empty button
-                    button.configure(
-                        text="",
-                        background=self.button_bg,
-                        foreground=self.text_color,
-                        state="normal",
-                        font=("Helvetica", 24, "bold"),
-                        width=8,  # Maintain fixed width
-                        height=4,  # Maintain fixed height
-                        relief="flat",
-                        bd=0
-                    )
-                    # Force immediate update
-                    button.update_idletasks()
-                    button.update()
+        for pos, value in enumerate(board):
+            if value != self.rendered_cells[pos]:
+                self.render_cell(pos, value)
         
         # Highlight winning combination with animation effect
-        if winning_combo:
-            # Store winning labels for cleanup
-            if not hasattr(self, 'winning_labels'):
-                self.winning_labels = []
-                
-            # Apply special styling to winning squares
+        winning_combo = self.game_logic.get_winning_combo()
+        if winning_combo and not self.winning_cells:
+            self.winning_cells = list(winning_combo)
             for pos in winning_combo:
-                row, col = pos // 3, pos % 3
-                value = self.game_logic.get_board()[pos]
-                button = self.buttons[row][col]
-                
-                # Hide the button
-                button.configure(state="disabled", relief="flat", bd=0)
+                self.render_winning_cell(pos, board[pos])
+            self.canvas.tag_raise(self.winning_line)
                 
-                # Create a label overlay with winning colors
-                if value == "X":
-                    bg_color = "#ff0000"  # Bright red for X wins
-                    fg_color = "#ffffff"  # White text
-                else:
-                    bg_color = "#00ff00"  # Bright green for O wins
-                    fg_color = "#000000"  # Black text
-                
-                # Create label at button position
-                label = tk.Label(
-                    self.board_frame,
-                    text=value,
-                    background=bg_color,
-                    foreground=fg_color,
-                    font=("Helvetica", 44, "bold"),
-                    relief="raised",
-                    bd=5
+            # Pulse the winning squares on the shared animation tick
+            self.pulse_winning_squares(winning_combo)
+    
+    def record_result(self):
+        """Store the finished game and add it to the score"""
+        self.game_recorded = True
+        winner = self.game_logic.get_winner()
+        if self.stats_store is not None:
+            self.stats_store.record_game(
+                winner, self.game_logic.get_winning_combo(),
+                self.game_logic.to_record(), self.size, self.game_logic.win_length
+            )
+        if winner == "X":
+            self.x_score += 1
+        elif winner == "O":
+            self.o_score += 1
+        if winner and self.score_label is not None:
+            self.score_label.config(text=self.score_text())
+    
+    def render_cell(self, pos, value):
+        """Redraw one board cell for its new value"""
+        self.canvas.itemconfigure(self.cell_rects[pos], self.style.cell_rect[value])
+        self.canvas.itemconfigure(self.cell_texts[pos], text=value)
+        self.rendered_cells[pos] = value
+    
+    def render_winning_cell(self, pos, mark):
+        """Give a cell of the winning combination its winning colors"""
+        self.canvas.itemconfigure(self.cell_rects[pos], self.style.win_rect[mark])
+        self.canvas.itemconfigure(self.cell_texts[pos], self.style.win_text[mark])
+    
+    def poll_network(self):
+        """Apply server events without blocking the Tk main loop"""
+        for event in self.network_client.poll():
+            command = event[0]
+            if command == "JOINED":
+                self.network_client.mark = event[2]
+                self.window.title(f"Tic-Tac-Toe - Player {event[2]}")
+                self.set_status(f"You are {event[2]} - waiting for opponent", "info")
+            elif command == "START":
+                self.update_display()
+            elif command == "MOVED":
+                self.game_logic.make_move(int(event[2]))
+                self.update_display()
+            elif command == "RESET":
+                self.reset_board()
+            elif command == "SNAPSHOT":
+                self.board_mismatch = (
+                    (int(event[2]), int(event[3])) != (self.size, self.game_logic.win_length)
                 )
-                
-                # Place label over button
-                label.grid(row=row, column=col, padx=3, pady=3, sticky="nsew")
-                self.winning_labels.append(label)
-                
-            # Add a pulsing effect by scheduling color changes
-            self.pulse_winning_squares(winning_combo, 0)
+                if self.board_mismatch:
+                    self.set_status(f"Room plays {event[2]}x{event[2]}, "
+                                    f"{event[3]} in a row", "info")
+                    continue
+                self.window.title(f"Tic-Tac-Toe - Watching {self.network_client.room}")
+                self.clear_highlight()
+                moves = list(self.game_logic.history)
+                apply_message(self.game_logic, event)
+                # Only a different game counts again; a resent snapshot does not
+                if self.game_logic.history != moves:
+                    self.game_recorded = False
+                self.update_display()
+            elif command == "DELTA":
+                if self.board_mismatch:
+                    continue
+                apply_message(self.game_logic, event)
+                self.update_display()
+            elif command == "ERROR":
+                self.set_status(f"Server: {' '.join(event[1:])}", "info")
+            elif command == "LEFT":
+                self.set_status("Opponent left the game", "info")
+            elif command == "CLOSED":
+                self.set_status("Disconnected from server", "info")
+                return
+        self.window.after(self.network_poll_ms, self.poll_network)
+    
+    def set_status(self, text, kind):
+        """Update the status label if its text or kind changed
+        
+        kind is one of "normal", "win", "tie" or "info" and picks the color.
+        """
+        if (text, kind) != self.rendered_status:
+            self.status_label.config(text=text, fg=self.style.status_colors[kind])
+            self.rendered_status = (text, kind)
+    
+    def set_play_again_state(self, state):
+        """Enable or disable the Play Again button if its state changed"""
+        if state != self.rendered_play_again:
+            if self.play_again_btn is not None:
+                self.play_again_btn.configure(state=state)
+            self.rendered_play_again = state
+    
+    def score_text(self):
+        """Get the text of the score display"""
+        return f"Score: X - {self.x_score} | O - {self.o_score}"
+    
+    def next_theme(self):
+        """Switch to the theme after the current one"""
+        names = list(THEMES)
+        current = next(
+            (name for name, styles in THEMES.items() if styles is self.style.styles), names[-1]
+        )
+        self.set_theme(THEMES[names[(names.index(current) + 1) % len(names)]])
+    
+    def set_theme(self, styles):
+        """Apply another GameStyles theme, reconfiguring only what it changes
+        
+        Fonts are updated in place by the style cache; widgets and canvas
+        items are only touched when the options of their role differ.
+        """
+        changed = self.style.load(styles)
+        for widget, role in self.themed_widgets:
+            if role in changed:
+                widget.configure(self.style.widgets[role])
+        
+        if "status_colors" in changed:
+            kind = self.rendered_status[1]
+            self.status_label.config(fg=self.style.status_colors[kind])
+        if "line" in changed:
+            self.canvas.itemconfigure(self.winning_line, self.style.line)
         
-        # Force the entire window to update
-        self.window.update_idletasks()
-        self.window.update() 
\ No newline at end of file
+        winning = set(self.winning_cells)
+        if changed & {"cell_rect", "cell_text"}:
+            for pos, value in enumerate(self.rendered_cells):
+                if pos not in winning and value is not None:
+                    self.canvas.itemconfigure(self.cell_rects[pos], self.style.cell_rect[value])
+                    self.canvas.itemconfigure(self.cell_texts[pos], self.style.cell_text[value])
+        if winning and changed & {"win_rect", "win_text", "pulse"}:
+            board = self.game_logic.get_board()
+            mark = board[self.winning_cells[0]]
+            self.pulse_ramp = self.style.pulse[mark]
+            for pos in self.winning_cells:
+                self.render_winning_cell(pos, mark)
@@ -0,0 +1,141 @@
+"""
+Tic-Tac-Toe Instrumentation
+Opt-in timing of hot paths and counting of Tk configure calls
+
+Nothing here runs unless Profiler.install() is called: it replaces the
+measured methods on their classes with timing wrappers and uninstall()
+puts the originals back, so a game started without --profile runs the
+unmodified code.
+"""
+
+import math
+import sys
+import time
+import tkinter as tk
+from collections import Counter
+from functools import wraps
+
+from animation import AnimationScheduler
+from game_logic import BitboardGameLogic, GameLogic
+from game_ui import GameUI
+
+# Four buckets per power of two: each bucket spans about 19% of its value
+BUCKETS_PER_OCTAVE = 4
+
+# (class, method, report label) for every timed method
+TIMED_METHODS = (
+    (GameLogic, "make_move", "make_move"),
+    (BitboardGameLogic, "make_move", "make_move"),
+    (GameLogic, "check_winner", "check_winner"),
+    (BitboardGameLogic, "check_winner", "check_winner"),
+    (GameUI, "update_display", "update_display"),
+    (AnimationScheduler, "tick", "animation tick"),
+)
+
+# Tk methods that reconfigure a widget or canvas item
+CONFIGURE_METHODS = (
+    (tk.Misc, "configure"),
+    (tk.Misc, "config"),
+    (tk.Canvas, "itemconfigure"),
+    (tk.Canvas, "itemconfig"),
+)
+
+
+class Histogram:
+    """Log-bucketed latency histogram in nanoseconds"""
+
+    def __init__(self):
+        self.buckets = Counter()
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, nanoseconds):
+        """Record one measurement"""
+        self.buckets[int(math.log2(nanoseconds + 1) * BUCKETS_PER_OCTAVE)] += 1
+        self.count += 1
+        self.total += nanoseconds
+        if nanoseconds > self.max:
+            self.max = nanoseconds
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return 0
+        rank = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self.max, 2 ** ((bucket + 1) / BUCKETS_PER_OCTAVE))
+        return self.max
+
+
+class Profiler:
+    """Times the game's hot paths and counts Tk configure calls"""
+
+    def __init__(self):
+        self.histograms = {}
+        self.configure_calls = Counter()
+        self._originals = []
+
+    def install(self):
+        """Wrap the measured methods"""
+        if self._originals:
+            return
+        for owner, name, label in TIMED_METHODS:
+            self._patch(owner, name, self._timed(getattr(owner, name), label))
+        for owner, name in CONFIGURE_METHODS:
+            self._patch(owner, name, self._counted(getattr(owner, name), name))
+
+    def uninstall(self):
+        """Restore the original methods"""
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals = []
+
+    def _patch(self, owner, name, wrapper):
+        self._originals.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, wrapper)
+
+    def _timed(self, method, label):
+        histogram = self.histograms.setdefault(label, Histogram())
+        clock = time.perf_counter_ns
+
+        @wraps(method)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                histogram.add(clock() - start)
+        return timed
+
+    def _counted(self, method, name):
+        calls = self.configure_calls
+
+        @wraps(method)
+        def counted(widget, *args, **kwargs):
+            calls[f"{type(widget).__name__}.{name}"] += 1
+            return method(widget, *args, **kwargs)
+        return counted
+
+    def report(self):
+        """Format the measurements as a table"""
+        lines = [f"{'path':<16}{'calls':>9}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}{'max us':>10}"]
+        for label, histogram in self.histograms.items():
+            if not histogram.count:
+                continue
+            p50, p95, p99 = (histogram.percentile(p) / 1000 for p in (0.5, 0.95, 0.99))
+            lines.append(
+                f"{label:<16}{histogram.count:>9}{p50:>10.1f}{p95:>10.1f}"
+                f"{p99:>10.1f}{histogram.max / 1000:>10.1f}"
+            )
+        lines.append("Tk configure calls:")
+        for name, count in self.configure_calls.most_common():
+            lines.append(f"  {name:<26}{count:>9}")
+        return "\n".join(lines)
+
+    def dump(self, stream=None):
+        """Print the report (to stderr by default)"""
+        print(self.report(), file=stream or sys.stderr)
@@ -0,0 +1,139 @@
+"""
+Tic-Tac-Toe Server Load Generator
+Holds many idle connections open while active pairs play, and reports
+per-move latency
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from game_logic import GameLogic
+from server import raise_file_limit
+
+
+async def read_until(reader, command):
+    """Read lines until one starts with command, returning its words"""
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        words = line.decode().split()
+        if words and words[0] == command:
+            return words
+
+
+async def open_idle(host, port, count, batch=500):
+    """Open count connections, each alone in its own room"""
+    writers = []
+    for start in range(0, count, batch):
+        connections = await asyncio.gather(*(
+            asyncio.open_connection(host, port) for _ in range(min(batch, count - start))
+        ))
+        for index, (reader, writer) in enumerate(connections):
+            writer.write(f"JOIN idle-{start + index}\n".encode())
+        for reader, writer in connections:
+            await read_until(reader, "JOINED")
+            writers.append(writer)
+    return writers
+
+
+async def play_pair(host, port, room, games, latencies, rng):
+    """Play random games between two connections, recording move latency"""
+    players = {}
+    for mark in ("X", "O"):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"JOIN {room}\n".encode())
+        await read_until(reader, "JOINED")
+        players[mark] = (reader, writer)
+    for reader, _ in players.values():
+        await read_until(reader, "START")
+
+    game = GameLogic()
+    for _ in range(games):
+        while not game.is_game_over():
+            mark = game.get_current_player()
+            other = "O" if mark == "X" else "X"
+            position = rng.choice([pos for pos, value in enumerate(game.board) if not value])
+            reader, writer = players[mark]
+            start = time.perf_counter()
+            writer.write(f"MOVE {position}\n".encode())
+            await read_until(reader, "MOVED")
+            latencies.append(time.perf_counter() - start)
+            await read_until(players[other][0], "MOVED")
+            game.make_move(position)
+        for reader, _ in players.values():
+            await read_until(reader, "OVER")
+        players["X"][1].write(b"NEW\n")
+        for reader, _ in players.values():
+            await read_until(reader, "RESET")
+        game.reset_game()
+
+    for _, writer in players.values():
+        writer.close()
+
+
+async def run(host, port, idle, pairs, games, seed):
+    """Run the load test and return the list of move latencies"""
+    idle_writers = await open_idle(host, port, idle)
+    print(f"{len(idle_writers)} idle connections open")
+
+    rng = random.Random(seed)
+    latencies = []
+    await asyncio.gather(*(
+        play_pair(host, port, f"load-{pair}", games, latencies, random.Random(rng.random()))
+        for pair in range(pairs)
+    ))
+
+    for writer in idle_writers:
+        writer.close()
+    return latencies
+
+
+def main(argv=None):
+    """Run the load generator from the command line"""
+    parser = argparse.ArgumentParser(description="Load test the Tic-Tac-Toe server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--idle", type=int, default=10000, help="idle connections to hold open")
+    parser.add_argument("--pairs", type=int, default=20, help="pairs of active players")
+    parser.add_argument("--games", type=int, default=20, help="games per active pair")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spawn-server", action="store_true",
+                        help="start server.py in a subprocess for the run")
+    args = parser.parse_args(argv)
+
+    raise_file_limit()
+    server = None
+    if args.spawn_server:
+        server_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+        server = subprocess.Popen(
+            [sys.executable, server_script, "--host", args.host, "--port", str(args.port)],
+            stdout=subprocess.PIPE,
+        )
+        server.stdout.readline()  # Wait for "Serving on ..."
+    try:
+        latencies = asyncio.run(
+            run(args.host, args.port, args.idle, args.pairs, args.games, args.seed)
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    count = len(latencies_ms)
+    print(f"moves: {count}")
+    print(f"latency ms  mean {statistics.mean(latencies_ms):.3f}  "
+          f"p50 {latencies_ms[count // 2]:.3f}  "
+          f"p99 {latencies_ms[min(count - 1, int(count * 0.99))]:.3f}  "
+          f"max {latencies_ms[-1]:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,36 +3,290 @@ Tic-Tac-Toe Game
 Main entry point - sets up the game window and connects components
 """
 
-import tkinter as tk
-from game_logic import GameLogic
-from game_ui import GameUI
+import argparse
+from game_logic import BACKENDS, create_game_logic
+from scheduler import EXECUTORS, FrameMonitor, MoveScheduler
+
+# Tkinter, the UI and the opponents are imported where they are first needed,
+# so this module stays cheap to import and the board appears sooner
 
 class TicTacToeGame:
     """Main game class that connects logic and UI"""
     
-    def __init__(self):
+    def __init__(self, backend="list", size=3, win_length=None,
+                 opponent=None, ai_player="O", network_client=None,
+                 ai_executor="thread", frame_stats=False, profiler=None,
+                 stats_store=None, theme="dark", record=None):
+        import tkinter as tk
+        from game_ui import GameUI
+        from styles import THEMES
+        
         # Create main window
         self.window = tk.Tk()
         self.window.title("Tic-Tac-Toe")
         self.window.geometry("500x900")
         self.window.resizable(False, False)
-        self.window.configure(bg="#0f0f23")
         
         # Create game logic
-        self.game_logic = GameLogic()
+        self.game_logic = create_game_logic(backend, size, win_length)
+        
+        # Computer opponent (None for two human players)
+        self.opponent = opponent
+        self.ai_player = ai_player
+        self.scheduler = None
+        if opponent is not None:
+            self.scheduler = MoveScheduler(
+                self.window, opponent, self.on_ai_move, executor=ai_executor
+            )
+        
+        # Optional check that the main loop never stalls
+        self.frame_monitor = FrameMonitor(self.window) if frame_stats else None
+        
+        # Hot-path timings, printed on F12 and when the window closes
+        self.profiler = profiler
+        if profiler is not None:
+            self.window.bind("<F12>", lambda event: profiler.dump())
+        
+        # Create UI with callbacks
+        self.network_client = network_client
+        self.stats_store = stats_store
+        self.ui = GameUI(
+            self.window, self.game_logic, self.on_move, self.on_new_game,
+            network_client=network_client, stats_store=stats_store,
+            styles=THEMES[theme]
+        )
         
-        # Create UI with callback
-        self.ui = GameUI(self.window, self.game_logic, self.on_move)
+        # Optional recording of the player's input for replay_harness.py
+        self.recorder = None
+        if record is not None:
+            from replay_harness import EventRecorder
+            self.recorder = EventRecorder(self.ui, record, {
+                "backend": backend, "size": self.game_logic.size,
+                "win_length": self.game_logic.win_length,
+                "opponent": type(opponent).__name__ if opponent is not None else None,
+            })
+        self.on_new_game()
+        self.ui.update_display()
     
     def on_move(self, position):
         """Handle a move from the UI"""
-        return self.game_logic.make_move(position)
+        if self.is_ai_turn():
+            return False
+        if not self.game_logic.make_move(position):
+            return False
+        self.play_ai_move()
+        return True
+    
+    def on_new_game(self):
+        """Drop any search from the last game; the computer may open"""
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+            self.ui.thinking = False
+        self.play_ai_move()
+    
+    def is_ai_turn(self):
+        """Check if the computer opponent is to move"""
+        return (
+            self.opponent is not None
+            and not self.game_logic.is_game_over()
+            and self.game_logic.get_current_player() == self.ai_player
+        )
+    
+    def play_ai_move(self):
+        """Start the computer opponent's search if it is its turn"""
+        if self.is_ai_turn() and not self.scheduler.thinking:
+            self.ui.thinking = True
+            self.scheduler.request_move(self.game_logic)
+    
+    def on_ai_move(self, position):
+        """Apply the computer's move once its search finishes"""
+        self.ui.thinking = False
+        self.game_logic.make_move(position)
+        self.ui.update_display()
     
     def run(self):
         """Start the game"""
+        if self.frame_monitor is not None:
+            self.frame_monitor.start()
         self.window.mainloop()
+        if self.frame_monitor is not None:
+            print(self.frame_monitor.report())
+            print(self.ui.animations.report())
+        if self.profiler is not None:
+            self.profiler.dump()
+        if self.scheduler is not None:
+            self.scheduler.close()
+        if hasattr(self.opponent, "close"):
+            self.opponent.close()
+        if self.network_client is not None:
+            self.network_client.close()
+        if self.stats_store is not None:
+            self.stats_store.close()
+        if self.recorder is not None:
+            self.recorder.close()
+
+def parse_args(argv=None):
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe")
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default="list",
+        help="board representation used by the game logic",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=3,
+        help="number of rows and columns on the board",
+    )
+    parser.add_argument(
+        "--win-length",
+        type=int,
+        default=None,
+        help="marks in a row needed to win (defaults to the board size)",
+    )
+    parser.add_argument(
+        "--ai",
+        choices=["minimax", "learned", "mcts"],
+        default=None,
+        help="play against a computer opponent",
+    )
+    parser.add_argument(
+        "--ai-player",
+        choices=["X", "O"],
+        default="O",
+        help="which mark the computer plays",
+    )
+    parser.add_argument(
+        "--ai-depth",
+        type=int,
+        default=None,
+        help="maximum search depth in plies (unlimited by default)",
+    )
+    parser.add_argument(
+        "--ai-time",
+        type=float,
+        default=2.0,
+        help="time budget per computer move in seconds",
+    )
+    parser.add_argument(
+        "--ai-workers",
+        type=int,
+        default=1,
+        help="processes for root-parallel search, used with --ai mcts",
+    )
+    parser.add_argument(
+        "--ai-executor",
+        choices=sorted(EXECUTORS),
+        default="thread",
+        help="where the computer opponent searches, off the window's thread",
+    )
+    parser.add_argument(
+        "--theme",
+        choices=["dark", "light"],
+        default="dark",
+        help="color theme (F2 switches while playing)",
+    )
+    parser.add_argument(
+        "--frame-stats",
+        action="store_true",
+        help="print how long the main loop was blocked when the window closes",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time hot paths and count Tk configure calls (report on F12 and exit)",
+    )
+    parser.add_argument(
+        "--stats",
+        default="stats.db",
+        help="SQLite file that keeps every finished game and the score",
+    )
+    parser.add_argument(
+        "--no-stats",
+        action="store_true",
+        help="do not record games or keep the score between runs",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        default=None,
+        help="record clicks, New Game and Play Again for replay_harness.py",
+    )
+    parser.add_argument(
+        "--book",
+        default=None,
+        help="opening book file built by opening_book.py (3x3 only)",
+    )
+    parser.add_argument(
+        "--policy",
+        default=None,
+        help="value table trained by rl_trainer.py, used with --ai learned "
+             "(value_table.bin by default)",
+    )
+    parser.add_argument(
+        "--connect",
+        metavar="HOST:PORT",
+        default=None,
+        help="play online through a server started with server.py",
+    )
+    parser.add_argument(
+        "--room",
+        default="lobby",
+        help="room to join on the server",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="with --connect, follow the room's game as a spectator instead of playing",
+    )
+    args = parser.parse_args(argv)
+    # Fail here rather than inside the executor, where the UI would wait forever
+    if args.ai == "learned" and (args.size != 3 or args.win_length not in (None, 3)):
+        parser.error("--ai learned only plays 3x3 games with three in a row")
+    return args
+
+def create_opponent(args):
+    """Create the computer opponent chosen on the command line, if any"""
+    if args.ai == "minimax":
+        from ai import NegamaxAI
+        from opening_book import OpeningBook
+        book = OpeningBook(args.book) if args.book else None
+        return NegamaxAI(max_depth=args.ai_depth, time_limit=args.ai_time, book=book)
+    if args.ai == "learned":
+        from rl_trainer import DEFAULT_TABLE_PATH, LearnedStrategy
+        return LearnedStrategy.load(args.policy or DEFAULT_TABLE_PATH)
+    if args.ai == "mcts":
+        from mcts import MCTSAI
+        return MCTSAI(budget_ms=args.ai_time * 1000, workers=args.ai_workers)
+    return None
 
 # Create and run the game
 if __name__ == "__main__":
-    game = TicTacToeGame()
-    game.run()
\ No newline at end of file
+    args = parse_args()
+    profiler = None
+    if args.profile:
+        from instrumentation import Profiler
+        profiler = Profiler()
+        profiler.install()
+    opponent = create_opponent(args)
+    network_client = None
+    if args.connect:
+        from network_client import NetworkClient
+        host, _, port = args.connect.rpartition(":")
+        network_client = NetworkClient(
+            host or "127.0.0.1", int(port), args.room, spectate=args.watch
+        )
+    stats_store = None
+    # Games watched as a spectator are not the player's own
+    if not args.no_stats and not args.watch:
+        from stats_store import StatsStore
+        stats_store = StatsStore(args.stats)
+    game = TicTacToeGame(
+        backend=args.backend, size=args.size, win_length=args.win_length,
+        opponent=opponent, ai_player=args.ai_player, network_client=network_client,
+        ai_executor=args.ai_executor, frame_stats=args.frame_stats, profiler=profiler,
+        stats_store=stats_store, theme=args.theme, record=args.record
+    )
+    game.run()
@@ -0,0 +1,299 @@
+"""
+Tic-Tac-Toe Monte Carlo Tree Search
+MCTS opponent for boards too large for exhaustive search
+"""
+
+import math
+import random
+import threading
+import time
+
+from game_logic import _cell_line_masks
+from symmetry import CELL_CODES
+
+
+class RolloutBoard:
+    """Copy-free playout state: bitmasks plus an O(1) list of empty cells
+
+    Moves are played and undone in place, so a rollout never copies the board.
+    """
+    __slots__ = ("cell_masks", "masks", "empty", "slot", "player", "moves")
+
+    def __init__(self, board, current_player, size, win_length):
+        self.cell_masks = _cell_line_masks(size, win_length)
+        self.masks = [0, 0, 0]
+        self.empty = []
+        self.slot = [-1] * (size * size)
+        for pos, value in enumerate(board):
+            if value:
+                self.masks[CELL_CODES[value]] |= 1 << pos
+            else:
+                self.slot[pos] = len(self.empty)
+                self.empty.append(pos)
+        self.player = CELL_CODES[current_player]
+        self.moves = []
+
+    def play(self, position):
+        """Play for the side to move; return True if it completes a line"""
+        empty = self.empty
+        slot = self.slot
+        index = slot[position]
+        last = empty.pop()
+        if last != position:
+            empty[index] = last
+            slot[last] = index
+        slot[position] = -1
+
+        player = self.player
+        mask = self.masks[player] | 1 << position
+        self.masks[player] = mask
+        self.moves.append(position)
+        self.player = 3 - player
+        for _, line_mask in self.cell_masks[position]:
+            if mask & line_mask == line_mask:
+                return True
+        return False
+
+    def undo(self):
+        """Take back the last move played"""
+        position = self.moves.pop()
+        self.player = 3 - self.player
+        self.masks[self.player] &= ~(1 << position)
+        self.slot[position] = len(self.empty)
+        self.empty.append(position)
+
+
+class Node:
+    """Search tree node for the position after ``move`` by ``mover``"""
+    __slots__ = ("move", "mover", "parent", "children", "untried", "visits", "value", "winner")
+
+    def __init__(self, move, mover, parent, untried, winner=None):
+        self.move = move
+        self.mover = mover
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.value = 0.0
+        # None while the game goes on; 0 for a tie, else the winning player code
+        self.winner = winner
+
+
+# Id of the latest cancelled parallel search, shared with the parent;
+# each pool worker inherits it at start
+_worker_stopped_id = None
+
+
+def _init_worker(stopped_id):
+    """Keep the parent's cancelled search id in a pool worker"""
+    global _worker_stopped_id
+    _worker_stopped_id = stopped_id
+
+
+class _WorkerCancel:
+    """Cancel event of one parallel search, as seen from a pool worker"""
+    __slots__ = ("search_id",)
+
+    def __init__(self, search_id):
+        self.search_id = search_id
+
+    def is_set(self):
+        return _worker_stopped_id.value >= self.search_id
+
+
+def _root_visits(task):
+    """Search from a position in a worker process and return root child visits"""
+    board, current_player, size, win_length, budget_ms, seed, exploration, search_id = task
+    player = MCTSAI(budget_ms, exploration=exploration, rng=random.Random(seed))
+    root = player._grow(board, current_player, size, win_length, (), _WorkerCancel(search_id))
+    return {child.move: child.visits for child in root.children}
+
+
+class MCTSAI:
+    """Monte Carlo Tree Search opponent with a per-move time budget
+
+    The tree is kept between moves: when the game's history extends the
+    position the tree was built for, the matching subtree becomes the new
+    root. With ``workers`` > 1, independent searches run in a process pool
+    (root parallelism) and their root visit counts are summed. A search
+    ends early once its ``cancel`` event is set, by the caller or through
+    ``stop``; parallel workers see it through a shared search id.
+    """
+
+    def __init__(self, budget_ms=1000, workers=1, exploration=1.4, rng=None):
+        self.budget_ms = budget_ms
+        self.workers = workers
+        self.exploration = exploration
+        self.rng = rng or random.Random()
+        self.root = None
+        self.root_history = ()
+        self.last_iterations = 0
+        self._executor = None
+        # Cancel event of the latest search, set by stop
+        self._cancel = None
+        # Parallel searches started, and the id of the latest one cancelled
+        self._search_id = 0
+        self._stopped_id = None
+
+    def choose_move(self, game_logic, cancel=None):
+        """Choose a move for the current player within the time budget
+
+        cancel is an event the caller can set to end the search early, even
+        before it has started; by default each search gets a fresh one.
+        """
+        cancel = self._cancel = cancel if cancel is not None else threading.Event()
+        board = list(game_logic.get_board())
+        if "" not in board:
+            raise ValueError("No moves left on the board")
+        if self.workers > 1:
+            return self._choose_parallel(game_logic, board, cancel)
+        root = self._grow(
+            board, game_logic.get_current_player(), game_logic.size,
+            game_logic.win_length, tuple(game_logic.history), cancel,
+        )
+        best = max(root.children, key=lambda child: child.visits)
+        return best.move
+
+    def stop(self):
+        """Make a running search return its best move so far"""
+        if self._cancel is not None:
+            self._cancel.set()
+
+    def _grow(self, board, current_player, size, win_length, history, cancel):
+        """Search the position for the time budget and return the tree root"""
+        rollout = RolloutBoard(board, current_player, size, win_length)
+        root = self._reuse_root(history)
+        if root is None:
+            root = Node(None, 3 - rollout.player, None, list(rollout.empty))
+        self.root = root
+        self.root_history = history
+
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        self.last_iterations = self._search(root, rollout, deadline, cancel)
+        return root
+
+    def _search(self, root, board, deadline, cancel):
+        """Run MCTS iterations from root until the deadline or cancel, returning the count"""
+        rng = self.rng
+        exploration = self.exploration
+        iterations = 0
+        log = math.log
+        sqrt = math.sqrt
+        while True:
+            iterations += 1
+            if not iterations & 15 and (time.perf_counter() > deadline or cancel.is_set()):
+                return iterations
+            node = root
+            played = 0
+
+            # Selection
+            while not node.untried and node.children and node.winner is None:
+                scale = exploration * sqrt(log(node.visits))
+                best = None
+                best_score = -1.0
+                for child in node.children:
+                    score = child.value / child.visits + scale / sqrt(child.visits)
+                    if score > best_score:
+                        best_score = score
+                        best = child
+                node = best
+                board.play(node.move)
+                played += 1
+
+            # Expansion
+            if node.untried and node.winner is None:
+                untried = node.untried
+                index = rng.randrange(len(untried))
+                untried[index], untried[-1] = untried[-1], untried[index]
+                move = untried.pop()
+                mover = board.player
+                won = board.play(move)
+                played += 1
+                if won:
+                    child = Node(move, mover, node, [], mover)
+                elif not board.empty:
+                    child = Node(move, mover, node, [], 0)
+                else:
+                    child = Node(move, mover, node, list(board.empty))
+                node.children.append(child)
+                node = child
+
+            # Rollout
+            winner = node.winner
+            if winner is None:
+                while True:
+                    mover = board.player
+                    won = board.play(board.empty[rng.randrange(len(board.empty))])
+                    played += 1
+                    if won:
+                        winner = mover
+                        break
+                    if not board.empty:
+                        winner = 0
+                        break
+            for _ in range(played):
+                board.undo()
+
+            # Backpropagation
+            while node is not None:
+                node.visits += 1
+                if winner == node.mover:
+                    node.value += 1.0
+                elif winner == 0:
+                    node.value += 0.5
+                node = node.parent
+
+    def _reuse_root(self, history):
+        """Find the subtree for the current position in the previous tree"""
+        root = self.root
+        known = len(self.root_history)
+        if root is None or history[:known] != self.root_history:
+            return None
+        for move in history[known:]:
+            for child in root.children:
+                if child.move == move:
+                    root = child
+                    break
+            else:
+                return None
+        root.parent = None
+        return root
+
+    def _choose_parallel(self, game_logic, board, cancel):
+        """Root-parallel search across worker processes"""
+        # Imported here: the process pool machinery is slow to import
+        from concurrent.futures import wait
+        if self._executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            context = multiprocessing.get_context()
+            self._stopped_id = context.Value("q", 0)
+            self._executor = ProcessPoolExecutor(
+                self.workers, mp_context=context,
+                initializer=_init_worker, initargs=(self._stopped_id,),
+            )
+        # Ids only grow, so a cancelled id never needs resetting
+        self._search_id += 1
+        search_id = self._search_id
+        tasks = [
+            (board, game_logic.get_current_player(), game_logic.size, game_logic.win_length,
+             self.budget_ms, self.rng.random(), self.exploration, search_id)
+            for _ in range(self.workers)
+        ]
+        futures = [self._executor.submit(_root_visits, task) for task in tasks]
+        # Pass a cancel on to the workers while they search
+        while wait(futures, timeout=0.01).not_done:
+            if cancel.is_set() and self._stopped_id.value < search_id:
+                self._stopped_id.value = search_id
+        totals = {}
+        for future in futures:
+            for move, count in future.result().items():
+                totals[move] = totals.get(move, 0) + count
+        self.last_iterations = sum(totals.values())
+        return max(totals, key=totals.get)
+
+    def close(self):
+        """Shut down the worker pool, if any"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,70 @@
+"""
+Tic-Tac-Toe Network Client
+Connects the Tk UI to a game server without blocking the main loop
+"""
+
+import queue
+import socket
+import threading
+
+
+class NetworkClient:
+    """Line-protocol connection to server.py
+
+    A daemon thread reads server lines into ``events`` as lists of words;
+    the UI drains the queue from the Tk main loop. Sends are single small
+    writes and return immediately. With ``spectate`` the client watches
+    the room instead of taking a seat and receives SNAPSHOT and DELTA lines.
+    """
+
+    def __init__(self, host, port, room, spectate=False):
+        self.sock = socket.create_connection((host, port))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.events = queue.Queue()
+        self.mark = None
+        self.room = room
+        self.spectating = spectate
+        self.reader = threading.Thread(target=self._read_loop, daemon=True)
+        self.reader.start()
+        self.send(f"{'WATCH' if spectate else 'JOIN'} {room}")
+
+    def _read_loop(self):
+        """Queue every line from the server until the connection closes"""
+        try:
+            with self.sock.makefile("r", encoding="ascii", newline="\n") as lines:
+                for line in lines:
+                    words = line.split()
+                    if words:
+                        self.events.put(words)
+        except OSError:
+            pass
+        self.events.put(["CLOSED"])
+
+    def send(self, line):
+        """Send one protocol line"""
+        try:
+            self.sock.sendall(line.encode("ascii") + b"\n")
+        except OSError:
+            self.events.put(["CLOSED"])
+
+    def send_move(self, position):
+        """Submit a move; it is applied when the server echoes MOVED"""
+        self.send(f"MOVE {position}")
+
+    def request_new_game(self):
+        """Ask the server to start a new game in this room"""
+        self.send("NEW")
+
+    def poll(self):
+        """Get all events received so far without blocking"""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def close(self):
+        """Leave the room and close the connection"""
+        self.send("QUIT")
+        self.sock.close()
@@ -0,0 +1,145 @@
+"""
+Tic-Tac-Toe Opening Book
+Solves every reachable 3x3 position once and serves the results from a
+memory-mapped file
+
+File layout: an 8-byte header (magic, version, board size, padding) followed
+by one byte per base-3 board encoding, 3**9 entries in all. The low nibble of
+each entry is the best move (NO_MOVE when the position is terminal or
+unreachable), and bits 4-5 hold the value for the player to move.
+"""
+
+import argparse
+import mmap
+import struct
+
+from game_logic import WINNING_COMBINATIONS
+from symmetry import CELL_CODES, encode
+
+MAGIC = b"TTTB"
+VERSION = 1
+HEADER = struct.Struct("<4sBBxx")
+ENTRY_COUNT = 3 ** 9
+NO_MOVE = 0x0F
+
+# Game-theoretic values for the player to move, as stored in bits 4-5
+UNREACHABLE, LOSS, DRAW, WIN = 0, 1, 2, 3
+VALUE_NAMES = {LOSS: "loss", DRAW: "draw", WIN: "win"}
+
+
+def _winner(cells):
+    """Get the winning cell code on a board of integer cells, or 0"""
+    for a, b, c in WINNING_COMBINATIONS:
+        if cells[a] and cells[a] == cells[b] == cells[c]:
+            return cells[a]
+    return 0
+
+
+def solve_positions():
+    """Solve every reachable position
+
+    Returns a dict mapping base-3 encoding to (score, best move) for the
+    player to move. A positive score is a win, larger when it comes sooner;
+    terminal positions have best move None.
+    """
+    solved = {}
+
+    def solve(cells, player):
+        key = encode(cells)
+        if key in solved:
+            return solved[key][0]
+        stones = 9 - cells.count(0)
+        if _winner(cells):
+            # The previous player just completed a line
+            result = (-(10 - stones), None)
+        elif stones == 9:
+            result = (0, None)
+        else:
+            result = None
+            for pos in range(9):
+                if cells[pos]:
+                    continue
+                cells[pos] = player
+                score = -solve(cells, 3 - player)
+                cells[pos] = 0
+                if result is None or score > result[0]:
+                    result = (score, pos)
+        solved[key] = result
+        return result[0]
+
+    solve([0] * 9, CELL_CODES["X"])
+    return solved
+
+
+def build_book(path):
+    """Solve all positions and write the book file, returning the state count"""
+    solved = solve_positions()
+    table = bytearray(ENTRY_COUNT)
+    for key, (score, move) in solved.items():
+        value = WIN if score > 0 else LOSS if score < 0 else DRAW
+        table[key] = value << 4 | (NO_MOVE if move is None else move)
+
+    with open(path, "wb") as book_file:
+        book_file.write(HEADER.pack(MAGIC, VERSION, 3))
+        book_file.write(table)
+    return len(solved)
+
+
+class OpeningBook:
+    """Read-only view of a solved-position file
+
+    The file is memory-mapped, so opening it costs no parsing and its pages
+    are shared by every process that maps it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as book_file:
+            self._map = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or size != 3:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+        if len(self._map) != HEADER.size + ENTRY_COUNT:
+            self._map.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __reduce__(self):
+        # Worker processes map the file again instead of copying it
+        return type(self), (self.path,)
+
+    def lookup(self, board):
+        """Get (best move, value) for a 3x3 board, or None if not in the book
+
+        ``best move`` is None for finished positions; ``value`` is WIN, DRAW
+        or LOSS for the player to move.
+        """
+        entry = self._map[HEADER.size + encode([CELL_CODES[v] for v in board])]
+        value = entry >> 4
+        if value == UNREACHABLE:
+            return None
+        move = entry & 0x0F
+        return (None if move == NO_MOVE else move), value
+
+    def close(self):
+        """Unmap the book file"""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    """Build an opening book from the command line"""
+    parser = argparse.ArgumentParser(description="Build the 3x3 opening book")
+    parser.add_argument("path", nargs="?", default="opening_book.bin")
+    args = parser.parse_args(argv)
+    count = build_book(args.path)
+    print(f"Wrote {count} positions to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""
+Tic-Tac-Toe Replay Harness
+Records timestamped GameUI input and replays it to measure UI latency
+
+A session is a JSONL file: a header with the board settings, then one
+line per cell click, New Game or Play Again with its time in seconds
+since recording started. Replaying drives a real GameUI at the recorded
+pace (or faster) and reports how long each event took to handle, how
+late it was dispatched, and how many ``after`` callbacks were pending.
+Timers still pending once the replay has settled have leaked.
+
+Replay needs a display; in CI run it under Xvfb:
+
+    xvfb-run python replay_harness.py session.jsonl --speed 4
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from game_logic import BACKENDS, create_game_logic
+
+# Recorded GameUI methods and the event names they are written as
+RECORDED_METHODS = (
+    ("on_button_click", "click"),
+    ("on_new_game", "new_game"),
+    ("on_play_again", "play_again"),
+)
+
+
+def pending_afters(window):
+    """Number of after and after_idle callbacks waiting in the Tcl interpreter"""
+    return len(window.tk.splitlist(window.tk.call("after", "info")))
+
+
+class EventRecorder:
+    """Writes GameUI input events to a session file as they happen
+
+    Install it before the window's main loop starts: the Play Again and
+    New Game buttons are built after the first paint and pick up the
+    recording methods then.
+    """
+
+    def __init__(self, ui, path, settings):
+        self.ui = ui
+        self.file = open(path, "w", buffering=1)
+        self.file.write(json.dumps(settings) + "\n")
+        self.start = time.perf_counter()
+        self.handling = False
+        for method, event in RECORDED_METHODS:
+            setattr(ui, method, self._recording(getattr(ui, method), event))
+
+    def _recording(self, method, event):
+        size = self.ui.size
+
+        def recorded(*args):
+            # Play Again goes through on_new_game; only the outer call is input
+            if self.handling:
+                return method(*args)
+            entry = {"t": round(time.perf_counter() - self.start, 4), "event": event}
+            if event == "click":
+                row, col = args
+                entry["position"] = row * size + col
+            self.file.write(json.dumps(entry) + "\n")
+            self.handling = True
+            try:
+                return method(*args)
+            finally:
+                self.handling = False
+        return recorded
+
+    def close(self):
+        """Stop recording and close the session file"""
+        for method, _ in RECORDED_METHODS:
+            self.ui.__dict__.pop(method, None)
+        self.file.close()
+
+
+def load_session(path):
+    """Read a session file and return (settings, events)"""
+    with open(path) as session_file:
+        lines = [json.loads(line) for line in session_file if line.strip()]
+    if not lines:
+        raise ValueError(f"Session {path} is empty")
+    return lines[0], lines[1:]
+
+
+def synthetic_session(path, games=20, size=3, win_length=None, seed=0,
+                      click_ms=150, burst=5, burst_ms=20):
+    """Write a session of random games, each ending in a burst of New Game clicks
+
+    The burst arrives while the winning squares are still pulsing, the
+    sequence that used to back up the event loop.
+    """
+    rng = random.Random(seed)
+    game = create_game_logic("list", size, win_length)
+    events = []
+    now = 0.0
+    for _ in range(games):
+        while not game.is_game_over():
+            position = rng.choice([pos for pos, value in enumerate(game.get_board()) if not value])
+            game.make_move(position)
+            now += click_ms / 1000
+            events.append({"t": round(now, 4), "event": "click", "position": position})
+        for index in range(burst):
+            now += (click_ms if index == 0 else burst_ms) / 1000
+            events.append({"t": round(now, 4), "event": "play_again" if index == 0 else "new_game"})
+        game.reset_game()
+
+    settings = {"backend": "list", "size": size, "win_length": game.win_length, "opponent": None}
+    with open(path, "w") as session_file:
+        for entry in (settings, *events):
+            session_file.write(json.dumps(entry) + "\n")
+
+
+class ReplayReport:
+    """Per-event measurements of a replay"""
+
+    def __init__(self):
+        self.events = []
+        self.final_pending = None
+
+    def add(self, event, latency, lag, pending):
+        """Record one dispatched event"""
+        self.events.append((event, latency, lag, pending))
+
+    def summary(self):
+        """Latency and lag percentiles in milliseconds per event kind"""
+        kinds = {}
+        for event, latency, lag, pending in self.events:
+            kinds.setdefault(event, []).append((latency, lag, pending))
+        summary = {}
+        for event, rows in kinds.items():
+            latencies = sorted(row[0] * 1000 for row in rows)
+            lags = sorted(row[1] * 1000 for row in rows)
+            summary[event] = {
+                "count": len(rows),
+                "latency_p50_ms": latencies[len(latencies) // 2],
+                "latency_p95_ms": latencies[int(len(latencies) * 0.95)],
+                "latency_max_ms": latencies[-1],
+                "lag_p95_ms": lags[int(len(lags) * 0.95)],
+                "lag_max_ms": lags[-1],
+                "pending_max": max(row[2] for row in rows),
+            }
+        return summary
+
+    def format(self):
+        """Format the summary as a table"""
+        lines = [
+            f"{'event':<12}{'count':>7}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"
+            f"{'lag p95':>9}{'lag max':>9}{'afters':>8}"
+        ]
+        for event, row in self.summary().items():
+            lines.append(
+                f"{event:<12}{row['count']:>7}{row['latency_p50_ms']:>9.2f}"
+                f"{row['latency_p95_ms']:>9.2f}{row['latency_max_ms']:>9.2f}"
+                f"{row['lag_p95_ms']:>9.2f}{row['lag_max_ms']:>9.2f}{row['pending_max']:>8}"
+            )
+        lines.append(f"after callbacks still pending once settled: {self.final_pending}")
+        return "\n".join(lines)
+
+
+class Replayer:
+    """Replays a session against a real window and GameUI
+
+    Events are dispatched from ``after`` callbacks at their recorded time
+    divided by ``speed``; a speed of 0 dispatches each event as soon as
+    the previous one has been handled. Latency covers the handler and the
+    idle redraw it triggers; lag is how late the main loop got round to
+    the event.
+    """
+
+    def __init__(self, settings, events, speed=1.0, settle=2.5):
+        # Imported here so generating sessions does not need Tk
+        from main import TicTacToeGame
+
+        if settings.get("opponent"):
+            print(f"note: recorded against {settings['opponent']}; replaying both sides "
+                  "from the recorded clicks only", file=sys.stderr)
+        self.game = TicTacToeGame(
+            backend=settings.get("backend", "list"), size=settings["size"],
+            win_length=settings.get("win_length"),
+        )
+        self.window = self.game.window
+        self.ui = self.game.ui
+        self.events = events
+        self.speed = speed
+        self.settle = settle
+        self.report = ReplayReport()
+        self.next_index = 0
+        self.start = None
+
+    def run(self):
+        """Replay every event, let the window settle, and return the report"""
+        # Wait for the widgets built after the first paint
+        deadline = time.perf_counter() + 5
+        while self.ui.play_again_btn is None and time.perf_counter() < deadline:
+            self.window.update()
+        self.start = time.perf_counter()
+        self.schedule_next()
+        self.window.mainloop()
+        self.window.destroy()
+        return self.report
+
+    def due_time(self, index):
+        """When an event should be dispatched on the perf_counter clock"""
+        if not self.speed:
+            return time.perf_counter()
+        return self.start + self.events[index]["t"] / self.speed
+
+    def schedule_next(self):
+        """Schedule the next event, or the settle check after the last one"""
+        if self.next_index == len(self.events):
+            self.window.after(round(self.settle * 1000), self.finish)
+            return
+        due = self.due_time(self.next_index)
+        delay = max(0, round((due - time.perf_counter()) * 1000))
+        self.window.after(delay, self.dispatch, due)
+
+    def dispatch(self, due):
+        """Handle one event and measure it"""
+        entry = self.events[self.next_index]
+        self.next_index += 1
+        start = time.perf_counter()
+        event = entry["event"]
+        if event == "click":
+            self.ui.on_button_click(*divmod(entry["position"], self.ui.size))
+        elif event == "new_game":
+            self.ui.on_new_game()
+        elif event == "play_again":
+            self.ui.on_play_again()
+        else:
+            raise ValueError(f"Unknown event {event!r} in session")
+        self.window.update_idletasks()
+        latency = time.perf_counter() - start
+        self.report.add(event, latency, max(0.0, start - due), pending_afters(self.window))
+        self.schedule_next()
+
+    def finish(self):
+        """Count timers that outlived the replay and stop the main loop"""
+        self.report.final_pending = pending_afters(self.window)
+        self.window.quit()
+
+
+def main(argv=None):
+    """Replay a session, or generate a synthetic one, from the command line"""
+    parser = argparse.ArgumentParser(description="Replay recorded GameUI input and report latency")
+    parser.add_argument("session", help="session file recorded with main.py --record")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed factor; 0 replays as fast as possible")
+    parser.add_argument("--settle", type=float, default=2.5,
+                        help="seconds to wait after the last event before counting timers")
+    parser.add_argument("--max-latency-ms", type=float, default=None,
+                        help="fail if any event takes longer to handle")
+    parser.add_argument("--max-pending", type=int, default=0,
+                        help="fail if more after callbacks are pending once settled")
+    parser.add_argument("--output", help="write the summary to this JSON file")
+    parser.add_argument("--generate", type=int, metavar="GAMES", default=None,
+                        help="write a synthetic session of random games instead of replaying")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default=None,
+                        help="replay on this backend instead of the recorded one")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.generate is not None:
+        synthetic_session(args.session, args.generate, args.size, args.win_length, args.seed)
+        print(f"wrote {args.session}")
+        return 0
+
+    import tkinter as tk
+
+    settings, events = load_session(args.session)
+    if args.backend:
+        settings["backend"] = args.backend
+    try:
+        replayer = Replayer(settings, events, args.speed, args.settle)
+    except tk.TclError as error:
+        print(f"no display: {error}", file=sys.stderr)
+        return 2
+    report = replayer.run()
+    print(report.format())
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"events": report.summary(), "final_pending": report.final_pending},
+                      output_file, indent=2)
+
+    failures = []
+    worst = max((latency for _, latency, _, _ in report.events), default=0.0) * 1000
+    if args.max_latency_ms is not None and worst > args.max_latency_ms:
+        failures.append(f"slowest event took {worst:.1f} ms (limit {args.max_latency_ms} ms)")
+    if report.final_pending > args.max_pending:
+        failures.append(f"{report.final_pending} after callbacks leaked "
+                        f"(limit {args.max_pending})")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Tic-Tac-Toe Reinforcement Learning
+Self-play TD(0) trainer with a dense value table and a learned strategy
+
+The value table holds, for every canonical 3x3 position, the estimated
+probability that X wins from it. It is a float32 array indexed by the
+canonical base-3 board encoding, so symmetric positions share one entry.
+"""
+
+import argparse
+import os
+import random
+import struct
+from array import array
+from multiprocessing import Pool
+
+from game_logic import GameLogic
+from symmetry import CELL_CODES, canonical_table
+
+MAGIC = b"TTTV"
+VERSION = 1
+HEADER = struct.Struct("<4sBxxx")
+STATE_COUNT = 3 ** 9
+POWERS = tuple(3 ** pos for pos in range(9))
+DEFAULT_TABLE_PATH = "value_table.bin"
+
+
+def new_table():
+    """Value table with every position at an even chance"""
+    return array("f", [0.5]) * STATE_COUNT
+
+
+def save_table(table, path):
+    """Write a value table to disk atomically"""
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as table_file:
+        table_file.write(HEADER.pack(MAGIC, VERSION))
+        table.tofile(table_file)
+    os.replace(temporary, path)
+
+
+def load_table(path):
+    """Read a value table written by save_table"""
+    with open(path, "rb") as table_file:
+        magic, version = HEADER.unpack(table_file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} value table")
+        table = array("f")
+        table.fromfile(table_file, STATE_COUNT)
+    return table
+
+
+def _choose(game_logic, code, table, canonical, rng, epsilon):
+    """Pick a move, returning (position, was exploratory)"""
+    player = CELL_CODES[game_logic.get_current_player()]
+    free = [pos for pos, value in enumerate(game_logic.get_board()) if not value]
+    if rng.random() < epsilon:
+        return rng.choice(free), True
+
+    # X maximises and O minimises the chance that X wins
+    sign = 1.0 if player == 1 else -1.0
+    best_value = None
+    best_moves = []
+    for pos in free:
+        value = sign * table[canonical[code + player * POWERS[pos]]]
+        if best_value is None or value > best_value:
+            best_value = value
+            best_moves = [pos]
+        elif value == best_value:
+            best_moves.append(pos)
+    return rng.choice(best_moves), False
+
+
+def train(table, episodes, alpha=0.1, epsilon=0.1, seed=None):
+    """Play self-play episodes through GameLogic, updating table in place"""
+    canonical = canonical_table(3)
+    rng = random.Random(seed)
+    game_logic = GameLogic()
+    for _ in range(episodes):
+        game_logic.reset_game()
+        code = 0
+        previous = None
+        while not game_logic.is_game_over():
+            player = CELL_CODES[game_logic.get_current_player()]
+            position, exploratory = _choose(game_logic, code, table, canonical, rng, epsilon)
+            game_logic.make_move(position)
+            code += player * POWERS[position]
+            state = canonical[code]
+
+            if game_logic.is_game_over():
+                winner = game_logic.get_winner()
+                table[state] = 1.0 if winner == "X" else 0.0 if winner == "O" else 0.5
+
+            # Back up the new afterstate's value, except after exploratory moves
+            if previous is not None and not exploratory:
+                table[previous] += alpha * (table[state] - table[previous])
+            previous = state
+    return table
+
+
+def _train_worker(task):
+    """Train a copy of the table and return it (runs in a worker process)"""
+    table_bytes, episodes, alpha, epsilon, seed = task
+    table = array("f")
+    table.frombytes(table_bytes)
+    train(table, episodes, alpha, epsilon, seed)
+    return table.tobytes()
+
+
+def merge_tables(tables):
+    """Average several value tables entry by entry"""
+    merged = array("f", tables[0])
+    count = len(tables)
+    for other in tables[1:]:
+        for index, value in enumerate(other):
+            merged[index] += value
+    for index in range(STATE_COUNT):
+        merged[index] /= count
+    return merged
+
+
+def train_parallel(table, episodes, workers=4, sync_every=5000, alpha=0.1,
+                   epsilon=0.1, seed=0, checkpoint=None, checkpoint_every=1):
+    """Train across worker processes, merging their tables every round
+
+    Each round, every worker plays sync_every episodes from the merged table;
+    the results are averaged. The table is checkpointed every
+    checkpoint_every rounds when a path is given.
+    """
+    rounds = max(1, episodes // (workers * sync_every))
+    with Pool(workers) as pool:
+        for round_index in range(rounds):
+            tasks = [
+                (table.tobytes(), sync_every, alpha, epsilon, seed + round_index * workers + worker)
+                for worker in range(workers)
+            ]
+            tables = []
+            for result in pool.map(_train_worker, tasks):
+                worker_table = array("f")
+                worker_table.frombytes(result)
+                tables.append(worker_table)
+            table = merge_tables(tables)
+            if checkpoint and (round_index + 1) % checkpoint_every == 0:
+                save_table(table, checkpoint)
+    if checkpoint:
+        save_table(table, checkpoint)
+    return table
+
+
+class LearnedStrategy:
+    """Plays greedily from a trained value table (3x3 only)"""
+
+    def __init__(self, table, rng=None):
+        self.table = table
+        self.canonical = canonical_table(3)
+        self.rng = rng or random.Random()
+
+    @classmethod
+    def load(cls, path=DEFAULT_TABLE_PATH, rng=None):
+        """Create a strategy from a value table file"""
+        return cls(load_table(path), rng)
+
+    def choose_move(self, game_logic):
+        """Choose the move with the best learned value"""
+        if game_logic.size != 3 or game_logic.win_length != 3:
+            raise ValueError("The learned strategy only plays 3x3 games")
+        code = 0
+        for pos, value in enumerate(game_logic.get_board()):
+            code += CELL_CODES[value] * POWERS[pos]
+        position, _ = _choose(game_logic, code, self.table, self.canonical, self.rng, 0.0)
+        return position
+
+
+def main(argv=None):
+    """Train a value table from the command line"""
+    parser = argparse.ArgumentParser(description="Self-play TD(0) trainer")
+    parser.add_argument("--episodes", type=int, default=200000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--sync-every", type=int, default=5000,
+                        help="episodes each worker plays between merges")
+    parser.add_argument("--alpha", type=float, default=0.1)
+    parser.add_argument("--epsilon", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", default=DEFAULT_TABLE_PATH)
+    parser.add_argument("--checkpoint-every", type=int, default=1,
+                        help="merge rounds between checkpoints")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue from the existing checkpoint")
+    args = parser.parse_args(argv)
+
+    table = new_table()
+    if args.resume and os.path.exists(args.checkpoint):
+        table = load_table(args.checkpoint)
+
+    if args.workers == 1:
+        rounds = max(1, args.episodes // args.sync_every)
+        for round_index in range(rounds):
+            train(table, args.sync_every, args.alpha, args.epsilon, args.seed + round_index)
+            if (round_index + 1) % args.checkpoint_every == 0:
+                save_table(table, args.checkpoint)
+        save_table(table, args.checkpoint)
+    else:
+        table = train_parallel(
+            table, args.episodes, args.workers, args.sync_every, args.alpha,
+            args.epsilon, args.seed, args.checkpoint, args.checkpoint_every,
+        )
+    print(f"Saved value table to {args.checkpoint}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Tic-Tac-Toe Move Scheduler
+Runs computer opponents off the Tk main thread and measures frame times
+"""
+
+import threading
+import time
+
+EXECUTORS = {"thread", "process"}
+
+# The opponent held by each worker process in process mode
+_worker_opponent = None
+
+
+def _init_worker(opponent):
+    """Keep the opponent for the lifetime of a worker process"""
+    global _worker_opponent
+    _worker_opponent = opponent
+
+
+def _choose_in_worker(logic_class, size, win_length, record):
+    """Rebuild the position in a worker process and choose a move there"""
+    game_logic = logic_class(size, win_length)
+    game_logic.replay(record)
+    return _worker_opponent.choose_move(game_logic)
+
+
+class MoveScheduler:
+    """Searches for opponent moves in the background
+
+    ``request_move`` hands a snapshot of the game to a single worker thread
+    (or process) and returns at once. The Tk thread polls the result with
+    ``window.after`` and passes the move to ``on_result``. ``cancel`` drops
+    the pending search. An opponent with a ``stop`` method also takes a
+    ``cancel`` event in ``choose_move``: a thread worker gets a fresh one
+    per request, set by ``cancel``, so a stop cannot be lost however early
+    it lands. A process worker is abandoned to finish on its own.
+    """
+
+    def __init__(self, window, opponent, on_result, executor="thread", poll_ms=20):
+        if executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor {executor!r}; choose from {', '.join(sorted(EXECUTORS))}"
+            )
+        self.window = window
+        self.opponent = opponent
+        self.on_result = on_result
+        self.executor_kind = executor
+        self.poll_ms = poll_ms
+        self.executor = None
+        self.future = None
+        self.cancel_event = None
+        self.poll_id = None
+        self.started = None
+        self.search_times = []
+
+    @property
+    def thinking(self):
+        """Whether a search is in progress"""
+        return self.future is not None
+
+    def request_move(self, game_logic):
+        """Start searching for a move in the current position"""
+        self.cancel()
+        if self.executor is None:
+            # Imported on first use to keep the window's startup fast
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+            if self.executor_kind == "process":
+                self.executor = ProcessPoolExecutor(
+                    1, initializer=_init_worker, initargs=(self.opponent,)
+                )
+            else:
+                self.executor = ThreadPoolExecutor(1, thread_name_prefix="opponent")
+
+        # The worker gets its own copy, so the board can be redrawn meanwhile
+        record = game_logic.to_record()
+        if self.executor_kind == "process":
+            self.future = self.executor.submit(
+                _choose_in_worker, type(game_logic), game_logic.size,
+                game_logic.win_length, record,
+            )
+        else:
+            snapshot = type(game_logic)(game_logic.size, game_logic.win_length)
+            snapshot.replay(record)
+            if hasattr(self.opponent, "stop"):
+                self.cancel_event = threading.Event()
+                self.future = self.executor.submit(
+                    self.opponent.choose_move, snapshot, self.cancel_event
+                )
+            else:
+                self.future = self.executor.submit(self.opponent.choose_move, snapshot)
+        self.started = time.perf_counter()
+        self.poll_id = self.window.after(self.poll_ms, self.poll)
+
+    def poll(self):
+        """Deliver a finished search on the Tk thread, or check again later"""
+        self.poll_id = None
+        future = self.future
+        if future is None:
+            return
+        if not future.done():
+            self.poll_id = self.window.after(self.poll_ms, self.poll)
+            return
+        self.future = None
+        self.cancel_event = None
+        self.search_times.append(time.perf_counter() - self.started)
+        self.on_result(future.result())
+
+    def cancel(self):
+        """Forget the pending search, if any"""
+        if self.poll_id is not None:
+            self.window.after_cancel(self.poll_id)
+            self.poll_id = None
+        future = self.future
+        if future is None:
+            return
+        self.future = None
+        cancel_event, self.cancel_event = self.cancel_event, None
+        if future.cancel():
+            return
+        if self.executor_kind == "process":
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        elif cancel_event is not None:
+            cancel_event.set()
+
+    def close(self):
+        """Cancel any search and release the worker"""
+        self.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+class FrameMonitor:
+    """Measures how late the Tk main loop runs a callback due every frame
+
+    A lateness above one frame means some handler blocked the loop for
+    longer than a frame.
+    """
+
+    def __init__(self, window, frame_ms=16):
+        self.window = window
+        self.frame_ms = frame_ms
+        self.frames = 0
+        self.late_frames = 0
+        self.max_gap_ms = 0.0
+        self.total_gap_ms = 0.0
+        self.last = None
+        self.after_id = None
+
+    def start(self):
+        """Begin sampling frames"""
+        self.last = time.perf_counter()
+        self.after_id = self.window.after(self.frame_ms, self.tick)
+
+    def tick(self):
+        """Record the gap since the previous frame and schedule the next"""
+        now = time.perf_counter()
+        gap_ms = (now - self.last) * 1000
+        self.last = now
+        self.frames += 1
+        self.total_gap_ms += gap_ms
+        self.max_gap_ms = max(self.max_gap_ms, gap_ms)
+        if gap_ms > 2 * self.frame_ms:
+            self.late_frames += 1
+        self.after_id = self.window.after(self.frame_ms, self.tick)
+
+    def stop(self):
+        """Stop sampling frames"""
+        if self.after_id is not None:
+            self.window.after_cancel(self.after_id)
+            self.after_id = None
+
+    def report(self):
+        """Summarise the frame gaps measured so far"""
+        if not self.frames:
+            return "frames: none sampled"
+        return (
+            f"frames: {self.frames}  mean gap {self.total_gap_ms / self.frames:.1f} ms  "
+            f"max gap {self.max_gap_ms:.1f} ms  "
+            f"blocked over one frame: {self.late_frames}"
+        )
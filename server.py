@@ -0,0 +1,268 @@
+"""
+Tic-Tac-Toe Network Server
+Hosts many concurrent game rooms over a line-based TCP protocol
+
+Client to server:
+    JOIN <room>       join (or create) a room; first player is X, second O
+    WATCH <room>      follow a room's game as a read-only spectator
+    MOVE <position>   play a move in the current room
+    NEW               start a new game in the current room
+    PING <token>      answered with PONG <token>
+    QUIT              leave the room and disconnect
+
+Server to client:
+    JOINED <room> <X|O>
+    START                              both seats are taken; a game left
+                                       unfinished by the previous player is
+                                       reset first with RESET
+    MOVED <X|O> <position>             sent to both players, mover included
+    OVER <X|O|TIE> [p1,p2,...]         game finished, with the winning combo
+    RESET                              a new game started
+    LEFT                               the opponent disconnected
+    PONG <token>
+    ERROR <message>
+
+Server to spectators, as described in spectator.py:
+    SNAPSHOT <seq> <size> <win_length> <p1,p2,...|->
+    DELTA <seq> <position> <X|O> [<X|O|TIE> [p1,p2,...]]
+"""
+
+import argparse
+import asyncio
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from game_logic import GamePool
+from spectator import SpectatorFeed
+
+MARKS = ("X", "O")
+
+
+class Room:
+    """One game, the writers of its (up to two) players, and its spectator feed"""
+    __slots__ = ("name", "game", "players", "feed", "spectators", "changed")
+
+    def __init__(self, name, game):
+        self.name = name
+        self.game = game
+        self.players = {}
+        self.feed = SpectatorFeed(game)
+        self.spectators = 0
+        self.changed = asyncio.Event()
+
+    def publish(self):
+        """Send the game's latest changes to the spectators"""
+        if self.spectators and self.feed.update():
+            # Wake every spectator stream waiting on the current event
+            self.changed.set()
+            self.changed = asyncio.Event()
+
+    def broadcast(self, line):
+        """Queue a line to every player in the room"""
+        data = line.encode() + b"\n"
+        for writer in self.players.values():
+            writer.write(data)
+
+
+class GameServer:
+    """Relays moves between the two clients of each room"""
+
+    def __init__(self, size=3, win_length=None):
+        self.pool = GamePool("list", size, win_length)
+        self.rooms = {}
+        self.connections = 0
+
+    async def start(self, host="127.0.0.1", port=8765):
+        """Start listening and return the asyncio server"""
+        return await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+
+    async def handle_client(self, reader, writer):
+        """Serve one client connection until it disconnects"""
+        self.connections += 1
+        room = None
+        mark = None
+        watching = None
+        stream = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                parts = line.decode(errors="replace").split()
+                if not parts:
+                    continue
+                command = parts[0].upper()
+
+                if command == "JOIN" and len(parts) == 2:
+                    if room is not None:
+                        self._send(writer, "ERROR already in a room")
+                        continue
+                    room, mark = self._join(parts[1], writer)
+                elif command == "WATCH" and len(parts) == 2:
+                    if room is not None or watching is not None:
+                        self._send(writer, "ERROR already in a room")
+                        continue
+                    watching = self._room(parts[1])
+                    watching.spectators += 1
+                    stream = asyncio.ensure_future(self._stream(watching, writer))
+                elif command == "MOVE" and len(parts) == 2:
+                    self._move(room, mark, parts[1], writer)
+                elif command == "NEW":
+                    if room is None:
+                        self._send(writer, "ERROR not in a room")
+                        continue
+                    room.game.reset_game()
+                    room.broadcast("RESET")
+                    room.publish()
+                elif command == "PING":
+                    self._send(writer, "PONG " + " ".join(parts[1:]))
+                elif command == "QUIT":
+                    break
+                else:
+                    self._send(writer, "ERROR unknown command")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            if stream is not None:
+                stream.cancel()
+            if watching is not None:
+                watching.spectators -= 1
+                self._close_if_empty(watching)
+            if room is not None:
+                self._leave(room, mark)
+            writer.close()
+
+    def _send(self, writer, line):
+        writer.write(line.encode() + b"\n")
+
+    def _room(self, name):
+        """Get a room, opening it if it does not exist"""
+        room = self.rooms.get(name)
+        if room is None:
+            room = self.rooms[name] = Room(name, self.pool.acquire())
+        return room
+
+    def _join(self, name, writer):
+        """Seat a client in a room, returning (room, mark) or (None, None)"""
+        room = self._room(name)
+        for mark in MARKS:
+            if mark not in room.players:
+                room.players[mark] = writer
+                self._send(writer, f"JOINED {name} {mark}")
+                if len(room.players) == len(MARKS):
+                    # The newcomer's board is blank, so a game in progress starts over
+                    if room.game.history:
+                        room.game.reset_game()
+                        room.broadcast("RESET")
+                        room.publish()
+                    room.broadcast("START")
+                return room, mark
+        self._send(writer, "ERROR room is full")
+        return None, None
+
+    def _move(self, room, mark, argument, writer):
+        """Validate and relay a move"""
+        if room is None:
+            self._send(writer, "ERROR not in a room")
+            return
+        game = room.game
+        if len(room.players) < len(MARKS):
+            self._send(writer, "ERROR waiting for opponent")
+            return
+        if game.get_current_player() != mark:
+            self._send(writer, "ERROR not your turn")
+            return
+        try:
+            position = int(argument)
+        except ValueError:
+            self._send(writer, "ERROR bad position")
+            return
+        if not game.make_move(position):
+            self._send(writer, "ERROR illegal move")
+            return
+
+        room.broadcast(f"MOVED {mark} {position}")
+        room.publish()
+        if game.is_game_over():
+            winner = game.get_winner()
+            if winner:
+                combo = ",".join(map(str, game.get_winning_combo()))
+                room.broadcast(f"OVER {winner} {combo}")
+            else:
+                room.broadcast("OVER TIE")
+
+    def _leave(self, room, mark):
+        """Remove a player, closing the room when it empties"""
+        room.players.pop(mark, None)
+        if room.players:
+            room.broadcast("LEFT")
+        else:
+            self._close_if_empty(room)
+
+    def _close_if_empty(self, room):
+        """Return a room's game to the pool once no player or spectator is left"""
+        if not room.players and not room.spectators and self.rooms.get(room.name) is room:
+            del self.rooms[room.name]
+            self.pool.release(room.game)
+
+    async def _stream(self, room, writer):
+        """Send a spectator the snapshot and then every delta of a room
+
+        While the socket drains slowly the feed moves on; the next poll
+        then returns a single snapshot instead of the missed deltas.
+        """
+        subscription = room.feed.subscribe()
+        # The feed only follows the game while someone is watching
+        room.publish()
+        try:
+            while True:
+                changed = room.changed
+                lines = subscription.poll()
+                if lines:
+                    writer.write(b"".join(lines))
+                    await writer.drain()
+                else:
+                    await changed.wait()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+
+def raise_file_limit():
+    """Raise the open-file limit to its maximum so many sockets can stay open"""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def serve(host, port, size=3, win_length=None):
+    """Run a GameServer until cancelled"""
+    game_server = GameServer(size, win_length)
+    server = await game_server.start(host, port)
+    print(f"Serving on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Run the server from the command line"""
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe network server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    args = parser.parse_args(argv)
+    raise_file_limit()
+    try:
+        asyncio.run(serve(args.host, args.port, args.size, args.win_length))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Tic-Tac-Toe Headless Simulation
+Plays batches of games between strategies across a process pool, without Tk
+"""
+
+import argparse
+import os
+import time
+from collections import namedtuple
+from multiprocessing import Pool
+
+from game_logic import BACKENDS, create_game_logic
+from strategies import STRATEGY_HELP, create_strategy, strategy_spec
+
+
+class SimulationStats(namedtuple("SimulationStats", "games x_wins o_wins draws seconds")):
+    """Aggregate results of a simulation run"""
+    __slots__ = ()
+    
+    @property
+    def games_per_second(self):
+        """Throughput of the run"""
+        return self.games / self.seconds if self.seconds else 0.0
+
+
+# Per-process strategy and board instances, reused across shards
+_worker_state = {}
+
+
+def play_game(game_logic, x_strategy, o_strategy):
+    """Play one game to the end and return the winner (None for a tie)"""
+    game_logic.reset_game()
+    while not game_logic.is_game_over():
+        strategy = x_strategy if game_logic.get_current_player() == "X" else o_strategy
+        game_logic.make_move(strategy.choose_move(game_logic))
+    return game_logic.get_winner()
+
+
+def _worker_objects(config):
+    """Get this process's reusable game and strategies for a configuration"""
+    objects = _worker_state.get(config)
+    if objects is None:
+        x_name, o_name, size, win_length, backend = config
+        objects = (
+            create_game_logic(backend, size, win_length),
+            create_strategy(x_name),
+            create_strategy(o_name),
+        )
+        _worker_state[config] = objects
+    return objects
+
+
+def run_shard(task):
+    """Play a shard of games and return (x wins, o wins, draws)"""
+    games, seed, config = task
+    game_logic, x_strategy, o_strategy = _worker_objects(config)
+    for offset, strategy in enumerate((x_strategy, o_strategy)):
+        if hasattr(strategy, "rng"):
+            strategy.rng.seed(seed * 2 + offset)
+
+    x_wins = o_wins = draws = 0
+    for _ in range(games):
+        winner = play_game(game_logic, x_strategy, o_strategy)
+        if winner == "X":
+            x_wins += 1
+        elif winner == "O":
+            o_wins += 1
+        else:
+            draws += 1
+    return x_wins, o_wins, draws
+
+
+def iter_simulation(games, x_name="random", o_name="random", workers=None,
+                    size=3, win_length=None, backend="list", seed=0,
+                    shard_size=1000):
+    """Play games across a process pool, yielding running totals per shard
+
+    Each worker keeps one game and one pair of strategies and only returns
+    three counters per shard, so no per-game objects cross processes.
+    """
+    config = (x_name, o_name, size, win_length, backend)
+    tasks = []
+    remaining = games
+    while remaining > 0:
+        count = min(shard_size, remaining)
+        tasks.append((count, seed + len(tasks), config))
+        remaining -= count
+
+    workers = workers or os.cpu_count() or 1
+    x_wins = o_wins = draws = 0
+    start = time.perf_counter()
+
+    def totals(result):
+        nonlocal x_wins, o_wins, draws
+        x_wins += result[0]
+        o_wins += result[1]
+        draws += result[2]
+        return SimulationStats(
+            x_wins + o_wins + draws, x_wins, o_wins, draws,
+            time.perf_counter() - start
+        )
+
+    if workers == 1:
+        for task in tasks:
+            yield totals(run_shard(task))
+        return
+
+    with Pool(workers) as pool:
+        for result in pool.imap_unordered(run_shard, tasks):
+            yield totals(result)
+
+
+def simulate(games, **options):
+    """Play games and return the final SimulationStats"""
+    stats = SimulationStats(0, 0, 0, 0, 0.0)
+    for stats in iter_simulation(games, **options):
+        pass
+    return stats
+
+
+def main(argv=None):
+    """Run a simulation from the command line"""
+    parser = argparse.ArgumentParser(description="Simulate Tic-Tac-Toe games headlessly")
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--x", dest="x_name", type=strategy_spec, default="random",
+                        help=STRATEGY_HELP)
+    parser.add_argument("--o", dest="o_name", type=strategy_spec, default="random",
+                        help=STRATEGY_HELP)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (defaults to the CPU count)")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="list")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--shard-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    stats = SimulationStats(0, 0, 0, 0, 0.0)
+    for stats in iter_simulation(
+        args.games, x_name=args.x_name, o_name=args.o_name, workers=args.workers,
+        size=args.size, win_length=args.win_length, backend=args.backend,
+        seed=args.seed, shard_size=args.shard_size,
+    ):
+        print(f"\r{stats.games}/{args.games} games", end="", flush=True)
+    print()
+    print(f"X wins: {stats.x_wins}  O wins: {stats.o_wins}  Draws: {stats.draws}")
+    print(f"{stats.games_per_second:,.0f} games/second")
+
+
+if __name__ == "__main__":
+    main()
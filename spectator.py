@@ -0,0 +1,138 @@
+"""
+Tic-Tac-Toe Spectator Feed
+Streams one game to any number of spectators as a snapshot followed by deltas
+
+Messages are protocol lines, shared by every subscriber:
+
+    SNAPSHOT <seq> <size> <win_length> <p1,p2,...|->   the game as its moves so far
+    DELTA <seq> <position> <X|O> [<X|O|TIE> [p1,p2,...]]
+                                                        one move, with the result and
+                                                        winning combo if it ended the game
+
+Each message is encoded once into a short shared log, and a subscriber
+is only a cursor into it. Publishing a move therefore costs the same for
+one spectator or thousands. A subscriber that falls more than ``backlog``
+messages behind gets a single snapshot instead of its missed deltas.
+"""
+
+from game_logic import create_game_logic
+
+
+class SpectatorFeed:
+    """Publishes the changes of one GameLogic to its subscribers
+
+    Call ``update()`` after the game changes. New moves become deltas;
+    anything else (a reset, undo or replay) is published as a snapshot.
+    """
+
+    def __init__(self, game_logic, backlog=64):
+        self.game = game_logic
+        self.backlog = backlog
+        self.seq = 0
+        self.log = []
+        # Sequence number of the message just before log[0]
+        self.base = 0
+        self.moves = []
+        self._snapshot = None
+
+    def update(self):
+        """Publish what changed in the game since the last call; return the message count"""
+        history = self.game.history
+        published = len(self.moves)
+        if len(history) < published or history[:published] != self.moves:
+            self.moves = list(history)
+            self._publish("SNAPSHOT", self._snapshot_body())
+            return 1
+
+        last = len(history) - 1
+        for index in range(published, len(history)):
+            position = history[index]
+            body = f"{position} {'X' if index % 2 == 0 else 'O'}"
+            if index == last and self.game.is_game_over():
+                winner = self.game.get_winner()
+                if winner:
+                    body += f" {winner} {','.join(map(str, self.game.get_winning_combo()))}"
+                else:
+                    body += " TIE"
+            self.moves.append(position)
+            self._publish("DELTA", body)
+        return len(history) - published
+
+    def _publish(self, kind, body):
+        self.seq += 1
+        self.log.append(f"{kind} {self.seq} {body}\n".encode())
+        if len(self.log) > 2 * self.backlog:
+            dropped = len(self.log) - self.backlog
+            del self.log[:dropped]
+            self.base += dropped
+
+    def _snapshot_body(self):
+        moves = ",".join(map(str, self.moves)) or "-"
+        return f"{self.game.size} {self.game.win_length} {moves}"
+
+    def snapshot(self):
+        """The current state as one encoded SNAPSHOT line"""
+        if self._snapshot is None or self._snapshot[0] != self.seq:
+            line = f"SNAPSHOT {self.seq} {self._snapshot_body()}\n".encode()
+            self._snapshot = (self.seq, line)
+        return self._snapshot[1]
+
+    def subscribe(self):
+        """Start a subscription; its first poll returns a snapshot"""
+        return Subscription(self)
+
+
+class Subscription:
+    """One subscriber's position in a feed"""
+    __slots__ = ("feed", "seq", "coalesced")
+
+    def __init__(self, feed):
+        self.feed = feed
+        self.seq = None
+        self.coalesced = 0
+
+    def poll(self):
+        """Encoded lines published since the last poll
+
+        A subscriber further behind than the feed's backlog gets one
+        snapshot in place of everything it missed.
+        """
+        feed = self.feed
+        seq = self.seq
+        if seq == feed.seq:
+            return []
+        if seq is None or seq < feed.base or feed.seq - seq > feed.backlog:
+            if seq is not None:
+                self.coalesced += 1
+            self.seq = feed.seq
+            return [feed.snapshot()]
+        self.seq = feed.seq
+        return feed.log[seq - feed.base:]
+
+
+def parse_moves(field):
+    """Moves of a SNAPSHOT line as a list of positions"""
+    return [] if field == "-" else [int(position) for position in field.split(",")]
+
+
+def apply_message(game_logic, words):
+    """Apply a SNAPSHOT or DELTA line, split into words, to a spectator's game
+
+    A snapshot replays the game's moves, so winner and winning combo
+    follow from the game logic itself.
+    """
+    if words[0] == "SNAPSHOT":
+        game_logic.reset_game()
+        for position in parse_moves(words[4]):
+            game_logic.make_move(position)
+    elif words[0] == "DELTA":
+        position = int(words[2])
+        if game_logic.get_current_player() != words[3] or not game_logic.make_move(position):
+            raise ValueError(f"Delta {' '.join(words)} does not follow the spectator's game")
+    else:
+        raise ValueError(f"Not a spectator message: {words[0]}")
+
+
+def spectator_game(words, backend="list"):
+    """Create a game for the board described by a SNAPSHOT line"""
+    return create_game_logic(backend, int(words[2]), int(words[3]))
@@ -0,0 +1,178 @@
+"""
+Tic-Tac-Toe Statistics Store
+Persists every finished game to SQLite from a background writer thread
+
+Each game is a row in ``games`` (winner, winning combo and the encoded
+moves). A ``totals`` row per result is updated in the same transaction, so
+the score never needs a scan of the history and stays consistent with it
+after a crash. The database runs in WAL mode; a crash loses at most the
+batch that had not been committed yet.
+"""
+
+import argparse
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+DEFAULT_STATS_PATH = "stats.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    finished REAL NOT NULL,
+    size INTEGER NOT NULL,
+    win_length INTEGER NOT NULL,
+    winner TEXT NOT NULL,
+    winning_combo TEXT NOT NULL,
+    moves BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS totals (
+    winner TEXT PRIMARY KEY,
+    games INTEGER NOT NULL
+);
+"""
+
+# Stored winner for a tie
+TIE = ""
+
+# Queue item that tells the writer to stop
+_STOP = object()
+
+
+def _connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class StatsStore:
+    """Game history on disk, with the totals cached in memory
+
+    ``record_game`` only updates the cache and queues the row, so the UI
+    thread never touches the database. The writer thread commits queued
+    games in batches of up to ``batch_size``, waiting at most
+    ``flush_interval`` seconds for a batch to fill. A batch that fails to
+    commit is dropped, and the error is raised from the next ``flush`` or
+    ``close`` while the writer carries on with later games.
+    """
+
+    def __init__(self, path=DEFAULT_STATS_PATH, batch_size=256, flush_interval=0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        connection = _connect(path)
+        with connection:
+            connection.executescript(SCHEMA)
+        self.totals = Counter(dict(connection.execute("SELECT winner, games FROM totals")))
+        connection.close()
+
+        self.pending = queue.Queue()
+        # First commit error not yet reported by flush or close
+        self.error = None
+        self.writer = threading.Thread(target=self._write_loop, name="stats-writer", daemon=True)
+        self.writer.start()
+
+    def record_game(self, winner, winning_combo, moves=b"", size=3, win_length=3):
+        """Count a finished game and queue it for writing (winner None for a tie)"""
+        key = winner or TIE
+        self.totals[key] += 1
+        combo = ",".join(map(str, winning_combo or ()))
+        self.pending.put((time.time(), size, win_length, key, combo, bytes(moves)))
+
+    def wins(self, mark):
+        """Games won by mark"""
+        return self.totals[mark]
+
+    @property
+    def ties(self):
+        """Games that ended in a tie"""
+        return self.totals[TIE]
+
+    @property
+    def games(self):
+        """Games recorded, including those not yet written"""
+        return sum(self.totals.values())
+
+    def flush(self):
+        """Wait until every queued game is committed, raising any commit error"""
+        self.pending.join()
+        self._raise_error()
+
+    def close(self):
+        """Commit the remaining games and stop the writer, raising any commit error"""
+        self.pending.put(_STOP)
+        self.writer.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        """Raise the error of a batch that failed to commit, once"""
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write_loop(self):
+        """Commit queued games in batches (writer thread)"""
+        connection = _connect(self.path)
+        stopping = False
+        while not stopping:
+            batch = [self.pending.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is _STOP:
+                stopping = True
+            rows = [row for row in batch if row is not _STOP]
+            try:
+                if rows:
+                    self._commit(connection, rows)
+            except (sqlite3.Error, OSError) as error:
+                if self.error is None:
+                    self.error = error
+            finally:
+                for _ in batch:
+                    self.pending.task_done()
+        connection.close()
+
+    def _commit(self, connection, rows):
+        """Insert a batch of games and bump the totals in one transaction"""
+        counts = Counter(row[3] for row in rows)
+        with connection:
+            connection.executemany(
+                "INSERT INTO games (finished, size, win_length, winner, winning_combo, moves)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.executemany(
+                "INSERT INTO totals (winner, games) VALUES (?, ?)"
+                " ON CONFLICT (winner) DO UPDATE SET games = games + excluded.games",
+                counts.items(),
+            )
+
+
+def main(argv=None):
+    """Print the totals of a statistics database"""
+    parser = argparse.ArgumentParser(description="Show recorded game statistics")
+    parser.add_argument("path", nargs="?", default=DEFAULT_STATS_PATH)
+    args = parser.parse_args(argv)
+    with StatsStore(args.path) as store:
+        print(f"Games: {store.games}")
+        print(f"X wins: {store.wins('X')}  O wins: {store.wins('O')}  Ties: {store.ties}")
+
+
+if __name__ == "__main__":
+    main()
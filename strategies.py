@@ -0,0 +1,151 @@
+"""
+Tic-Tac-Toe Strategies
+Pluggable move-choosing players for headless games
+
+A strategy is any object with ``choose_move(game_logic)`` returning a free
+position for the current player. Strategies with an ``rng`` attribute are
+reseeded by the simulation and tournament runners for reproducible games.
+"""
+
+import importlib
+import os
+import random
+
+from ai import NegamaxAI
+from game_logic import _cell_line_masks
+from mcts import MCTSAI
+from rl_trainer import DEFAULT_TABLE_PATH, LearnedStrategy
+
+
+def empty_cells(board):
+    """Get the free positions of a board"""
+    return [pos for pos, value in enumerate(board) if value == ""]
+
+
+class RandomStrategy:
+    """Plays a uniformly random free cell"""
+    
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+    
+    def choose_move(self, game_logic):
+        """Choose a random free cell"""
+        return self.rng.choice(empty_cells(game_logic.get_board()))
+
+
+class HeuristicStrategy:
+    """Wins if it can, blocks if it must, otherwise prefers the center and corners"""
+    
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+    
+    def choose_move(self, game_logic):
+        """Choose a move by simple priorities"""
+        board = game_logic.get_board()
+        size = game_logic.size
+        cell_masks = _cell_line_masks(size, game_logic.win_length)
+        player = game_logic.get_current_player()
+        opponent = "O" if player == "X" else "X"
+        
+        masks = {"X": 0, "O": 0}
+        for pos, value in enumerate(board):
+            if value:
+                masks[value] |= 1 << pos
+        free = empty_cells(board)
+        
+        # Complete our own line first, then block the opponent's
+        for mark in (player, opponent):
+            for pos in free:
+                mask = masks[mark] | 1 << pos
+                for _, line_mask in cell_masks[pos]:
+                    if mask & line_mask == line_mask:
+                        return pos
+        
+        center = size // 2 * size + size // 2
+        if board[center] == "":
+            return center
+        corners = [
+            pos for pos in (0, size - 1, size * (size - 1), size * size - 1)
+            if board[pos] == ""
+        ]
+        return self.rng.choice(corners or free)
+
+
+def learned_strategy(rng=None, path=DEFAULT_TABLE_PATH):
+    """The learned player, from the value table at path"""
+    try:
+        return LearnedStrategy.load(path, rng)
+    except OSError as error:
+        raise ValueError(f"Cannot load value table {path!r}: {error}") from None
+
+
+# Seconds per minimax move; a full 3x3 search finishes well inside it
+MINIMAX_TIME_LIMIT = 0.5
+
+# Strategy factories by name; each takes an optional random generator
+STRATEGIES = {
+    "random": RandomStrategy,
+    "heuristic": HeuristicStrategy,
+    "minimax": lambda rng=None: NegamaxAI(time_limit=MINIMAX_TIME_LIMIT),
+    "learned": learned_strategy,
+    "mcts": lambda rng=None: MCTSAI(budget_ms=50, rng=rng),
+}
+
+# Strategies whose factory also takes an argument, given as "name:argument"
+ARGUMENT_STRATEGIES = {"learned"}
+
+# Command-line help for options that take a strategy spec
+STRATEGY_HELP = f"{', '.join(STRATEGIES)}, learned:TABLE_PATH or module:factory"
+
+
+def _strategy_factory(name):
+    """Resolve a spec to (factory, extra arguments) without calling the factory"""
+    prefix, separator, argument = name.partition(":")
+    if separator and prefix in ARGUMENT_STRATEGIES:
+        return STRATEGIES[prefix], (argument,)
+    if separator:
+        try:
+            factory = getattr(importlib.import_module(prefix), argument)
+        except (ImportError, AttributeError) as error:
+            raise ValueError(f"Cannot load strategy plugin {name!r}: {error}") from None
+        if not callable(factory):
+            raise ValueError(f"Strategy plugin {name!r} is not callable")
+        return factory, ()
+    try:
+        return STRATEGIES[name], ()
+    except KeyError:
+        raise ValueError(
+            f"Unknown strategy {name!r}; choose from {', '.join(STRATEGIES)}"
+        ) from None
+
+
+def create_strategy(name, rng=None):
+    """Create a strategy by name, "name:argument", or a "module:factory" plugin spec
+
+    Only the strategies in ARGUMENT_STRATEGIES take an argument, such as
+    "learned:tables/v2.bin" for a value table saved elsewhere. Any other
+    prefix names a module: a plugin factory is any callable in an
+    importable module that takes an optional random generator, like the
+    entries of STRATEGIES.
+    """
+    factory, arguments = _strategy_factory(name)
+    return factory(rng, *arguments)
+
+
+def strategy_spec(name):
+    """Argparse type that accepts any spec create_strategy can build
+
+    Only the spec is checked: that the name, plugin factory or value table
+    exists. The strategy itself is built where it plays.
+    """
+    # Imported here: only the command lines need it
+    import argparse
+    try:
+        factory, arguments = _strategy_factory(name)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from None
+    if factory is learned_strategy:
+        path = arguments[0] if arguments else DEFAULT_TABLE_PATH
+        if not os.path.isfile(path):
+            raise argparse.ArgumentTypeError(f"No value table at {path!r}")
+    return name
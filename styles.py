@@ -3,6 +3,10 @@ Tic-Tac-Toe Game Styling Configuration
 Contains all colors, fonts, and styling for the game interface
 """
 
+import tkinter.font as tkfont
+
+from animation import color_ramp
+
 class GameStyles:
     """Centralized styling configuration for the Tic-Tac-Toe game"""
     
@@ -21,15 +25,25 @@ class GameStyles:
         'text_muted': '#6b7280',      # Muted gray text
         
         # Player colors
-        'player_x': '#ff6b6b',        # Coral red for X
-        'player_o': '#4ecdc4',        # Teal for O
-        'win_highlight': '#ffd93d',   # Golden yellow for wins
+        'player_x': '#ff4757',        # Bright red for X
+        'player_o': '#2ed573',        # Bright green for O
+        'win_highlight': '#ffa502',   # Bright orange for wins
+        
+        # Winning squares, and the lighter shade they pulse to
+        'win_x': '#ff0000',
+        'win_x_pulse': '#ff6666',
+        'win_x_text': '#ffffff',
+        'win_o': '#00ff00',
+        'win_o_pulse': '#66ff66',
+        'win_o_text': '#000000',
         
         # Button colors
         'btn_primary': '#3182ce',     # Modern blue
         'btn_primary_hover': '#2c5aa0',
         'btn_danger': '#e53e3e',      # Modern red
         'btn_danger_hover': '#c53030',
+        'btn_success': '#00ff00',     # Play Again, bright to be very visible
+        'btn_success_text': '#000000',
     }
     
     # Font configurations
@@ -42,6 +56,9 @@ class GameStyles:
         'button_medium': ('Helvetica', 24, 'bold'),
         'button_small': ('Helvetica', 14, 'bold'),
         'score': ('Helvetica', 12),
+        # Board marks, scaled down on boards larger than 3x3
+        'cell': ('Helvetica', 24, 'bold'),
+        'cell_win': ('Helvetica', 44, 'bold'),
     }
     
     # Layout configurations
@@ -86,8 +103,17 @@ class GameStyles:
             }
     
     @classmethod
-    def get_win_style(cls):
+    def get_win_style(cls, player=None):
         """Get styling for winning combination"""
+        if player in ('X', 'O'):
+            key = 'win_' + player.lower()
+            return {
+                'bg': cls.COLORS[key],
+                'fg': cls.COLORS[key + '_text'],
+                'font': cls.FONTS['cell_win'],
+                'relief': 'flat',
+                'bd': 0
+            }
         return {
             'bg': cls.COLORS['win_highlight'],
             'fg': '#000000',
@@ -105,7 +131,7 @@ class GameStyles:
                 'font': cls.FONTS['status'],
                 'bg': cls.COLORS['bg_card']
             }
-        elif message_type == 'tie':
+        elif message_type in ('tie', 'info'):
             return {
                 'fg': cls.COLORS['text_secondary'],
                 'font': cls.FONTS['status'],
@@ -116,4 +142,122 @@ class GameStyles:
                 'fg': cls.COLORS['text_primary'],
                 'font': cls.FONTS['status'],
                 'bg': cls.COLORS['bg_card']
-            } 
\ No newline at end of file
+            } 
+
+
+class LightStyles(GameStyles):
+    """Light variant of the default theme"""
+    
+    COLORS = dict(
+        GameStyles.COLORS,
+        bg_primary='#f5f5f7',
+        bg_secondary='#e2e8f0',
+        bg_card='#ffffff',
+        bg_button='#cbd5e0',
+        text_primary='#1a202c',
+        text_secondary='#4a5568',
+        win_highlight='#dd6b20',
+    )
+
+
+THEMES = {'dark': GameStyles, 'light': LightStyles}
+
+
+def _font_options(spec):
+    """Turn a (family, size, *styles) tuple into tkfont.Font options"""
+    family, size, *styles = spec
+    return {
+        'family': family,
+        'size': size,
+        'weight': 'bold' if 'bold' in styles else 'normal',
+        'slant': 'italic' if 'italic' in styles else 'roman',
+    }
+
+
+class StyleCache:
+    """Fonts and option dicts built once from a GameStyles theme
+    
+    Every font is a named tkfont.Font shared by all widgets and canvas
+    items, so Tk resolves it once instead of parsing a font tuple on each
+    configure. ``widgets`` maps a widget role to its option dict, and the
+    ``cell_*``/``win_*`` dicts hold canvas item options per mark. Loading
+    another theme reconfigures fonts in place and reports which roles
+    changed.
+    """
+    
+    def __init__(self, root, size=3, styles=GameStyles, pulse_steps=16):
+        self.root = root
+        self.scale = 3 / size
+        self.pulse_steps = pulse_steps
+        self.fonts = {}
+        self.font_specs = {}
+        self.widgets = {}
+        self.load(styles)
+    
+    def load(self, styles):
+        """Build every font and option dict for a theme; return the changed roles"""
+        self.styles = styles
+        for name, spec in styles.FONTS.items():
+            if name in ('cell', 'cell_win'):
+                family, size, *rest = spec
+                spec = (family, max(8 if name == 'cell' else 10, round(size * self.scale)), *rest)
+            if name not in self.fonts:
+                self.fonts[name] = tkfont.Font(self.root, **_font_options(spec))
+            elif spec != self.font_specs[name]:
+                # Every widget using the named font follows without a configure
+                self.fonts[name].configure(**_font_options(spec))
+            self.font_specs[name] = spec
+        
+        colors = styles.COLORS
+        fonts = self.fonts
+        changed = set()
+        roles = {
+            'frame': {'bg': colors['bg_primary']},
+            'card': {'bg': colors['bg_card']},
+            'board': {'bg': colors['bg_secondary']},
+            'title': {'font': fonts['title'], 'fg': colors['text_primary'], 'bg': colors['bg_primary']},
+            'subtitle': {'font': fonts['subtitle'], 'fg': colors['text_secondary'],
+                         'bg': colors['bg_primary']},
+            'board_label': {'font': fonts['board_label'], 'fg': colors['text_secondary'],
+                            'bg': colors['bg_primary']},
+            'status': {'font': fonts['status'], 'bg': colors['bg_card']},
+            'score': {'font': fonts['score'], 'fg': colors['text_secondary'], 'bg': colors['bg_card']},
+            'play_again': {'font': fonts['button_medium'], 'bg': colors['btn_success'],
+                           'fg': colors['btn_success_text']},
+            'new_game': {'font': fonts['button_small'], 'bg': colors['btn_primary'],
+                         'fg': colors['text_primary']},
+            'quit': {'font': fonts['button_small'], 'bg': colors['btn_danger'],
+                     'fg': colors['text_primary']},
+        }
+        for role, options in roles.items():
+            if options != self.widgets.get(role):
+                self.widgets[role] = options
+                changed.add(role)
+        
+        tables = {
+            'status_colors': {
+                kind: styles.get_status_style(kind)['fg'] for kind in ('normal', 'win', 'tie', 'info')
+            },
+            'cell_rect': {},
+            'cell_text': {},
+            'win_rect': {},
+            'win_text': {},
+            'pulse': {},
+            'line': {'fill': colors['win_highlight']},
+        }
+        for mark in ('', 'X', 'O'):
+            style = styles.get_button_style(mark or None)
+            tables['cell_rect'][mark] = {'fill': style['bg']}
+            tables['cell_text'][mark] = {'fill': style['fg'], 'font': self.fonts['cell']}
+        for mark in ('X', 'O'):
+            style = styles.get_win_style(mark)
+            tables['win_rect'][mark] = {'fill': style['bg']}
+            tables['win_text'][mark] = {'fill': style['fg'], 'font': self.fonts['cell_win']}
+            tables['pulse'][mark] = color_ramp(
+                style['bg'], colors['win_' + mark.lower() + '_pulse'], self.pulse_steps
+            )
+        for name, table in tables.items():
+            if table != getattr(self, name, None):
+                changed.add(name)
+                setattr(self, name, table)
+        return changed
@@ -0,0 +1,86 @@
+"""
+Tic-Tac-Toe Board Symmetry
+Board encodings and the eight symmetries of a square board
+"""
+
+from array import array
+from functools import lru_cache
+from operator import itemgetter
+
+# Integer code for each cell value
+CELL_CODES = {"": 0, "X": 1, "O": 2}
+
+
+@lru_cache(maxsize=None)
+def symmetries(size):
+    """Get the eight symmetries of a size x size board as index permutations
+    
+    Applying permutation ``perm`` maps a board to ``[board[i] for i in perm]``.
+    """
+    def transform(rotations, mirrored):
+        perm = []
+        for row in range(size):
+            for col in range(size):
+                r, c = row, col
+                if mirrored:
+                    c = size - 1 - c
+                for _ in range(rotations):
+                    r, c = c, size - 1 - r
+                perm.append(r * size + c)
+        return tuple(perm)
+    
+    perms = []
+    for mirrored in (False, True):
+        for rotations in range(4):
+            perm = transform(rotations, mirrored)
+            if perm not in perms:
+                perms.append(perm)
+    return tuple(perms)
+
+
+@lru_cache(maxsize=None)
+def _getters(size):
+    """Item getters that apply each symmetry to a sequence of cells"""
+    if size == 1:
+        return (lambda cells: (cells[0],),)
+    return tuple(itemgetter(*perm) for perm in symmetries(size))
+
+
+def to_cells(board):
+    """Convert a board of "", "X", "O" strings to integer cell codes"""
+    return [CELL_CODES[value] for value in board]
+
+
+def encode(cells):
+    """Encode integer cells as a base-3 number (cell i has weight 3**i)"""
+    code = 0
+    for value in reversed(cells):
+        code = code * 3 + value
+    return code
+
+
+def canonical_encoding(cells, size):
+    """Smallest base-3 encoding of the board over all eight symmetries"""
+    return min(encode(getter(cells)) for getter in _getters(size))
+
+
+def canonical_bytes(cells, size):
+    """Smallest byte string of the board over all eight symmetries"""
+    return min(bytes(getter(cells)) for getter in _getters(size))
+
+
+@lru_cache(maxsize=None)
+def canonical_table(size=3):
+    """Array mapping every base-3 board encoding to its canonical encoding
+
+    Only practical for small boards: the table has 3**(size*size) entries.
+    """
+    cells_count = size * size
+    table = array("I", bytes(4 * 3 ** cells_count))
+    cells = [0] * cells_count
+    for code in range(3 ** cells_count):
+        value = code
+        for pos in range(cells_count):
+            value, cells[pos] = divmod(value, 3)
+        table[code] = canonical_encoding(cells, size)
+    return table
@@ -0,0 +1,9 @@
+"""
+Tic-Tac-Toe Tests
+Puts the repository root on the import path for the test modules
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,107 @@
+"""
+Tic-Tac-Toe Backend Parity Tests
+Plays the same moves on every board backend and compares them with GameLogic
+"""
+
+import random
+
+import pytest
+
+from game_logic import BACKENDS, BitboardGameLogic, GameLogic
+
+BOARDS = [(3, None), (4, 3), (5, 4), (7, 4), (15, 5)]
+OTHER_BACKENDS = [logic_class for logic_class in BACKENDS.values() if logic_class is not GameLogic]
+
+
+def state(game):
+    """Everything the public API reports about a game"""
+    return (
+        list(game.get_board()), game.get_current_player(), game.is_game_over(),
+        game.get_winner(), game.get_winning_combo(), list(game.history), game.to_record(),
+    )
+
+
+def test_backends_are_registered():
+    assert BACKENDS == {"list": GameLogic, "bitboard": BitboardGameLogic}
+
+
+@pytest.mark.parametrize("logic_class", OTHER_BACKENDS)
+@pytest.mark.parametrize("size, win_length", BOARDS)
+def test_random_play_matches_game_logic(logic_class, size, win_length):
+    rng = random.Random(size)
+    reference = GameLogic(size, win_length)
+    other = logic_class(size, win_length)
+    for _ in range(100):
+        while not reference.is_game_over():
+            roll = rng.random()
+            if roll < 0.1:
+                result = reference.undo(), other.undo()
+            elif roll < 0.15:
+                result = reference.redo(), other.redo()
+            else:
+                # A few positions fall off the board on either side
+                position = rng.randrange(-2, size * size + 2)
+                result = reference.make_move(position), other.make_move(position)
+            assert result[0] == result[1]
+            assert state(reference) == state(other)
+        reference.reset_game()
+        other.reset_game()
+        assert state(reference) == state(other)
+
+
+@pytest.mark.parametrize("logic_class", BACKENDS.values())
+@pytest.mark.parametrize("position", [-10, -1, 9, 10, 100])
+def test_off_board_move_is_rejected_without_changes(logic_class, position):
+    game = logic_class()
+    game.make_move(4)
+    before = state(game)
+    assert game.make_move(position) is False
+    assert state(game) == before
+
+
+@pytest.mark.parametrize("logic_class", BACKENDS.values())
+def test_occupied_move_is_rejected_without_changes(logic_class):
+    game = logic_class()
+    game.make_move(4)
+    game.undo()
+    before = state(game)
+    game.make_move(4)
+    assert game.make_move(4) is False
+    assert game.redo() is None
+    game.undo()
+    assert state(game) == before
+
+
+@pytest.mark.parametrize("logic_class", BACKENDS.values())
+def test_moves_after_the_game_ends_are_rejected(logic_class):
+    game = logic_class()
+    for position in (0, 3, 1, 4, 2):
+        game.make_move(position)
+    assert game.get_winner() == "X"
+    assert game.get_winning_combo() == [0, 1, 2]
+    assert game.make_move(8) is False
+    assert game.history == [0, 3, 1, 4, 2]
+
+
+@pytest.mark.parametrize("logic_class", BACKENDS.values())
+def test_reset_clears_board_history_and_redo(logic_class):
+    game = logic_class(4, 3)
+    board = game.get_board()
+    for position in (0, 5, 1, 6, 2):
+        game.make_move(position)
+    game.undo()
+    game.reset_game()
+    assert state(game) == state(logic_class(4, 3))
+    # The view handed out before the reset follows the game
+    assert list(board) == [""] * 16
+    assert game.redo() is None
+    assert game.move_count == 0 and game.last_move is None
+
+
+@pytest.mark.parametrize("logic_class", BACKENDS.values())
+def test_tie_is_detected(logic_class):
+    game = logic_class()
+    for position in (0, 1, 2, 4, 3, 5, 7, 6, 8):
+        assert game.make_move(position)
+    assert game.is_game_over()
+    assert game.get_winner() is None
@@ -0,0 +1,42 @@
+"""
+Tic-Tac-Toe Batch Engine Tests
+Plays random games in a batch and one by one and compares the results
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from batch_engine import BatchGameLogic  # noqa: E402
+from game_logic import GameLogic  # noqa: E402
+
+
+@pytest.mark.parametrize("size, win_length", [(3, None), (4, 3), (5, 4), (7, 4)])
+def test_batch_matches_game_logic(size, win_length):
+    games = 500
+    rng = np.random.default_rng(size)
+    batch = BatchGameLogic(games, size, win_length)
+    singles = [GameLogic(size, win_length) for _ in range(games)]
+    while not batch.game_over.all():
+        moves = batch.random_moves(rng)
+        # Occasionally replay an occupied cell to exercise rejection
+        if rng.random() < 0.2:
+            moves = np.where(batch.last_move >= 0, batch.last_move, moves)
+        accepted = batch.make_moves(moves)
+        for game, move in enumerate(moves):
+            if move >= 0:
+                assert singles[game].make_move(int(move)) == accepted[game]
+    for game, single in enumerate(singles):
+        assert single.is_game_over()
+        assert batch.get_board(game) == list(single.get_board())
+        assert batch.get_winner(game) == single.get_winner()
+        assert batch.get_winning_combo(game) == single.get_winning_combo()
+
+
+def test_reset_game_starts_selected_games_over():
+    batch = BatchGameLogic(4)
+    batch.make_moves([0, 1, 2, -1])
+    batch.reset_game([0, 3])
+    assert batch.get_board(0) == [""] * 9
+    assert batch.get_board(1)[1] == "X"
+    assert batch.make_moves([0, -1, -1, 0]).tolist() == [True, False, False, True]
@@ -0,0 +1,79 @@
+"""
+Tic-Tac-Toe Board View Tests
+Checks that the live board views read exactly like a plain list board
+"""
+
+import random
+
+import pytest
+
+from game_logic import BACKENDS, BoardView, GamePool
+
+
+def play_and_compare(game, rng, early_view):
+    """Play random moves and undos, comparing the view with a list board each time"""
+    size = game.size
+    board = [""] * (size * size)
+    view = game.get_board() if early_view else None
+    while not game.is_game_over():
+        if board.count("") < len(board) and rng.random() < 0.15:
+            board[game.undo()] = ""
+        else:
+            position = rng.choice([pos for pos, value in enumerate(board) if not value])
+            board[position] = game.get_current_player()
+            game.make_move(position)
+        if view is None and rng.random() < 0.3:
+            view = game.get_board()
+        current = game.get_board()
+        if view is not None:
+            assert current is view
+        assert list(current) == board
+        assert current == board and current == tuple(board)
+        assert len(current) == len(board)
+        assert [current[pos] for pos in range(-len(board), len(board))] == board + board
+        assert current[1:-1:2] == board[1:-1:2]
+        assert current.count("X") == board.count("X")
+        assert ("" in current) == ("" in board)
+        assert current.copy() == board and current.copy() is not current.copy()
+    return board
+
+
+@pytest.mark.parametrize("early_view", [True, False])
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+@pytest.mark.parametrize("size, win_length", [(3, None), (6, 4), (17, 5)])
+def test_view_matches_a_list_board(backend, size, win_length, early_view):
+    rng = random.Random(size)
+    for _ in range(10):
+        play_and_compare(BACKENDS[backend](size, win_length), rng, early_view)
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_view_is_read_only_and_follows_resets(backend):
+    game = BACKENDS[backend]()
+    view = game.get_board()
+    game.make_move(4)
+    assert isinstance(view, BoardView)
+    with pytest.raises(TypeError):
+        view[0] = "X"
+    snapshot = list(view)
+    game.reset_game()
+    assert snapshot[4] == "X"
+    assert view == [""] * 9
+    assert repr(view) == f"{type(view).__name__}({[''] * 9!r})"
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_game_state_has_no_instance_dict(backend):
+    assert not hasattr(BACKENDS[backend](), "__dict__")
+
+
+def test_pool_reuses_released_games_reset():
+    pool = GamePool("bitboard", 4, 3)
+    game = pool.acquire()
+    for position in (0, 5, 1, 6, 2):
+        game.make_move(position)
+    pool.release(game)
+    again = pool.acquire()
+    assert again is game
+    assert list(again.get_board()) == [""] * 16 and again.history == []
+    assert pool.acquire() is not game
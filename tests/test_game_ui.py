@@ -0,0 +1,135 @@
+"""
+Tic-Tac-Toe UI Tests
+Drives GameUI on a hidden window; skipped where Tk cannot open a display
+"""
+
+import pytest
+
+from game_logic import GameLogic
+
+tk = pytest.importorskip("tkinter")
+
+from game_ui import GameUI  # noqa: E402
+
+
+class StubStats:
+    """Stats store that keeps recorded games in a list"""
+
+    def __init__(self):
+        self.games = []
+
+    def record_game(self, winner, winning_combo, moves=b"", size=3, win_length=3):
+        self.games.append((winner, list(winning_combo or ()), bytes(moves)))
+
+    def wins(self, mark):
+        return sum(winner == mark for winner, _, _ in self.games)
+
+
+class StubClient:
+    """Network client that hands out queued server events"""
+
+    def __init__(self, spectating=False):
+        self.spectating = spectating
+        self.room = "lobby"
+        self.mark = None
+        self.events = []
+        self.sent = []
+
+    def poll(self):
+        events, self.events = self.events, []
+        return events
+
+    def send(self, line):
+        self.sent.append(line)
+
+
+@pytest.fixture
+def window():
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        pytest.skip(f"no display: {error}")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def make_ui(window, network_client=None):
+    """A GameUI over a fresh 3x3 game, recording into a stub store"""
+    stats = StubStats()
+    game = GameLogic()
+    ui = GameUI(window, game, game.make_move, network_client=network_client, stats_store=stats)
+    window.update()
+    return ui, game, stats
+
+
+def test_finished_game_is_recorded_once(window):
+    ui, game, stats = make_ui(window)
+    for position in (0, 3, 1, 4, 2):
+        game.make_move(position)
+    for _ in range(3):
+        ui.update_display()
+    assert stats.games == [("X", [0, 1, 2], bytes([0, 3, 1, 4, 2]))]
+    assert ui.x_score == 1
+
+    ui.reset_board()
+    for position in (0, 3, 1, 4, 8, 5):
+        game.make_move(position)
+    ui.update_display()
+    ui.update_display()
+    assert [winner for winner, _, _ in stats.games] == ["X", "O"]
+
+
+def test_network_start_after_the_end_does_not_record_again(window):
+    client = StubClient()
+    ui, game, stats = make_ui(window, client)
+    client.events = [("JOINED", "lobby", "X"), ("START",)]
+    client.events += [("MOVED", mark, str(position))
+                      for mark, position in zip("XOXOX", (0, 3, 1, 4, 2))]
+    ui.poll_network()
+    client.events = [("START",)]
+    ui.poll_network()
+    assert len(stats.games) == 1 and ui.x_score == 1
+
+
+def test_resent_snapshot_is_not_recorded_again(window):
+    client = StubClient(spectating=True)
+    ui, game, stats = make_ui(window, client)
+    snapshot = ("SNAPSHOT", "1", "3", "3", "0,3,1,4,2")
+    client.events = [snapshot]
+    ui.poll_network()
+    client.events = [snapshot]
+    ui.poll_network()
+    assert len(stats.games) == 1 and ui.x_score == 1
+
+
+def record_after(window, monkeypatch):
+    """Collect the callbacks the UI schedules with window.after"""
+    scheduled = []
+    monkeypatch.setattr(window, "after", lambda ms, callback, *args: scheduled.append(callback))
+    return scheduled
+
+
+def test_snapshot_for_another_board_keeps_polling(window, monkeypatch):
+    client = StubClient(spectating=True)
+    ui, game, stats = make_ui(window, client)
+    scheduled = record_after(window, monkeypatch)
+    client.events = [("SNAPSHOT", "1", "5", "4", "0,1"), ("DELTA", "2", "7", "X")]
+    ui.poll_network()
+    assert scheduled == [ui.poll_network]
+    assert ui.rendered_status == ("Room plays 5x5, 4 in a row", "info")
+    assert game.history == []
+
+    client.events = [("SNAPSHOT", "3", "3", "3", "4"), ("DELTA", "4", "0", "O")]
+    ui.poll_network()
+    assert game.history == [4, 0]
+
+
+def test_server_errors_are_shown(window, monkeypatch):
+    client = StubClient()
+    ui, game, stats = make_ui(window, client)
+    scheduled = record_after(window, monkeypatch)
+    client.events = [("ERROR", "room", "is", "full")]
+    ui.poll_network()
+    assert ui.rendered_status == ("Server: room is full", "info")
+    assert scheduled == [ui.poll_network]
@@ -0,0 +1,52 @@
+"""
+Tic-Tac-Toe MCTS Tests
+Checks the time budget and early cancellation of serial and parallel searches
+"""
+
+import threading
+import time
+
+import pytest
+
+from game_logic import GameLogic
+from mcts import MCTSAI
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cancel_set_before_the_search_starts_is_not_lost(workers):
+    player = MCTSAI(budget_ms=5000, workers=workers)
+    cancel = threading.Event()
+    cancel.set()
+    start = time.perf_counter()
+    move = player.choose_move(GameLogic(7, 4), cancel)
+    player.close()
+    assert 0 <= move < 49
+    assert time.perf_counter() - start < 2
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_stop_ends_a_running_search_and_the_next_runs_in_full(workers):
+    player = MCTSAI(budget_ms=5000, workers=workers)
+    # Warm the worker pool up so the timer lands inside the search
+    player.budget_ms = 10
+    player.choose_move(GameLogic(7, 4))
+    player.budget_ms = 5000
+    timer = threading.Timer(0.2, player.stop)
+    timer.start()
+    start = time.perf_counter()
+    player.choose_move(GameLogic(7, 4))
+    assert time.perf_counter() - start < 2
+    timer.join()
+
+    player.budget_ms = 200
+    start = time.perf_counter()
+    player.choose_move(GameLogic(7, 4))
+    player.close()
+    assert time.perf_counter() - start >= 0.19
+
+
+def test_immediate_win_is_taken():
+    game = GameLogic()
+    for position in (0, 3, 1, 4):
+        game.make_move(position)
+    assert MCTSAI(budget_ms=200).choose_move(game) == 2
@@ -0,0 +1,96 @@
+"""
+Tic-Tac-Toe Move History Tests
+Checks undo/redo round trips, the move record format and game logs
+"""
+
+import random
+
+import pytest
+
+from game_log import GameLogWriter, replay_log
+from game_logic import BACKENDS, decode_moves, encode_moves
+
+
+def snapshot(game):
+    """The observable state of a game"""
+    return (
+        list(game.get_board()), game.get_current_player(), game.is_game_over(),
+        game.get_winner(), game.get_winning_combo(), list(game.history),
+    )
+
+
+def random_game(game, rng):
+    """Play random moves until the game ends, recording each state on the way"""
+    states = [snapshot(game)]
+    while not game.is_game_over():
+        free = [pos for pos, value in enumerate(game.get_board()) if not value]
+        game.make_move(rng.choice(free))
+        states.append(snapshot(game))
+    return states
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+@pytest.mark.parametrize("size, win_length", [(3, None), (5, 4), (17, 5)])
+def test_undo_and_redo_retrace_every_state(backend, size, win_length):
+    rng = random.Random(size)
+    for _ in range(20):
+        game = BACKENDS[backend](size, win_length)
+        states = random_game(game, rng)
+        for expected in reversed(states[:-1]):
+            assert game.undo() is not None
+            assert snapshot(game) == expected
+        assert game.undo() is None
+        for expected in states[1:]:
+            assert game.redo() is not None
+            assert snapshot(game) == expected
+        assert game.redo() is None
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_new_move_discards_the_redo_history(backend):
+    game = BACKENDS[backend]()
+    for position in (4, 0, 8):
+        game.make_move(position)
+    game.undo()
+    game.undo()
+    assert game.make_move(2)
+    assert game.redo() is None
+    assert game.history == [4, 2]
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+@pytest.mark.parametrize("size", [3, 16, 17])
+def test_record_round_trip(backend, size):
+    rng = random.Random(size)
+    game = BACKENDS[backend](size, min(size, 5))
+    random_game(game, rng)
+    record = game.to_record()
+    assert record == encode_moves(game.history, size)
+    assert decode_moves(record, size) == game.history
+    # One byte per move up to 256 cells, two above
+    assert len(record) == len(game.history) * (1 if size * size <= 256 else 2)
+
+    replayed = BACKENDS[backend](size, min(size, 5))
+    replayed.replay(record)
+    assert snapshot(replayed) == snapshot(game)
+
+
+def test_replay_rejects_an_illegal_record():
+    game = BACKENDS["list"]()
+    with pytest.raises(ValueError):
+        game.replay(bytes([4, 4]))
+
+
+@pytest.mark.parametrize("size, win_length", [(3, None), (17, 5)])
+def test_game_log_round_trip(tmp_path, size, win_length):
+    rng = random.Random(0)
+    path = tmp_path / "games.log"
+    played = []
+    with GameLogWriter(path, size, win_length) as writer:
+        for _ in range(25):
+            game = BACKENDS["list"](size, win_length)
+            random_game(game, rng)
+            writer.write(game)
+            played.append(snapshot(game))
+    for backend in BACKENDS:
+        assert [snapshot(game) for game in replay_log(path, backend)] == played
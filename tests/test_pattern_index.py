@@ -0,0 +1,72 @@
+"""
+Tic-Tac-Toe Pattern Index Tests
+Checks the incremental score and threats against a full recount of the board
+"""
+
+import random
+
+import pytest
+
+from game_logic import GameLogic
+from pattern_index import PatternIndex
+
+BOARDS = [(3, None), (3, 1), (4, 2), (5, 4), (7, 4), (9, 5), (15, 5)]
+
+
+def scanned_winning_moves(index, cells, player):
+    """Empty cells that complete a window for player, found by recounting"""
+    moves = set()
+    for combo in index.windows:
+        empty = [pos for pos in combo if not cells[pos]]
+        if len(empty) == 1 and all(cells[pos] in (0, player) for pos in combo):
+            moves.add(empty[0])
+    return moves
+
+
+def check(index):
+    """Compare everything the index keeps incrementally with a recount"""
+    cells = index.cells
+    assert index.score == index.full_scan(cells)
+    assert index.evaluate(1) == -index.evaluate(2) == index.score
+    for player in (1, 2):
+        expected = scanned_winning_moves(index, cells, player)
+        assert index.winning_moves(player) == expected
+        assert index.blocking_moves(3 - player) == expected
+
+
+@pytest.mark.parametrize("size, win_length", BOARDS)
+def test_index_matches_full_scan_through_moves_and_undos(size, win_length):
+    rng = random.Random(size * 10 + (win_length or 0))
+    index = PatternIndex(size, win_length)
+    check(index)
+    player = 1
+    for _ in range(300):
+        empty = [pos for pos, value in enumerate(index.cells) if not value]
+        if index.history and (not empty or rng.random() < 0.3):
+            position = index.history[-1]
+            assert index.undo() == position
+            assert not index.cells[position]
+            player = 3 - player
+        else:
+            index.play(rng.choice(empty), player)
+            player = 3 - player
+        check(index)
+
+
+@pytest.mark.parametrize("size, win_length", BOARDS)
+def test_index_built_from_a_game_matches_a_played_one(size, win_length):
+    rng = random.Random(size)
+    game = GameLogic(size, win_length)
+    played = PatternIndex(size, win_length)
+    for _ in range(size * size // 2):
+        if game.is_game_over():
+            break
+        player = 1 if game.get_current_player() == "X" else 2
+        position = rng.choice([pos for pos, value in enumerate(game.get_board()) if not value])
+        game.make_move(position)
+        played.play(position, player)
+    loaded = PatternIndex.from_game(game)
+    assert loaded.cells == played.cells
+    assert loaded.score == played.score
+    for player in (1, 2):
+        assert loaded.winning_moves(player) == played.winning_moves(player)
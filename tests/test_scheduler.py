@@ -0,0 +1,96 @@
+"""
+Tic-Tac-Toe Move Scheduler Tests
+Runs opponents through MoveScheduler with a stand-in for the Tk window
+"""
+
+import threading
+import time
+
+from ai import NegamaxAI
+from game_logic import GameLogic
+from scheduler import MoveScheduler
+
+
+class FakeWindow:
+    """Just enough of a Tk window to run the scheduler's polling"""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.callbacks[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+
+    def run_until(self, condition, timeout=10):
+        deadline = time.perf_counter() + timeout
+        while not condition() and time.perf_counter() < deadline:
+            time.sleep(0.005)
+            callbacks, self.callbacks = self.callbacks, {}
+            for callback in callbacks.values():
+                callback()
+        return condition()
+
+
+class BlockingOpponent:
+    """Opponent that searches until cancelled, recording the cancel it was given"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.cancels = []
+
+    def choose_move(self, game_logic, cancel=None):
+        self.cancels.append(cancel)
+        self.started.set()
+        cancel.wait(5)
+        return game_logic.get_board().index("")
+
+    def stop(self):
+        raise AssertionError("the scheduler should set the request's cancel event")
+
+
+def test_move_is_delivered_on_the_window_thread():
+    window = FakeWindow()
+    results = []
+    scheduler = MoveScheduler(window, NegamaxAI(), results.append)
+    game = GameLogic()
+    for position in (0, 3, 1):
+        game.make_move(position)
+    scheduler.request_move(game)
+    assert window.run_until(lambda: results)
+    assert results == [2]
+    scheduler.close()
+
+
+def test_each_request_gets_its_own_cancel_event():
+    window = FakeWindow()
+    results = []
+    opponent = BlockingOpponent()
+    scheduler = MoveScheduler(window, opponent, results.append)
+    scheduler.request_move(GameLogic())
+    assert opponent.started.wait(5)
+    # A new request cancels the running search without touching the next one
+    scheduler.request_move(GameLogic())
+    first = opponent.cancels[0]
+    assert first.is_set()
+    assert window.run_until(lambda: len(opponent.cancels) == 2)
+    second = opponent.cancels[1]
+    assert second is not first and not second.is_set()
+    scheduler.cancel()
+    assert second.is_set()
+    scheduler.close()
+    assert results == []
+
+
+def test_cancel_before_pickup_reaches_negamax():
+    opponent = NegamaxAI()
+    cancel = threading.Event()
+    cancel.set()
+    start = time.perf_counter()
+    move = opponent.choose_move(GameLogic(4), cancel)
+    assert 0 <= move < 16
+    assert time.perf_counter() - start < 1
@@ -0,0 +1,57 @@
+"""
+Tic-Tac-Toe Statistics Store Tests
+Checks that games reach the database and that commit errors are reported
+"""
+
+import sqlite3
+
+import pytest
+
+from stats_store import StatsStore
+
+
+def test_games_and_totals_survive_reopening(tmp_path):
+    path = tmp_path / "stats.db"
+    with StatsStore(path, flush_interval=0.01) as store:
+        store.record_game("X", [0, 1, 2], b"\x00\x03\x01\x04\x02")
+        store.record_game(None, None)
+        store.flush()
+    with StatsStore(path) as store:
+        assert (store.wins("X"), store.wins("O"), store.ties, store.games) == (1, 0, 1, 2)
+    connection = sqlite3.connect(path)
+    rows = connection.execute("SELECT winner, winning_combo, moves FROM games ORDER BY id").fetchall()
+    connection.close()
+    assert rows == [("X", "0,1,2", b"\x00\x03\x01\x04\x02"), ("", "", b"")]
+
+
+def test_commit_error_is_raised_from_flush_and_writer_keeps_going(tmp_path):
+    store = StatsStore(tmp_path / "stats.db", flush_interval=0.01)
+    commit = store._commit
+
+    def locked(connection, rows):
+        store._commit = commit
+        raise sqlite3.OperationalError("database is locked")
+
+    store._commit = locked
+    store.record_game("X", [0, 1, 2])
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        store.flush()
+    # The error is reported once, and later games are still written
+    store.record_game("O", [2, 4, 6])
+    store.flush()
+    store.close()
+    with StatsStore(tmp_path / "stats.db") as reopened:
+        assert (reopened.wins("X"), reopened.wins("O")) == (0, 1)
+
+
+def test_commit_error_is_raised_from_close(tmp_path):
+    store = StatsStore(tmp_path / "stats.db", flush_interval=0.01)
+
+    def full(connection, rows):
+        raise sqlite3.OperationalError("database or disk is full")
+
+    store._commit = full
+    store.record_game("X", [0, 1, 2])
+    with pytest.raises(sqlite3.OperationalError, match="full"):
+        store.close()
+    assert not store.writer.is_alive()
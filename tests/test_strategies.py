@@ -0,0 +1,60 @@
+"""
+Tic-Tac-Toe Strategy Tests
+Checks the named strategies and the strategy specs the command lines accept
+"""
+
+import argparse
+import time
+
+import pytest
+
+from game_logic import GameLogic
+from main import parse_args
+from strategies import MINIMAX_TIME_LIMIT, create_strategy, strategy_spec
+
+
+def test_minimax_is_perfect_on_3x3():
+    game = GameLogic()
+    for position in (0, 3, 1):
+        game.make_move(position)
+    assert create_strategy("minimax").choose_move(game) == 2
+
+
+def test_minimax_is_bounded_on_larger_boards():
+    start = time.perf_counter()
+    move = create_strategy("minimax").choose_move(GameLogic(4))
+    assert 0 <= move < 16
+    assert time.perf_counter() - start < MINIMAX_TIME_LIMIT + 1
+
+
+def test_spec_checks_the_table_exists_without_reading_it(tmp_path):
+    table = tmp_path / "table.bin"
+    table.write_bytes(b"not a value table")
+    spec = f"learned:{table}"
+    assert strategy_spec(spec) == spec
+    with pytest.raises(ValueError):
+        create_strategy(spec)
+    with pytest.raises(argparse.ArgumentTypeError):
+        strategy_spec(f"learned:{tmp_path / 'missing.bin'}")
+
+
+@pytest.mark.parametrize("spec", ["nobody", "no_such_module:factory",
+                                  "strategies:no_such_factory", "strategies:MINIMAX_TIME_LIMIT"])
+def test_spec_rejects_unknown_strategies(spec):
+    with pytest.raises(argparse.ArgumentTypeError):
+        strategy_spec(spec)
+
+
+def test_plugin_spec_is_accepted():
+    assert strategy_spec("strategies:RandomStrategy") == "strategies:RandomStrategy"
+
+
+@pytest.mark.parametrize("argv", [["--ai", "learned", "--size", "4"],
+                                  ["--ai", "learned", "--win-length", "2"]])
+def test_learned_opponent_is_rejected_off_3x3(argv):
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+
+def test_learned_opponent_is_accepted_on_3x3():
+    assert parse_args(["--ai", "learned"]).ai == "learned"
@@ -0,0 +1,463 @@
+"""
+Tic-Tac-Toe Tournament
+Round-robin and Swiss tournaments between strategies, rated with Elo
+
+Players are strategy names from strategies.py or "module:factory" plugin
+specs. A match is a fixed number of games with the colors swapped after
+every game. Matches run across a process pool, and each finished match is
+appended to a JSONL checkpoint. An interrupted tournament therefore
+resumes without replaying the matches it already finished.
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import zlib
+from collections import Counter, defaultdict, namedtuple
+from multiprocessing import Pool
+
+from game_logic import BACKENDS, create_game_logic
+from simulate import play_game
+from strategies import STRATEGY_HELP, create_strategy, strategy_spec
+
+PAIRINGS = ("round-robin", "swiss")
+
+
+class MatchResult(namedtuple("MatchResult", "match_id round a b a_wins b_wins draws")):
+    """Games won by each player of a match; a moved first in the even games"""
+    __slots__ = ()
+
+    @property
+    def games(self):
+        """Games played in the match"""
+        return self.a_wins + self.b_wins + self.draws
+
+    def points(self, player):
+        """Match points for a player: 1 for more game wins, 0.5 for a tie"""
+        mine, theirs = self.a_wins, self.b_wins
+        if player == self.b:
+            mine, theirs = theirs, mine
+        return 1.0 if mine > theirs else 0.5 if mine == theirs else 0.0
+
+
+Standing = namedtuple("Standing", "player points elo low high wins draws losses")
+
+
+# Per-process boards and strategies, reused across matches
+_worker_state = {}
+
+
+def match_seed(seed, match_id):
+    """Seed of a match, independent of the order matches finish in"""
+    return zlib.crc32(f"{seed}/{match_id}".encode())
+
+
+def play_match(task):
+    """Play one match and return its MatchResult"""
+    match_id, round_number, a, b, games, seed, config = task
+    game_logic = _worker_state.get(config)
+    if game_logic is None:
+        size, win_length, backend = config
+        game_logic = _worker_state[config] = create_game_logic(backend, size, win_length)
+
+    strategies = []
+    for offset, spec in enumerate((a, b)):
+        strategy = _worker_state.get(spec)
+        if strategy is None:
+            strategy = _worker_state[spec] = create_strategy(spec)
+        if hasattr(strategy, "rng"):
+            strategy.rng.seed(seed * 2 + offset)
+        strategies.append(strategy)
+
+    a_wins = b_wins = draws = 0
+    for game in range(games):
+        a_is_x = game % 2 == 0
+        x_strategy, o_strategy = strategies if a_is_x else strategies[::-1]
+        winner = play_game(game_logic, x_strategy, o_strategy)
+        if winner is None:
+            draws += 1
+        elif (winner == "X") == a_is_x:
+            a_wins += 1
+        else:
+            b_wins += 1
+    return MatchResult(match_id, round_number, a, b, a_wins, b_wins, draws)
+
+
+def round_robin_pairings(players, round_number):
+    """Pair every player with every other once
+
+    Who moves first in a match alternates along the player list, and
+    flips from one round to the next.
+    """
+    pairs = []
+    for i, a in enumerate(players):
+        for j in range(i + 1, len(players)):
+            b = players[j]
+            pairs.append((a, b) if (i + j + round_number) % 2 else (b, a))
+    return pairs
+
+
+def swiss_pairings(players, results, round_number):
+    """Pair players on equal or nearest match points who have not met
+
+    results are the matches of the earlier rounds. With an odd number of
+    players the lowest-ranked player without a bye sits the round out and
+    scores a match win. In each pair the player who has moved first in
+    fewer matches moves first.
+    """
+    points = dict.fromkeys(players, 0.0)
+    first_moves = Counter()
+    met = set()
+    played = defaultdict(set)
+    for result in results:
+        for player in (result.a, result.b):
+            points[player] += result.points(player)
+            played[result.round].add(player)
+        first_moves[result.a] += 1
+        met.add(frozenset((result.a, result.b)))
+    had_bye = set()
+    for earlier in range(1, round_number):
+        for player in players:
+            if player not in played[earlier]:
+                points[player] += 1.0
+                had_bye.add(player)
+
+    # Seeding order breaks ties in points
+    ranked = sorted(players, key=lambda player: -points[player])
+    bye = None
+    if len(ranked) % 2:
+        bye = next(
+            (player for player in reversed(ranked) if player not in had_bye), ranked[-1]
+        )
+        ranked.remove(bye)
+
+    pairs = []
+    while ranked:
+        a = ranked.pop(0)
+        b = next((player for player in ranked if frozenset((a, player)) not in met), ranked[0])
+        ranked.remove(b)
+        pairs.append((a, b) if first_moves[a] <= first_moves[b] else (b, a))
+    return pairs, bye
+
+
+def _fit_strengths(players, pairings):
+    """Bradley-Terry strengths, in player order, for {(a, b): (games, a's score)}
+
+    Maximum-likelihood strengths with draws as half a win, by
+    minorization-maximization. Each player also holds one virtual draw
+    against a fixed player of strength 1, which keeps perfect scores finite.
+    """
+    index = {player: i for i, player in enumerate(players)}
+    opponents = [[] for _ in players]
+    scores = [0.5] * len(players)
+    for (a, b), (games, score) in pairings.items():
+        i, j = index[a], index[b]
+        opponents[i].append((j, games))
+        opponents[j].append((i, games))
+        scores[i] += score
+        scores[j] += games - score
+
+    strengths = [1.0] * len(players)
+    for _ in range(1000):
+        largest_change = 0.0
+        for i, strength in enumerate(strengths):
+            denominator = 1.0 / (strength + 1.0)
+            for j, games in opponents[i]:
+                denominator += games / (strength + strengths[j])
+            updated = scores[i] / denominator
+            largest_change = max(largest_change, abs(math.log(updated / strength)))
+            strengths[i] = updated
+        if largest_change < 1e-9:
+            break
+    return strengths
+
+
+def _solve(matrix, vector):
+    """Solve matrix @ x = vector by Gaussian elimination with partial pivoting"""
+    size = len(vector)
+    rows = [list(row) + [value] for row, value in zip(matrix, vector)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        for row in range(column + 1, size):
+            factor = rows[row][column] / rows[column][column]
+            for k in range(column, size + 1):
+                rows[row][k] -= factor * rows[column][k]
+    solution = [0.0] * size
+    for row in reversed(range(size)):
+        known = sum(rows[row][k] * solution[k] for k in range(row + 1, size))
+        solution[row] = (rows[row][size] - known) / rows[row][row]
+    return solution
+
+
+def elo_ratings(players, results):
+    """Elo rating and 95% interval per player as {player: (elo, low, high)}
+
+    Ratings are the Bradley-Terry fit centred on 1500. Intervals come from
+    the curvature of its log-likelihood, virtual draws included, so they
+    keep a width that shrinks with the number of games even when every
+    game of a pairing ends the same way.
+    """
+    outcomes = defaultdict(lambda: [0, 0, 0])
+    for result in results:
+        a, b = sorted((result.a, result.b))
+        wins, draws, losses = outcomes[a, b]
+        a_wins, b_wins = result.a_wins, result.b_wins
+        if a != result.a:
+            a_wins, b_wins = b_wins, a_wins
+        outcomes[a, b] = [wins + a_wins, draws + result.draws, losses + b_wins]
+
+    pairings = {
+        pair: (sum(counts), counts[0] + 0.5 * counts[1]) for pair, counts in outcomes.items()
+    }
+    strengths = _fit_strengths(players, pairings)
+    count = len(players)
+    index = {player: i for i, player in enumerate(players)}
+
+    # Fisher information of the log-strengths; the virtual draws against
+    # the fixed player make it invertible
+    information = [[0.0] * count for _ in players]
+    for i, strength in enumerate(strengths):
+        information[i][i] += strength / (strength + 1.0) ** 2
+    for (a, b), (games, _) in pairings.items():
+        i, j = index[a], index[b]
+        weight = games * strengths[i] * strengths[j] / (strengths[i] + strengths[j]) ** 2
+        information[i][i] += weight
+        information[j][j] += weight
+        information[i][j] -= weight
+        information[j][i] -= weight
+
+    scale = 400 / math.log(10)
+    logs = [math.log(strength) for strength in strengths]
+    mean = sum(logs) / count
+    intervals = {}
+    for i, player in enumerate(players):
+        # Variance of the rating relative to the mean, as the ratings are centred
+        contrast = [(1.0 if k == i else 0.0) - 1 / count for k in range(count)]
+        variance = sum(c * x for c, x in zip(contrast, _solve(information, contrast)))
+        elo = 1500 + scale * (logs[i] - mean)
+        margin = 1.96 * scale * math.sqrt(max(variance, 0.0))
+        intervals[player] = (elo, elo - margin, elo + margin)
+    return intervals
+
+
+def check_intervals(games=20):
+    """Check that Elo intervals keep a width for drawn-out and one-sided pairings
+
+    Raises AssertionError when an interval collapses to a single rating.
+    """
+    cases = (
+        # Two equally strong engines that draw every game
+        (("a", "b"), [MatchResult("1", 1, "a", "b", 0, 0, games)]),
+        # Two equally strong engines that split the games
+        (("a", "b"), [MatchResult("1", 1, "a", "b", games // 2, games - games // 2, 0)]),
+        # A strict order where every game of a pairing ends the same way
+        (("a", "b", "c"), [
+            MatchResult("1", 1, "a", "b", games, 0, 0),
+            MatchResult("2", 1, "a", "c", games, 0, 0),
+            MatchResult("3", 1, "b", "c", games, 0, 0),
+        ]),
+    )
+    for players, results in cases:
+        for player, (elo, low, high) in elo_ratings(players, results).items():
+            assert low < elo < high, f"{player}: degenerate interval {low:.0f} to {high:.0f}"
+            assert high - low < 2000, f"{player}: unbounded interval {low:.0f} to {high:.0f}"
+
+
+class Tournament:
+    """A round-robin or Swiss tournament between strategies
+
+    Matches of a round are independent and run in parallel. Swiss rounds
+    are paired from the results of the rounds before them, so a resumed
+    tournament reproduces the same pairings from its checkpoint.
+    """
+
+    def __init__(self, players, pairing="round-robin", rounds=None, games=10,
+                 size=3, win_length=None, backend="list", seed=0, workers=None,
+                 checkpoint=None):
+        if pairing not in PAIRINGS:
+            raise ValueError(f"Unknown pairing {pairing!r}; choose from {', '.join(PAIRINGS)}")
+        if len(players) < 2 or len(set(players)) != len(players):
+            raise ValueError("A tournament needs at least two distinct players")
+        self.players = list(players)
+        self.pairing = pairing
+        if rounds is None:
+            rounds = 1 if pairing == "round-robin" else max(1, math.ceil(math.log2(len(players))))
+        self.rounds = rounds
+        self.games = games
+        self.game_config = (size, win_length, backend)
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.checkpoint = checkpoint
+        self.results = []
+
+    @property
+    def config(self):
+        """Settings a checkpoint must match to be resumed"""
+        size, win_length, backend = self.game_config
+        return {
+            "players": self.players, "pairing": self.pairing, "rounds": self.rounds,
+            "games": self.games, "size": size, "win_length": win_length,
+            "backend": backend, "seed": self.seed,
+        }
+
+    def load_checkpoint(self):
+        """Read finished matches from the checkpoint, starting it if it is new"""
+        if self.checkpoint is None:
+            return {}
+        results = {}
+        if os.path.exists(self.checkpoint):
+            with open(self.checkpoint, "rb+") as file:
+                data = file.read()
+                # Drop a line cut short by an interrupted write
+                end = data.rfind(b"\n") + 1
+                if end < len(data):
+                    file.truncate(end)
+            lines = data[:end].decode().splitlines()
+            if lines:
+                if json.loads(lines[0]) != self.config:
+                    raise ValueError(
+                        f"Checkpoint {self.checkpoint} belongs to a different tournament"
+                    )
+                for line in lines[1:]:
+                    result = MatchResult(**json.loads(line))
+                    results[result.match_id] = result
+                return results
+        self._append(self.config)
+        return results
+
+    def _append(self, record):
+        with open(self.checkpoint, "a") as file:
+            file.write(json.dumps(record) + "\n")
+
+    def pairings(self, round_number, results):
+        """Pairs of a round, given the results of the earlier rounds"""
+        if self.pairing == "round-robin":
+            return round_robin_pairings(self.players, round_number)
+        pairs, _ = swiss_pairings(self.players, results, round_number)
+        return pairs
+
+    def run(self, on_result=None):
+        """Play every unfinished match and return all MatchResults
+
+        on_result is called with each match as it finishes.
+        """
+        finished = self.load_checkpoint()
+        if self.workers > 1:
+            pool_context = Pool(self.workers)
+        else:
+            pool_context = contextlib.nullcontext()
+        with pool_context as pool:
+            for round_number in range(1, self.rounds + 1):
+                earlier = [result for result in finished.values() if result.round < round_number]
+                tasks = []
+                for a, b in self.pairings(round_number, earlier):
+                    match_id = f"{round_number}/{a}/{b}"
+                    if match_id not in finished:
+                        seed = match_seed(self.seed, match_id)
+                        tasks.append((match_id, round_number, a, b, self.games, seed, self.game_config))
+
+                played = pool.imap_unordered(play_match, tasks) if pool else map(play_match, tasks)
+                for result in played:
+                    finished[result.match_id] = result
+                    if self.checkpoint is not None:
+                        self._append(result._asdict())
+                    if on_result is not None:
+                        on_result(result)
+        self.results = sorted(finished.values(), key=lambda result: (result.round, result.match_id))
+        return self.results
+
+    def standings(self):
+        """Standings sorted by match points, then Elo"""
+        points = Counter()
+        records = defaultdict(lambda: [0, 0, 0])
+        for result in self.results:
+            for player, wins, losses in (
+                (result.a, result.a_wins, result.b_wins),
+                (result.b, result.b_wins, result.a_wins),
+            ):
+                points[player] += result.points(player)
+                record = records[player]
+                record[0] += wins
+                record[1] += result.draws
+                record[2] += losses
+        if self.pairing == "swiss":
+            # Byes score a match win
+            for round_number in range(1, self.rounds + 1):
+                present = {
+                    player for result in self.results if result.round == round_number
+                    for player in (result.a, result.b)
+                }
+                for player in self.players:
+                    if present and player not in present:
+                        points[player] += 1.0
+
+        ratings = elo_ratings(self.players, self.results)
+        table = [
+            Standing(player, points[player], *ratings[player], *records[player])
+            for player in self.players
+        ]
+        return sorted(table, key=lambda standing: (-standing.points, -standing.elo))
+
+
+def format_standings(table):
+    """Format standings as a text table"""
+    width = max(len("player"), *(len(standing.player) for standing in table)) + 2
+    lines = [f"{'#':>3}  {'player':<{width}}{'points':>7}{'elo':>7}{'95% interval':>16}{'W-D-L':>14}"]
+    for rank, standing in enumerate(table, 1):
+        interval = f"{standing.low:.0f} to {standing.high:.0f}"
+        record = f"{standing.wins}-{standing.draws}-{standing.losses}"
+        lines.append(
+            f"{rank:>3}  {standing.player:<{width}}{standing.points:>7.1f}{standing.elo:>7.0f}"
+            f"{interval:>16}{record:>14}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run a tournament from the command line"""
+    parser = argparse.ArgumentParser(description="Play a tournament between strategies")
+    parser.add_argument("players", nargs="*", type=strategy_spec, help=STRATEGY_HELP)
+    parser.add_argument("--pairing", choices=PAIRINGS, default="round-robin")
+    parser.add_argument("--rounds", type=int, default=None,
+                        help="rounds to play (1 round-robin, or log2 of the players for Swiss)")
+    parser.add_argument("--games", type=int, default=10,
+                        help="games per match, alternating who moves first")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (defaults to the CPU count)")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="list")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", default=None,
+                        help="JSONL file of finished matches; rerun to resume")
+    parser.add_argument("--check", action="store_true",
+                        help="check that the Elo intervals keep their width, then exit")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        check_intervals(args.games)
+        print(f"Elo intervals keep their width after {args.games} games")
+        return
+    if len(args.players) < 2:
+        parser.error("at least two players are required")
+
+    tournament = Tournament(
+        args.players, pairing=args.pairing, rounds=args.rounds, games=args.games,
+        size=args.size, win_length=args.win_length, backend=args.backend,
+        seed=args.seed, workers=args.workers, checkpoint=args.checkpoint,
+    )
+
+    def report(result):
+        print(f"round {result.round}: {result.a} {result.a_wins}-{result.b_wins} "
+              f"{result.b} ({result.draws} draws)", flush=True)
+
+    tournament.run(on_result=report)
+    print()
+    print(format_standings(tournament.standings()))
+
+
+if __name__ == "__main__":
+    main()